@@ -9,11 +9,14 @@
 from .coroutines import *
 from .events import *
 from .exceptions import *
+from .files import *
 from .futures import *
 from .locks import *
+from .metrics import *
 from .protocols import *
 from .runners import *
 from .queues import *
+from .resolvers import *
 from .streams import *
 from .subprocess import *
 from .tasks import *
@@ -26,11 +29,14 @@
            coroutines.__all__ +
            events.__all__ +
            exceptions.__all__ +
+           files.__all__ +
            futures.__all__ +
            locks.__all__ +
+           metrics.__all__ +
            protocols.__all__ +
            runners.__all__ +
            queues.__all__ +
+           resolvers.__all__ +
            streams.__all__ +
            subprocess.__all__ +
            tasks.__all__ +
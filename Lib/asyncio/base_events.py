@@ -20,6 +20,7 @@
 import functools
 import heapq
 import itertools
+import math
 import os
 import socket
 import stat
@@ -40,8 +41,10 @@
 from . import coroutines
 from . import events
 from . import exceptions
+from . import files
 from . import futures
 from . import protocols
+from . import resolvers
 from . import sslproto
 from . import staggered
 from . import tasks
@@ -49,6 +52,7 @@
 from . import transports
 from . import trsock
 from .log import logger
+from .metrics import LoopMetrics
 
 
 __all__ = 'BaseEventLoop','Server',
@@ -69,6 +73,103 @@
 MAXIMUM_SELECT_TIMEOUT = 24 * 3600
 
 
+class _TimerWheel:
+    """Hashed timer wheel holding the TimerHandles of an event loop.
+
+    The timers are grouped in buckets of *resolution* seconds, and each
+    bucket is due at the end of its interval, so that a timer is never
+    called before its time, but can be called up to *resolution* seconds
+    late.  Adding, cancelling or moving a timer only takes a dict operation
+    unless its bucket is new, which is what makes the wheel faster than the
+    heap with many timers that are cancelled or rescheduled before they are
+    due, such as timeouts.
+    """
+
+    def __init__(self, resolution):
+        self.resolution = resolution
+        # Maps the tick of each bucket to the timers of the bucket, keyed
+        # by their id() since TimerHandles compare equal by value.
+        self._buckets = {}
+        # Heap of the ticks of the buckets.
+        self._ticks = []
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _tick(self, when):
+        return math.ceil(when / self.resolution)
+
+    def add(self, handle):
+        tick = self._tick(handle._when)
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            bucket = self._buckets[tick] = {}
+            heapq.heappush(self._ticks, tick)
+        bucket[id(handle)] = handle
+        self._count += 1
+
+    def _bucket_of(self, handle):
+        bucket = self._buckets.get(self._tick(handle._when))
+        if bucket is None or bucket.get(id(handle)) is not handle:
+            return None
+        return bucket
+
+    def discard(self, handle):
+        """Remove handle, return True if it was in the wheel."""
+        bucket = self._bucket_of(handle)
+        if bucket is None:
+            return False
+        # Empty buckets are removed once they are due, so that a bucket and
+        # its tick are only added once.  _run_once() pops the due buckets
+        # even when the wheel holds no timer.
+        del bucket[id(handle)]
+        self._count -= 1
+        return True
+
+    def move(self, handle, when):
+        """Move handle to when, return False if it is not in the wheel."""
+        bucket = self._bucket_of(handle)
+        if bucket is None:
+            return False
+        if self._tick(when) == self._tick(handle._when):
+            handle._when = when
+        else:
+            del bucket[id(handle)]
+            self._count -= 1
+            handle._when = when
+            self.add(handle)
+        return True
+
+    def deadline(self):
+        """Return the time at which the next timers are due."""
+        ticks = self._ticks
+        buckets = self._buckets
+        while not buckets[ticks[0]]:
+            del buckets[heapq.heappop(ticks)]
+        return ticks[0] * self.resolution
+
+    def pop_due(self, end_time):
+        """Remove the timers due before end_time and return them in order."""
+        ticks = self._ticks
+        buckets = self._buckets
+        handles = []
+        while ticks and ticks[0] * self.resolution < end_time:
+            bucket = buckets.pop(heapq.heappop(ticks))
+            handles.extend(sorted(bucket.values()))
+        self._count -= len(handles)
+        return handles
+
+    def pop_all(self):
+        """Remove all the timers and return them."""
+        handles = [handle for bucket in self._buckets.values()
+                   for handle in bucket.values()]
+        self._buckets.clear()
+        self._ticks.clear()
+        self._count = 0
+        return handles
+
+
 def _format_handle(handle):
     cb = handle._callback
     if isinstance(getattr(cb, '__self__', None), tasks.Task):
@@ -423,7 +524,13 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        # Holds the timers instead of _scheduled if a timer resolution is set.
+        self._timer_wheel = None
         self._default_executor = None
+        # Runs the file I/O of asyncio.files, created on first use.
+        self._file_executor = None
+        self._resolver = None
+        self._metrics = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
         # event loop is not running
@@ -514,7 +621,8 @@ def _make_ssl_transport(
         raise NotImplementedError
 
     def _make_datagram_transport(self, sock, protocol,
-                                 address=None, waiter=None, extra=None):
+                                 address=None, waiter=None, extra=None,
+                                 batch_size=None):
         """Create datagram transport."""
         raise NotImplementedError
 
@@ -597,15 +705,22 @@ async def shutdown_asyncgens(self):
     async def shutdown_default_executor(self, timeout=None):
         """Schedule the shutdown of the default executor.
 
+        The executor of the file operations is shut down along with it.
+
         The timeout parameter specifies the amount of time the executor will
         be given to finish joining. The default value is None, which means
         that the executor will be given an unlimited amount of time.
         """
         self._executor_shutdown_called = True
-        if self._default_executor is None:
+        executors = [executor
+                     for executor in (self._default_executor,
+                                      self._file_executor)
+                     if executor is not None]
+        if not executors:
             return
         future = self.create_future()
-        thread = threading.Thread(target=self._do_shutdown, args=(future,))
+        thread = threading.Thread(target=self._do_shutdown,
+                                  args=(future, executors))
         thread.start()
         try:
             async with timeouts.timeout(timeout):
@@ -614,13 +729,15 @@ async def shutdown_default_executor(self, timeout=None):
             warnings.warn("The executor did not finishing joining "
                           f"its threads within {timeout} seconds.",
                           RuntimeWarning, stacklevel=2)
-            self._default_executor.shutdown(wait=False)
+            for executor in executors:
+                executor.shutdown(wait=False)
         else:
             thread.join()
 
-    def _do_shutdown(self, future):
+    def _do_shutdown(self, future, executors):
         try:
-            self._default_executor.shutdown(wait=True)
+            for executor in executors:
+                executor.shutdown(wait=True)
             if not self.is_closed():
                 self.call_soon_threadsafe(futures._set_result_unless_cancelled,
                                           future, None)
@@ -745,11 +862,17 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            self._timer_wheel.pop_all()
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
             self._default_executor = None
             executor.shutdown(wait=False)
+        executor = self._file_executor
+        if executor is not None:
+            self._file_executor = None
+            executor.shutdown(wait=False)
 
     def is_closed(self):
         """Returns True if the event loop was closed."""
@@ -812,10 +935,42 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        if self._timer_wheel is None:
+            heapq.heappush(self._scheduled, timer)
+        else:
+            self._timer_wheel.add(timer)
         timer._scheduled = True
         return timer
 
+    def get_timer_resolution(self):
+        """Return the timer resolution, or None if timers are precise."""
+        if self._timer_wheel is None:
+            return None
+        return self._timer_wheel.resolution
+
+    def set_timer_resolution(self, resolution):
+        """Set the resolution of the timers, in seconds.
+
+        If resolution is None (the default), timers are called as soon as
+        they are due.  Otherwise they are grouped in a timer wheel and can
+        be called up to resolution seconds late, which makes scheduling,
+        cancelling and rescheduling them cheaper.
+        """
+        if resolution is not None and not resolution > 0:
+            raise ValueError('resolution must be a positive number or None')
+        old_wheel = self._timer_wheel
+        if resolution is None:
+            self._timer_wheel = None
+        else:
+            self._timer_wheel = _TimerWheel(resolution)
+        if old_wheel is not None:
+            # Move the scheduled timers to the new wheel or to the heap.
+            for timer in old_wheel.pop_all():
+                if self._timer_wheel is None:
+                    heapq.heappush(self._scheduled, timer)
+                else:
+                    self._timer_wheel.add(timer)
+
     def call_soon(self, callback, *args, context=None):
         """Arrange for a callback to be called as soon as possible.
 
@@ -896,6 +1051,15 @@ def run_in_executor(self, executor, func, *args):
         return futures.wrap_future(
             executor.submit(func, *args), loop=self)
 
+    def _get_file_executor(self):
+        self._check_closed()
+        if self._file_executor is None:
+            self._check_default_executor()
+            self._file_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=constants.FILE_IO_WORKERS,
+                thread_name_prefix='asyncio-file-io')
+        return self._file_executor
+
     def set_default_executor(self, executor):
         if not isinstance(executor, concurrent.futures.ThreadPoolExecutor):
             raise TypeError('executor must be ThreadPoolExecutor instance')
@@ -925,8 +1089,28 @@ def _getaddrinfo_debug(self, host, port, family, type, proto, flags):
             logger.debug(msg)
         return addrinfo
 
+    def get_resolver(self):
+        """Return the resolver used by getaddrinfo(), or None."""
+        return self._resolver
+
+    def set_resolver(self, resolver):
+        """Set the resolver used by getaddrinfo().
+
+        If resolver is None, host names are looked up with
+        socket.getaddrinfo() in the default executor.
+        """
+        if (resolver is not None and
+                not isinstance(resolver, resolvers.AbstractResolver)):
+            raise TypeError('resolver must be an AbstractResolver instance '
+                            'or None')
+        self._resolver = resolver
+
     async def getaddrinfo(self, host, port, *,
                           family=0, type=0, proto=0, flags=0):
+        if self._resolver is not None:
+            return await self._resolver.getaddrinfo(
+                host, port, family=family, type=type, proto=proto,
+                flags=flags)
         if self._debug:
             getaddr_func = self._getaddrinfo_debug
         else:
@@ -964,26 +1148,17 @@ async def _sock_sendfile_native(self, sock, file, offset, count):
     async def _sock_sendfile_fallback(self, sock, file, offset, count):
         if offset:
             file.seek(offset)
-        blocksize = (
-            min(count, constants.SENDFILE_FALLBACK_READBUFFER_SIZE)
-            if count else constants.SENDFILE_FALLBACK_READBUFFER_SIZE
-        )
-        buf = bytearray(blocksize)
+        # The file is read in the file I/O thread pool, one chunk ahead.
+        chunks = files._read_chunks(
+            file, count or None, constants.SENDFILE_FALLBACK_READBUFFER_SIZE)
         total_sent = 0
         try:
-            while True:
-                if count:
-                    blocksize = min(count - total_sent, blocksize)
-                    if blocksize <= 0:
-                        break
-                view = memoryview(buf)[:blocksize]
-                read = await self.run_in_executor(None, file.readinto, view)
-                if not read:
-                    break  # EOF
-                await self.sock_sendall(sock, view[:read])
-                total_sent += read
+            async for data in chunks:
+                await self.sock_sendall(sock, data)
+                total_sent += len(data)
             return total_sent
         finally:
+            await chunks.aclose()
             if total_sent > 0 and hasattr(file, 'seek'):
                 file.seek(offset + total_sent)
 
@@ -1273,24 +1448,22 @@ async def _sendfile_native(self, transp, file, offset, count):
     async def _sendfile_fallback(self, transp, file, offset, count):
         if offset:
             file.seek(offset)
-        blocksize = min(count, 16384) if count else 16384
-        buf = bytearray(blocksize)
+        # The file is read in the file I/O thread pool, one chunk ahead, so
+        # reading the next chunk overlaps with writing (and encrypting, for
+        # TLS transports) the current one.  Each chunk is a new object which
+        # the transport can keep a reference to.
+        chunks = files._read_chunks(
+            file, count or None, constants.SENDFILE_FALLBACK_READBUFFER_SIZE)
         total_sent = 0
         proto = _SendfileFallbackProtocol(transp)
         try:
-            while True:
-                if count:
-                    blocksize = min(count - total_sent, blocksize)
-                    if blocksize <= 0:
-                        return total_sent
-                view = memoryview(buf)[:blocksize]
-                read = await self.run_in_executor(None, file.readinto, view)
-                if not read:
-                    return total_sent  # EOF
+            async for data in chunks:
                 await proto.drain()
-                transp.write(view[:read])
-                total_sent += read
+                transp.write(data)
+                total_sent += len(data)
+            return total_sent
         finally:
+            await chunks.aclose()
             if total_sent > 0 and hasattr(file, 'seek'):
                 file.seek(offset + total_sent)
             await proto.restore()
@@ -1347,8 +1520,11 @@ async def create_datagram_endpoint(self, protocol_factory,
                                        local_addr=None, remote_addr=None, *,
                                        family=0, proto=0, flags=0,
                                        reuse_port=None,
-                                       allow_broadcast=None, sock=None):
+                                       allow_broadcast=None, sock=None,
+                                       batch_size=None):
         """Create datagram connection."""
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError('batch_size must be a positive integer')
         if sock is not None:
             if sock.type == socket.SOCK_STREAM:
                 raise ValueError(
@@ -1457,8 +1633,12 @@ async def create_datagram_endpoint(self, protocol_factory,
 
         protocol = protocol_factory()
         waiter = self.create_future()
-        transport = self._make_datagram_transport(
-            sock, protocol, r_addr, waiter)
+        if batch_size is None:
+            transport = self._make_datagram_transport(
+                sock, protocol, r_addr, waiter)
+        else:
+            transport = self._make_datagram_transport(
+                sock, protocol, r_addr, waiter, batch_size=batch_size)
         if self._debug:
             if local_addr:
                 logger.info("Datagram endpoint local_addr=%r remote_addr=%r "
@@ -1942,7 +2122,22 @@ def _add_callback_signalsafe(self, handle):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            if (self._timer_wheel is not None and
+                    self._timer_wheel.discard(handle)):
+                handle._scheduled = False
+            else:
+                self._timer_cancelled_count += 1
+
+    def _reschedule_timer(self, handle, when):
+        """Move a scheduled TimerHandle to when without replacing it.
+
+        Return False if the handle cannot be moved: only the timers of the
+        timer wheel can.
+        """
+        if (self._timer_wheel is None or handle._cancelled or
+                not handle._scheduled):
+            return False
+        return self._timer_wheel.move(handle, when)
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1952,6 +2147,10 @@ def _run_once(self):
         'call_later' callbacks.
         """
 
+        loop_metrics = self._metrics
+        if loop_metrics is not None:
+            iteration_start = time.perf_counter()
+
         sched_count = len(self._scheduled)
         if (sched_count > _MIN_SCHEDULED_TIMER_HANDLES and
             self._timer_cancelled_count / sched_count >
@@ -1985,8 +2184,17 @@ def _run_once(self):
                 timeout = MAXIMUM_SELECT_TIMEOUT
             elif timeout < 0:
                 timeout = 0
+        if self._timer_wheel and timeout != 0:
+            wheel_timeout = self._timer_wheel.deadline() - self.time()
+            if timeout is None or wheel_timeout < timeout:
+                timeout = min(max(wheel_timeout, 0), MAXIMUM_SELECT_TIMEOUT)
 
-        event_list = self._selector.select(timeout)
+        if loop_metrics is None:
+            event_list = self._selector.select(timeout)
+        else:
+            select_start = time.perf_counter()
+            event_list = self._selector.select(timeout)
+            select_time = time.perf_counter() - select_start
         self._process_events(event_list)
         # Needed to break cycles when an exception occurs.
         event_list = None
@@ -2000,6 +2208,11 @@ def _run_once(self):
             handle = heapq.heappop(self._scheduled)
             handle._scheduled = False
             self._ready.append(handle)
+        if self._timer_wheel is not None:
+            # Also drop the due buckets whose timers were all cancelled.
+            for handle in self._timer_wheel.pop_due(end_time):
+                handle._scheduled = False
+                self._ready.append(handle)
 
         # This is the only place where callbacks are actually *called*.
         # All other places just add them to ready.
@@ -2008,6 +2221,8 @@ def _run_once(self):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is thread-safe without using locks.
         ntodo = len(self._ready)
+        if loop_metrics is not None:
+            callbacks = []
         for i in range(ntodo):
             handle = self._ready.popleft()
             if handle._cancelled:
@@ -2021,12 +2236,26 @@ def _run_once(self):
                     if dt >= self.slow_callback_duration:
                         logger.warning('Executing %s took %.3f seconds',
                                        _format_handle(handle), dt)
+                    if loop_metrics is not None:
+                        callbacks.append((handle._callback, dt))
                 finally:
                     self._current_handle = None
+            elif loop_metrics is not None:
+                t0 = time.perf_counter()
+                handle._run()
+                callbacks.append((handle._callback, time.perf_counter() - t0))
             else:
                 handle._run()
         handle = None  # Needed to break cycles when an exception occurs.
 
+        if loop_metrics is not None:
+            scheduled = len(self._scheduled) - self._timer_cancelled_count
+            if self._timer_wheel is not None:
+                scheduled += len(self._timer_wheel)
+            loop_metrics._record_iteration(
+                time.perf_counter() - iteration_start, select_time, ntodo,
+                scheduled, callbacks)
+
     def _set_coroutine_origin_tracking(self, enabled):
         if bool(enabled) == bool(self._coroutine_origin_tracking_enabled):
             return
@@ -2042,6 +2271,16 @@ def _set_coroutine_origin_tracking(self, enabled):
 
         self._coroutine_origin_tracking_enabled = enabled
 
+    def get_metrics(self):
+        """Return the LoopMetrics updated by the event loop, or None."""
+        return self._metrics
+
+    def set_metrics(self, metrics):
+        """Set the LoopMetrics to update at each iteration, or None."""
+        if metrics is not None and not isinstance(metrics, LoopMetrics):
+            raise TypeError('metrics must be a LoopMetrics instance or None')
+        self._metrics = metrics
+
     def get_debug(self):
         return self._debug
 
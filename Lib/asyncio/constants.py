@@ -27,6 +27,11 @@
 # that don't support sendfile, or for TLS connections.
 SENDFILE_FALLBACK_READBUFFER_SIZE = 1024 * 256
 
+# Number of threads of the pool running the file I/O of asyncio.files, and
+# default number of bytes read in advance by AsyncFile.read().
+FILE_IO_WORKERS = 4
+FILE_READAHEAD_SIZE = 1024 * 256
+
 FLOW_CONTROL_HIGH_WATER_SSL_READ = 256  # KiB
 FLOW_CONTROL_HIGH_WATER_SSL_WRITE = 512  # KiB
 
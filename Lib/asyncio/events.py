@@ -286,6 +286,12 @@ def call_at(self, when, callback, *args, context=None):
     def time(self):
         raise NotImplementedError
 
+    def get_timer_resolution(self):
+        raise NotImplementedError
+
+    def set_timer_resolution(self, resolution):
+        raise NotImplementedError
+
     def create_future(self):
         raise NotImplementedError
 
@@ -307,6 +313,12 @@ def set_default_executor(self, executor):
 
     # Network I/O methods returning Futures.
 
+    def get_resolver(self):
+        raise NotImplementedError
+
+    def set_resolver(self, resolver):
+        raise NotImplementedError
+
     async def getaddrinfo(self, host, port, *,
                           family=0, type=0, proto=0, flags=0):
         raise NotImplementedError
@@ -469,7 +481,8 @@ async def create_datagram_endpoint(self, protocol_factory,
                                        local_addr=None, remote_addr=None, *,
                                        family=0, proto=0, flags=0,
                                        reuse_address=None, reuse_port=None,
-                                       allow_broadcast=None, sock=None):
+                                       allow_broadcast=None, sock=None,
+                                       batch_size=None):
         """A coroutine which creates a datagram endpoint.
 
         This method will try to establish the endpoint in the background.
@@ -497,6 +510,10 @@ async def create_datagram_endpoint(self, protocol_factory,
 
         sock can optionally be specified in order to use a preexisting
         socket object.
+
+        batch_size, if given, makes the transport read up to batch_size
+        datagrams each time the socket is ready, and pass them all to the
+        datagrams_received() method of the protocol.
         """
         raise NotImplementedError
 
@@ -619,6 +636,14 @@ def default_exception_handler(self, context):
     def call_exception_handler(self, context):
         raise NotImplementedError
 
+    # Metrics.
+
+    def get_metrics(self):
+        raise NotImplementedError
+
+    def set_metrics(self, metrics):
+        raise NotImplementedError
+
     # Debug flag management.
 
     def get_debug(self):
@@ -0,0 +1,449 @@
+"""Asynchronous file I/O running in a dedicated thread pool."""
+
+__all__ = ("AsyncFile", "open_file")
+
+import io
+import os
+import stat
+import threading
+
+from . import constants
+from . import events
+from . import tasks
+
+
+def _get_executor(loop):
+    # The event loops of asyncio run the file I/O in a dedicated thread
+    # pool, so that it neither waits behind nor starves the other jobs of
+    # their default executor.  Other loops use their default executor.
+    get_file_executor = getattr(loop, '_get_file_executor', None)
+    if get_file_executor is None:
+        return None
+    return get_file_executor()
+
+
+if hasattr(os, 'pread'):
+    _pread = os.pread
+    _pwrite = os.pwrite
+else:
+    # Emulate pread() and pwrite(), the file position of the descriptor is
+    # only used with the lock held.
+    _position_lock = threading.Lock()
+
+    def _pread(fd, size, offset):
+        with _position_lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            return os.read(fd, size)
+
+    def _pwrite(fd, data, offset):
+        with _position_lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            return os.write(fd, data)
+
+
+def _pread_full(fd, size, offset):
+    # Read size bytes, or less at EOF.
+    data = _pread(fd, size, offset)
+    if len(data) == size or not data:
+        return data
+    chunks = [data]
+    while size > len(data):
+        size -= len(data)
+        offset += len(data)
+        data = _pread(fd, size, offset)
+        if not data:
+            break
+        chunks.append(data)
+    return b''.join(chunks)
+
+
+def _pread_all(fd, offset):
+    chunks = []
+    while data := _pread(fd, constants.FILE_READAHEAD_SIZE, offset):
+        chunks.append(data)
+        offset += len(data)
+    return b''.join(chunks)
+
+
+def _pwrite_all(fd, data, offset):
+    with memoryview(data) as view, view.cast('B') as view:
+        total = len(view)
+        while view:
+            n = _pwrite(fd, view, offset)
+            view = view[n:]
+            offset += n
+    return total
+
+
+def _append_all(fd, view):
+    # Return the file position after the data, which was appended at the
+    # end of the file whatever the position of the descriptor.
+    with view:
+        while view:
+            view = view[os.write(fd, view):]
+    return os.lseek(fd, 0, os.SEEK_CUR)
+
+
+def _pread_many(fd, requests):
+    return [_pread_full(fd, size, offset) for size, offset in requests]
+
+
+def _pwrite_many(fd, items):
+    return sum(_pwrite_all(fd, data, offset) for data, offset in items)
+
+
+async def open_file(file, mode='rb', *, readahead=None, opener=None):
+    """Open file in binary mode and return an AsyncFile.
+
+    file and mode are interpreted like by open(), but only the binary
+    modes are supported.  readahead is the number of bytes read in
+    advance by sequential read() calls, it defaults to
+    FILE_READAHEAD_SIZE.  Use 0 to disable read-ahead.
+    """
+    if 'b' not in mode:
+        raise ValueError(f'open_file() only supports binary modes, '
+                         f'got {mode!r}')
+    if readahead is None:
+        readahead = constants.FILE_READAHEAD_SIZE
+    elif readahead < 0:
+        raise ValueError('readahead must be a non-negative integer')
+    loop = events.get_running_loop()
+    raw = await loop.run_in_executor(
+        _get_executor(loop), lambda: io.FileIO(file, mode, opener=opener))
+    try:
+        st = os.fstat(raw.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            raise OSError(f'{file!r} is not a regular file')
+        if 'a' in raw.mode:
+            pos = st.st_size
+        else:
+            pos = 0
+    except BaseException:
+        raw.close()
+        raise
+    return AsyncFile(raw, pos, readahead)
+
+
+class AsyncFile:
+    """A regular file whose I/O runs in a thread pool.
+
+    Use open_file() to create an AsyncFile.  The file position is kept
+    by the object: reads and writes use pread() and pwrite() at that
+    position, and seek() and tell() do not block.  While a sequential
+    read() is consumed, the next chunk of the file is read in advance.
+
+    read(), write() and close() must not be called concurrently with
+    each other, but pread(), pwrite() and their batched variants can be
+    called at any time.
+    """
+
+    def __init__(self, raw, pos, readahead):
+        self._raw = raw
+        self._fd = raw.fileno()
+        self._append = 'a' in raw.mode
+        self._pos = pos
+        self._readahead = readahead
+        # Data read from the file at self._pos, from the index
+        # self._buffer_pos of self._buffer.
+        self._buffer = b''
+        self._buffer_pos = 0
+        self._eof = False
+        # The future of the read of the data which follows the buffer.
+        self._ahead = None
+        self._ahead_offset = None
+        # Incremented each time the buffer is dropped, so that a read()
+        # does not buffer data which is no longer valid.
+        self._generation = 0
+        # The futures of the jobs in progress.
+        self._inflight = set()
+        self._busy = False
+        self._closed = False
+
+    def __repr__(self):
+        info = [self.__class__.__name__, f'name={self.name!r}',
+                f'mode={self.mode!r}']
+        if self._closed:
+            info.append('closed')
+        else:
+            info.append(f'pos={self._pos}')
+        return f'<{" ".join(info)}>'
+
+    @property
+    def name(self):
+        return self._raw.name
+
+    @property
+    def mode(self):
+        return self._raw.mode
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def fileno(self):
+        return self._fd
+
+    def readable(self):
+        return self._raw.readable()
+
+    def writable(self):
+        return self._raw.writable()
+
+    def seekable(self):
+        return True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _check_closed(self):
+        if self._closed:
+            raise ValueError('I/O operation on closed file')
+
+    def _check_busy(self, method):
+        if self._busy:
+            raise RuntimeError(f'{method}() called while another read() '
+                               f'or write() is in progress')
+
+    def _submit(self, func, *args):
+        loop = events.get_running_loop()
+        fut = loop.run_in_executor(_get_executor(loop), func, *args)
+        self._inflight.add(fut)
+        fut.add_done_callback(self._job_done)
+        return fut
+
+    def _job_done(self, fut):
+        self._inflight.discard(fut)
+        if not fut.cancelled():
+            # The result of a read in advance may never be used.
+            fut.exception()
+
+    async def _run(self, func, *args):
+        # Cancelling the caller must not cancel a job in progress, which
+        # close() waits for.
+        return await tasks.shield(self._submit(func, *args))
+
+    def _buffered(self):
+        return len(self._buffer) - self._buffer_pos
+
+    def _invalidate(self):
+        # Drop the data read in advance: the position changed or the file
+        # was written to.
+        self._buffer = b''
+        self._buffer_pos = 0
+        self._eof = False
+        self._ahead = self._ahead_offset = None
+        self._generation += 1
+
+    def _consume(self, size):
+        start = self._buffer_pos
+        data = self._buffer[start:start + size]
+        self._buffer_pos += len(data)
+        self._pos += len(data)
+        if self._buffer_pos == len(self._buffer):
+            self._buffer = b''
+            self._buffer_pos = 0
+        return data
+
+    async def _fill(self, size):
+        # Read at least size more bytes into the buffer, unless EOF is
+        # reached.
+        end = self._pos + self._buffered()
+        if self._ahead is not None and self._ahead_offset == end:
+            fut = self._ahead
+            self._ahead = self._ahead_offset = None
+            size = self._readahead
+        else:
+            size = max(size, self._readahead)
+            fut = self._submit(_pread_full, self._fd, size, end)
+        generation = self._generation
+        data = await tasks.shield(fut)
+        if generation != self._generation:
+            return
+        if len(data) < size:
+            self._eof = True
+        self._buffer = self._buffer[self._buffer_pos:] + data
+        self._buffer_pos = 0
+
+    def _start_readahead(self):
+        if (self._readahead and self._ahead is None and not self._eof
+                and self._buffered() < self._readahead // 2):
+            self._ahead_offset = self._pos + self._buffered()
+            self._ahead = self._submit(_pread_full, self._fd,
+                                       self._readahead, self._ahead_offset)
+
+    async def read(self, size=-1):
+        """Read up to size bytes, or until EOF if size is negative.
+
+        Return b'' at EOF.
+        """
+        self._check_closed()
+        self._check_busy('read')
+        self._busy = True
+        try:
+            if size is None or size < 0:
+                data = self._consume(self._buffered())
+                self._invalidate()
+                rest = await self._run(_pread_all, self._fd, self._pos)
+                self._pos += len(rest)
+                return data + rest
+            while self._buffered() < size and not self._eof:
+                await self._fill(size - self._buffered())
+            data = self._consume(size)
+            self._start_readahead()
+            return data
+        finally:
+            self._busy = False
+
+    async def write(self, data):
+        """Write all of data at the current position and return its size.
+
+        In append mode, the data is written at the end of the file.
+        """
+        self._check_closed()
+        self._check_busy('write')
+        self._busy = True
+        try:
+            self._invalidate()
+            if self._append:
+                view = memoryview(data).cast('B')
+                n = len(view)
+                self._pos = await self._run(_append_all, self._fd, view)
+                return n
+            n = await self._run(_pwrite_all, self._fd, data, self._pos)
+            self._pos += n
+            return n
+        finally:
+            self._busy = False
+
+    async def pread(self, size, offset):
+        """Read up to size bytes at offset, without changing the position."""
+        self._check_closed()
+        return await self._run(_pread_full, self._fd, size, offset)
+
+    async def pwrite(self, data, offset):
+        """Write all of data at offset, without changing the position."""
+        self._check_closed()
+        self._invalidate()
+        return await self._run(_pwrite_all, self._fd, data, offset)
+
+    async def pread_many(self, requests):
+        """Read each (size, offset) pair of requests like pread().
+
+        Return the list of the data read.  The reads are batched into a
+        single job of the thread pool.
+        """
+        self._check_closed()
+        return await self._run(_pread_many, self._fd, list(requests))
+
+    async def pwrite_many(self, items):
+        """Write each (data, offset) pair of items like pwrite().
+
+        Return the total number of bytes written.  The writes are batched
+        into a single job of the thread pool.
+        """
+        self._check_closed()
+        self._invalidate()
+        return await self._run(_pwrite_many, self._fd, list(items))
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Change the position and return it.
+
+        Unlike the other methods, seek() is not a coroutine.
+        """
+        self._check_closed()
+        self._check_busy('seek')
+        if whence == os.SEEK_SET:
+            pos = offset
+        elif whence == os.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == os.SEEK_END:
+            pos = os.fstat(self._fd).st_size + offset
+        else:
+            raise ValueError(f'invalid whence ({whence!r})')
+        if pos < 0:
+            raise OSError(f'negative seek position {pos}')
+        if self._pos <= pos <= self._pos + self._buffered():
+            # Keep the data read in advance.
+            self._consume(pos - self._pos)
+        else:
+            self._invalidate()
+            self._pos = pos
+        return pos
+
+    def tell(self):
+        """Return the position."""
+        self._check_closed()
+        return self._pos
+
+    async def close(self):
+        """Close the file once the jobs in progress are done."""
+        if self._closed:
+            return
+        self._closed = True
+        self._invalidate()
+        if self._inflight:
+            # Wait until no job uses the descriptor anymore.
+            await tasks.wait(self._inflight)
+        loop = events.get_running_loop()
+        await loop.run_in_executor(_get_executor(loop), self._raw.close)
+
+
+def _readinto_new(file, size):
+    buf = bytearray(size)
+    n = file.readinto(buf)
+    del buf[n:]
+    return buf
+
+
+async def _read_chunks(file, count, blocksize):
+    """Yield the content of file by chunks of up to blocksize bytes.
+
+    Read from the current position of file until EOF, or up to count
+    bytes.  The next chunk is read in the file I/O thread pool while the
+    current one is consumed.  Regular files are read with pread() at
+    their position, which the generator does not update.
+    """
+    loop = events.get_running_loop()
+    executor = _get_executor(loop)
+    try:
+        fd = file.fileno()
+        offset = file.tell()
+        regular = stat.S_ISREG(os.fstat(fd).st_mode)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        regular = False
+
+    def read(size):
+        nonlocal offset
+        if regular:
+            fut = loop.run_in_executor(executor, _pread_full, fd, size, offset)
+            offset += size
+        else:
+            fut = loop.run_in_executor(executor, _readinto_new, file, size)
+        return fut
+
+    remaining = count
+    fut = read(blocksize if count is None else min(blocksize, count))
+    try:
+        while True:
+            data = await fut
+            fut = None
+            if not data:
+                return
+            if remaining is not None:
+                remaining -= len(data)
+            if remaining is None or remaining > 0:
+                fut = read(blocksize if remaining is None
+                           else min(blocksize, remaining))
+            yield data
+            if fut is None:
+                return
+    finally:
+        if fut is not None:
+            # Do not leave a job using the file behind.
+            try:
+                await fut
+            except Exception:
+                pass
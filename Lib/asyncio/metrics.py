@@ -0,0 +1,164 @@
+"""Metrics of the iterations of an event loop and of its tasks."""
+
+__all__ = ("LoopMetrics", "task_stats")
+
+import bisect
+import functools
+import threading
+
+from .tasks import Task, all_tasks
+
+
+def _callback_name(callback):
+    while isinstance(callback, functools.partial):
+        callback = callback.func
+    owner = getattr(callback, '__self__', None)
+    if isinstance(owner, Task):
+        # Tag the steps of a task with the name of its coroutine.
+        name = getattr(owner.get_coro(), '__qualname__', None)
+        if name is not None:
+            return name
+    name = getattr(callback, '__qualname__', None)
+    if name is None:
+        name = type(callback).__qualname__
+    return name
+
+
+class LoopMetrics:
+    """Metrics collected by an event loop, see loop.set_metrics().
+
+    The event loop updates the metrics once per iteration, and snapshot()
+    can be called from any thread while the loop is running.
+    """
+
+    # Upper bounds, in seconds, of the buckets of the histograms of the
+    # callback durations.  The last bucket counts the longer callbacks.
+    histogram_bounds = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._iterations = 0
+        self._iteration_time = 0.0
+        self._max_iteration_time = 0.0
+        self._select_time = 0.0
+        self._ready = 0
+        self._max_ready = 0
+        self._scheduled = 0
+        # Maps the name of each callback to its call count, total duration
+        # and histogram of durations.
+        self._callbacks = {}
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} iterations={self._iterations}>'
+
+    def reset(self):
+        """Reset the metrics to zero."""
+        with self._lock:
+            self._reset()
+
+    def _record_iteration(self, iteration_time, select_time, ready,
+                          scheduled, callbacks):
+        # callbacks is a list of (callback, duration) pairs.
+        bounds = self.histogram_bounds
+        durations = [(_callback_name(callback), duration)
+                     for callback, duration in callbacks]
+        with self._lock:
+            self._iterations += 1
+            self._iteration_time += iteration_time
+            if iteration_time > self._max_iteration_time:
+                self._max_iteration_time = iteration_time
+            self._select_time += select_time
+            self._ready = ready
+            if ready > self._max_ready:
+                self._max_ready = ready
+            self._scheduled = scheduled
+            for name, duration in durations:
+                stats = self._callbacks.get(name)
+                if stats is None:
+                    stats = self._callbacks[name] = [
+                        0, 0.0, [0] * (len(bounds) + 1)]
+                stats[0] += 1
+                stats[1] += duration
+                stats[2][bisect.bisect_left(bounds, duration)] += 1
+
+    def snapshot(self):
+        """Return a dict of the current metrics.
+
+        The dict has the following keys:
+
+        - iterations: number of iterations of the event loop.
+        - iteration_time, max_iteration_time: total and longest duration
+          of an iteration, in seconds.
+        - select_time: total time spent waiting for I/O events, in seconds.
+        - ready, max_ready: number of callbacks run by the last iteration
+          and the largest such number.
+        - scheduled: number of timers scheduled after the last iteration.
+        - callbacks: dict mapping the qualified name of each callback (of
+          the coroutine for the steps of a task) to a dict with its call
+          count, its total_time and its histogram, a list of the number of
+          calls which took up to each of histogram_bounds seconds, plus the
+          longer calls.
+        """
+        with self._lock:
+            return {
+                'iterations': self._iterations,
+                'iteration_time': self._iteration_time,
+                'max_iteration_time': self._max_iteration_time,
+                'select_time': self._select_time,
+                'ready': self._ready,
+                'max_ready': self._max_ready,
+                'scheduled': self._scheduled,
+                'callbacks': {
+                    name: {'count': count, 'total_time': total_time,
+                           'histogram': list(histogram)}
+                    for name, (count, total_time, histogram)
+                    in self._callbacks.items()
+                },
+            }
+
+
+def _task_key(task, key):
+    if key == 'name':
+        return task.get_name()
+    coro = task.get_coro()
+    if coro is None:
+        # The coroutine of a done task is released.
+        return None
+    name = getattr(coro, '__qualname__', None)
+    if name is None:
+        name = type(coro).__qualname__
+    return name
+
+
+def task_stats(tasks=None, *, key='coro'):
+    """Aggregate the accounting of the steps of tasks.
+
+    tasks defaults to all_tasks().  The stats returned by Task.get_stats()
+    are summed by the qualified name of the coroutine of the tasks if key
+    is 'coro', or by the name of the tasks if key is 'name'.  Return a
+    dict mapping these names to a dict with the number of tasks, and the
+    total steps, cpu_time, run_time and wait_time.  Tasks which do not
+    account for their steps are ignored, see set_task_accounting().
+    """
+    if key not in ('coro', 'name'):
+        raise ValueError(f"key must be 'coro' or 'name', got {key!r}")
+    if tasks is None:
+        tasks = all_tasks()
+    result = {}
+    for task in tasks:
+        get_stats = getattr(task, 'get_stats', None)
+        stats = get_stats() if get_stats is not None else None
+        if stats is None:
+            continue
+        name = _task_key(task, key)
+        total = result.get(name)
+        if total is None:
+            total = result[name] = {'tasks': 0, 'steps': 0, 'cpu_time': 0.0,
+                                    'run_time': 0.0, 'wait_time': 0.0}
+        total['tasks'] += 1
+        for field, value in stats.items():
+            total[field] += value
+    return result
@@ -461,10 +461,13 @@ class _ProactorDatagramTransport(_ProactorBasePipeTransport,
                                  transports.DatagramTransport):
     max_size = 256 * 1024
     def __init__(self, loop, sock, protocol, address=None,
-                 waiter=None, extra=None):
+                 waiter=None, extra=None, batch_size=None):
         self._address = address
         self._empty_waiter = None
         self._buffer_size = 0
+        # The datagrams are received one at a time, each of them is passed
+        # to datagrams_received() as a batch of its own.
+        self._batch_size = batch_size
         # We don't need to call _protocol.connection_made() since our base
         # constructor does it for us.
         super().__init__(loop, sock, protocol, waiter=waiter, extra=extra)
@@ -583,7 +586,10 @@ def _loop_reading(self, fut=None):
                 self._read_fut.add_done_callback(self._loop_reading)
         finally:
             if data:
-                self._protocol.datagram_received(data, addr)
+                if self._batch_size is None:
+                    self._protocol.datagram_received(data, addr)
+                else:
+                    self._protocol.datagrams_received([(data, addr)])
 
 
 class _ProactorDuplexPipeTransport(_ProactorReadPipeTransport,
@@ -660,9 +666,11 @@ def _make_ssl_transport(
         return ssl_protocol._app_transport
 
     def _make_datagram_transport(self, sock, protocol,
-                                 address=None, waiter=None, extra=None):
+                                 address=None, waiter=None, extra=None,
+                                 batch_size=None):
         return _ProactorDatagramTransport(self, sock, protocol, address,
-                                          waiter, extra)
+                                          waiter, extra,
+                                          batch_size=batch_size)
 
     def _make_duplex_pipe_transport(self, sock, protocol, waiter=None,
                                     extra=None):
@@ -167,6 +167,16 @@ class DatagramProtocol(BaseProtocol):
     def datagram_received(self, data, addr):
         """Called when some datagram is received."""
 
+    def datagrams_received(self, datagrams):
+        """Called when several datagrams are received.
+
+        datagrams is a list of (data, addr) pairs.  Only called by the
+        transports created with a batch_size.  The default implementation
+        calls datagram_received() for each datagram.
+        """
+        for data, addr in datagrams:
+            self.datagram_received(data, addr)
+
     def error_received(self, exc):
         """Called when a send or receive operation raises an OSError.
 
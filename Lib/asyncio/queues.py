@@ -2,6 +2,7 @@
     'Queue',
     'PriorityQueue',
     'LifoQueue',
+    'ThreadSafeQueue',
     'QueueFull',
     'QueueEmpty',
     'QueueShutDown',
@@ -9,8 +10,10 @@
 
 import collections
 import heapq
+import queue
 from types import GenericAlias
 
+from . import events
 from . import locks
 from . import mixins
 
@@ -169,6 +172,58 @@ def put_nowait(self, item):
         self._finished.clear()
         self._wakeup_next(self._getters)
 
+    async def put_many(self, items):
+        """Put the items of an iterable into the queue, in order.
+
+        The items which fit in the queue are put at once.  If the queue is
+        full, wait until free slots are available for the remaining items.
+        If the call is cancelled, the items put until then stay in the
+        queue.
+
+        Raises QueueShutDown if the queue has been shut down.
+        """
+        items = list(items)
+        i = self._put_available(items)
+        while i < len(items):
+            # Wait for a free slot.
+            await self.put(items[i])
+            i += 1 + self._put_available(items, i + 1)
+
+    def put_many_nowait(self, items):
+        """Put the items of an iterable into the queue without blocking.
+
+        If there are not enough free slots for all the items, raise
+        QueueFull without putting any.
+
+        Raises QueueShutDown if the queue has been shut down.
+        """
+        items = list(items)
+        if self._is_shutdown:
+            raise QueueShutDown
+        if 0 < self._maxsize < self.qsize() + len(items):
+            raise QueueFull
+        self._put_available(items)
+
+    def _put_available(self, items, start=0):
+        # Put the items from start as long as the queue is not full, and
+        # return how many were put.
+        if self._is_shutdown:
+            raise QueueShutDown
+        n = len(items) - start
+        if self._maxsize > 0:
+            n = min(n, self._maxsize - self.qsize())
+        if n <= 0:
+            return 0
+        for item in items[start:start+n]:
+            self._put(item)
+        self._unfinished_tasks += n
+        self._finished.clear()
+        for _ in range(n):
+            if not self._getters:
+                break
+            self._wakeup_next(self._getters)
+        return n
+
     async def get(self):
         """Remove and return an item from the queue.
 
@@ -216,6 +271,47 @@ def get_nowait(self):
         self._wakeup_next(self._putters)
         return item
 
+    async def get_many(self, max_items):
+        """Remove and return a list of up to max_items items from the queue.
+
+        If queue is empty, wait until an item is available, then remove all
+        the available items up to max_items at once.
+
+        Raises QueueShutDown if the queue has been shut down and is empty, or
+        if the queue has been shut down immediately.
+        """
+        if max_items <= 0:
+            raise ValueError("'max_items' must be a positive integer")
+        if self.empty():
+            items = [await self.get()]
+            if max_items > 1 and not self.empty():
+                items += self.get_many_nowait(max_items - 1)
+            return items
+        return self.get_many_nowait(max_items)
+
+    def get_many_nowait(self, max_items):
+        """Remove and return a list of up to max_items items from the queue.
+
+        Return the available items, up to max_items, if there are any, else
+        raise QueueEmpty.
+
+        Raises QueueShutDown if the queue has been shut down and is empty, or
+        if the queue has been shut down immediately.
+        """
+        if max_items <= 0:
+            raise ValueError("'max_items' must be a positive integer")
+        if self.empty():
+            if self._is_shutdown:
+                raise QueueShutDown
+            raise QueueEmpty
+        n = min(max_items, self.qsize())
+        items = [self._get() for _ in range(n)]
+        for _ in range(n):
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        return items
+
     def task_done(self):
         """Indicate that a formerly enqueued task is complete.
 
@@ -306,3 +402,206 @@ def _put(self, item):
 
     def _get(self):
         return self._queue.pop()
+
+
+class ThreadSafeQueue(mixins._LoopBoundMixin, queue.Queue):
+    """A queue shared by threads and by the coroutines of an event loop.
+
+    This is a queue.Queue, whose put() and get() methods are used by
+    threads, with the aput() and aget() coroutine methods added for the
+    tasks of an event loop.  Items can go in either direction, and both
+    sides wait when the queue is full if maxsize is greater than 0.
+
+    The tasks waiting in aget() or aput() are woken up from other threads
+    with a single call_soon_threadsafe() call for all the items put or
+    gotten until the event loop runs again.
+    """
+
+    def __init__(self, maxsize=0):
+        super().__init__(maxsize)
+        # Futures of the tasks waiting in aget() and aput().
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+        self._wakeup_scheduled = False
+
+    def __repr__(self):
+        return f'<{type(self).__name__} at {id(self):#x} {self._format()}>'
+
+    def __str__(self):
+        return f'<{type(self).__name__} {self._format()}>'
+
+    def _format(self):
+        with self.mutex:
+            result = f'maxsize={self.maxsize!r}'
+            if self.queue:
+                result += f' queue={list(self.queue)!r}'
+            if self._getters:
+                result += f' _getters[{len(self._getters)}]'
+            if self._putters:
+                result += f' _putters[{len(self._putters)}]'
+            if self.unfinished_tasks:
+                result += f' tasks={self.unfinished_tasks}'
+            if self.is_shutdown:
+                result += ' shutdown'
+            return result
+
+    # The methods below are called with the mutex held.
+
+    def _put(self, item):
+        super()._put(item)
+        self._wakeup_async(self._getters)
+
+    def _get(self):
+        item = super()._get()
+        self._wakeup_async(self._putters)
+        return item
+
+    def _wakeup_async(self, waiters):
+        # Wake up a task waiting in aget() or aput(), if any.
+        if not waiters:
+            return
+        if events._get_running_loop() is self._loop:
+            _wakeup_next(waiters)
+        else:
+            self._schedule_wakeup()
+
+    def _schedule_wakeup(self):
+        # Called from another thread: wake up the waiters which can proceed
+        # once the event loop runs, with a single wakeup for all the items
+        # put or gotten until then.
+        if self._wakeup_scheduled:
+            return
+        self._wakeup_scheduled = True
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup)
+        except RuntimeError:
+            # The event loop is closed, its tasks will never resume.
+            pass
+
+    def _wakeup(self):
+        with self.mutex:
+            self._wakeup_scheduled = False
+            if self.is_shutdown:
+                # All waiters need to re-check the queue to raise.
+                _wakeup_all(self._getters, len(self._getters))
+                _wakeup_all(self._putters, len(self._putters))
+                return
+            _wakeup_all(self._getters, self._qsize())
+            if self.maxsize > 0:
+                _wakeup_all(self._putters, self.maxsize - self._qsize())
+            else:
+                _wakeup_all(self._putters, len(self._putters))
+
+    # End of the methods called with the mutex held.
+
+    async def aput(self, item):
+        """Put an item into the queue.
+
+        If the queue is full, wait until a free slot is available before
+        adding item.
+
+        Raises QueueShutDown if the queue has been shut down.
+        """
+        loop = self._get_loop()
+        while True:
+            with self.mutex:
+                if self.is_shutdown:
+                    raise QueueShutDown
+                if not 0 < self.maxsize <= self._qsize():
+                    self._put(item)
+                    self.unfinished_tasks += 1
+                    self.not_empty.notify()
+                    return
+                putter = loop.create_future()
+                self._putters.append(putter)
+            try:
+                await putter
+            except:
+                putter.cancel()  # Just in case putter is not done yet.
+                with self.mutex:
+                    try:
+                        # Clean self._putters from canceled putters.
+                        self._putters.remove(putter)
+                    except ValueError:
+                        # The putter was woken up.
+                        pass
+                    if (not 0 < self.maxsize <= self._qsize()
+                            and not putter.cancelled()):
+                        # We were woken up by a get, but can't take the
+                        # call.  Wake up the next in line.
+                        _wakeup_next(self._putters)
+                raise
+
+    async def aget(self):
+        """Remove and return an item from the queue.
+
+        If queue is empty, wait until an item is available.
+
+        Raises QueueShutDown if the queue has been shut down and is empty, or
+        if the queue has been shut down immediately.
+        """
+        loop = self._get_loop()
+        while True:
+            with self.mutex:
+                if self._qsize():
+                    item = self._get()
+                    self.not_full.notify()
+                    return item
+                if self.is_shutdown:
+                    raise QueueShutDown
+                getter = loop.create_future()
+                self._getters.append(getter)
+            try:
+                await getter
+            except:
+                getter.cancel()  # Just in case getter is not done yet.
+                with self.mutex:
+                    try:
+                        # Clean self._getters from canceled getters.
+                        self._getters.remove(getter)
+                    except ValueError:
+                        # The getter was woken up.
+                        pass
+                    if self._qsize() and not getter.cancelled():
+                        # We were woken up by a put, but can't take the
+                        # call.  Wake up the next in line.
+                        _wakeup_next(self._getters)
+                raise
+
+    def shutdown(self, immediate=False):
+        """Shut-down the queue, making puts and gets raise.
+
+        The methods inherited from queue.Queue raise queue.ShutDown, aput()
+        and aget() raise QueueShutDown.  By default, gets will only raise
+        once the queue is empty.  Set 'immediate' to True to make gets raise
+        immediately instead.
+
+        All blocked callers of put(), get(), aput() and aget() will be
+        unblocked.  If 'immediate', a task is marked as done for each item
+        remaining in the queue, which may unblock callers of join().
+
+        This method can be called from any thread.
+        """
+        super().shutdown(immediate)
+        with self.mutex:
+            if not self._getters and not self._putters:
+                return
+            if events._get_running_loop() is self._loop:
+                _wakeup_all(self._getters, len(self._getters))
+                _wakeup_all(self._putters, len(self._putters))
+            else:
+                self._schedule_wakeup()
+
+
+def _wakeup_next(waiters):
+    # Wake up the next waiter (if any) that isn't cancelled.
+    _wakeup_all(waiters, 1)
+
+
+def _wakeup_all(waiters, count):
+    # Wake up the next count waiters that aren't cancelled.
+    while waiters and count > 0:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            count -= 1
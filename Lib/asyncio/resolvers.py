@@ -0,0 +1,121 @@
+"""Name resolvers used by the event loop to look up host names."""
+
+__all__ = (
+    "AbstractResolver",
+    "ThreadedResolver",
+    "CachingResolver",
+)
+
+import collections
+import socket
+
+from . import events
+from . import tasks
+
+
+_CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class AbstractResolver:
+    """Abstract base class of the resolvers of loop.set_resolver()."""
+
+    async def getaddrinfo(self, host, port, *,
+                          family=0, type=0, proto=0, flags=0):
+        """Look up host and port like socket.getaddrinfo()."""
+        raise NotImplementedError
+
+
+class ThreadedResolver(AbstractResolver):
+    """Resolver calling socket.getaddrinfo() in the default executor."""
+
+    async def getaddrinfo(self, host, port, *,
+                          family=0, type=0, proto=0, flags=0):
+        loop = events.get_running_loop()
+        return await loop.run_in_executor(
+            None, socket.getaddrinfo, host, port, family, type, proto, flags)
+
+
+class CachingResolver(AbstractResolver):
+    """Resolver caching the results of another resolver.
+
+    Results are kept for ttl seconds of the clock of the event loop, and
+    the least recently used ones are dropped once more than maxsize lookups
+    are cached.  Concurrent lookups of the same arguments share a single
+    call to the underlying resolver, which defaults to a ThreadedResolver.
+    Errors are not cached.
+    """
+
+    def __init__(self, resolver=None, *, ttl=60.0, maxsize=1024):
+        if not ttl > 0:
+            raise ValueError('ttl must be a positive number')
+        if maxsize <= 0:
+            raise ValueError('maxsize must be a positive integer')
+        if resolver is None:
+            resolver = ThreadedResolver()
+        self._resolver = resolver
+        self._ttl = ttl
+        self._maxsize = maxsize
+        # Maps the arguments of each lookup to its expiration time and
+        # result, from the least to the most recently used.
+        self._cache = collections.OrderedDict()
+        # Maps the arguments of the lookups in progress to their task.
+        self._pending = {}
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self):
+        info = [self.__class__.__name__, f'resolver={self._resolver!r}',
+                f'ttl={self._ttl}', f'maxsize={self._maxsize}',
+                f'currsize={len(self._cache)}']
+        return f'<{" ".join(info)}>'
+
+    async def getaddrinfo(self, host, port, *,
+                          family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        loop = events.get_running_loop()
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires, infos = entry
+            if loop.time() < expires:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return list(infos)
+            del self._cache[key]
+
+        task = self._pending.get(key)
+        if task is None:
+            self._misses += 1
+            task = loop.create_task(self._resolver.getaddrinfo(
+                host, port, family=family, type=type, proto=proto,
+                flags=flags))
+            self._pending[key] = task
+            task.add_done_callback(
+                lambda task: self._lookup_done(key, task))
+        else:
+            self._hits += 1
+        # Cancelling one of the callers must not cancel the lookup, which
+        # the other callers may be waiting for.
+        return list(await tasks.shield(task))
+
+    def _lookup_done(self, key, task):
+        del self._pending[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._cache[key] = (task.get_loop().time() + self._ttl,
+                            task.result())
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    def cache_info(self):
+        """Report the hits, misses, maxsize and currsize of the cache.
+
+        Lookups which joined a lookup in progress count as hits.
+        """
+        return _CacheInfo(self._hits, self._misses, self._maxsize,
+                          len(self._cache))
+
+    def cache_clear(self):
+        """Clear the cache and its statistics."""
+        self._cache.clear()
+        self._hits = self._misses = 0
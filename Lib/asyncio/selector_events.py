@@ -91,10 +91,12 @@ def _make_ssl_transport(
         return ssl_protocol._app_transport
 
     def _make_datagram_transport(self, sock, protocol,
-                                 address=None, waiter=None, extra=None):
+                                 address=None, waiter=None, extra=None,
+                                 batch_size=None):
         self._ensure_fd_no_transport(sock)
         return _SelectorDatagramTransport(self, sock, protocol,
-                                          address, waiter, extra)
+                                          address, waiter, extra,
+                                          batch_size=batch_size)
 
     def close(self):
         if self.is_running():
@@ -932,6 +934,7 @@ def __init__(self, loop, sock, protocol, waiter=None,
         super().__init__(loop, sock, protocol, extra, server)
         self._eof = False
         self._empty_waiter = None
+        self._write_coalescing = False
         if _HAS_SENDMSG:
             self._write_ready = self._write_sendmsg
         else:
@@ -1061,7 +1064,9 @@ def write(self, data):
             self._conn_lost += 1
             return
 
-        if not self._buffer:
+        if self._write_coalescing and not self._buffer:
+            self._loop.call_soon(self._write_coalesced, self._write_ready)
+        elif not self._buffer:
             # Optimization: try to send now.
             try:
                 n = self._sock.send(data)
@@ -1083,6 +1088,21 @@ def write(self, data):
         self._buffer.append(data)
         self._maybe_pause_protocol()
 
+    def _write_coalesced(self, write_ready):
+        # Send the data written since the previous iteration of the event
+        # loop, with a single sendmsg() call if possible.
+        if not self._buffer or self._conn_lost:
+            return
+        write_ready()
+        if self._buffer and not self._conn_lost:
+            self._loop._add_writer(self._sock_fd, write_ready)
+
+    def set_write_coalescing(self, enabled):
+        self._write_coalescing = bool(enabled)
+
+    def get_write_coalescing(self):
+        return self._write_coalescing
+
     def _get_sendmsg_buffer(self):
         return itertools.islice(self._buffer, SC_IOV_MAX)
 
@@ -1122,7 +1142,7 @@ def _adjust_leftover_buffer(self, nbytes: int) -> None:
             if b_len <= nbytes:
                 nbytes -= b_len
             else:
-                buffer.appendleft(b[nbytes:])
+                buffer.appendleft(memoryview(b)[nbytes:])
                 break
 
     def _write_send(self):
@@ -1134,7 +1154,7 @@ def _write_send(self):
             n = self._sock.send(buffer)
             if n != len(buffer):
                 # Not all data was written
-                self._buffer.appendleft(buffer[n:])
+                self._buffer.appendleft(memoryview(buffer)[n:])
         except (BlockingIOError, InterruptedError):
             pass
         except (SystemExit, KeyboardInterrupt):
@@ -1170,6 +1190,14 @@ def writelines(self, list_of_data):
             raise RuntimeError('unable to writelines; sendfile is in progress')
         if not list_of_data:
             return
+        if self._write_coalescing:
+            if self._conn_lost:
+                return
+            if not self._buffer:
+                self._loop.call_soon(self._write_coalesced, self._write_ready)
+            self._buffer.extend([memoryview(data) for data in list_of_data])
+            self._maybe_pause_protocol()
+            return
         self._buffer.extend([memoryview(data) for data in list_of_data])
         self._write_ready()
         # If the entire buffer couldn't be written, register a write handler
@@ -1207,10 +1235,15 @@ class _SelectorDatagramTransport(_SelectorTransport, transports.DatagramTranspor
     _buffer_factory = collections.deque
 
     def __init__(self, loop, sock, protocol, address=None,
-                 waiter=None, extra=None):
+                 waiter=None, extra=None, batch_size=None):
         super().__init__(loop, sock, protocol, extra)
         self._address = address
         self._buffer_size = 0
+        self._batch_size = batch_size
+        if batch_size is not None:
+            # Receive the datagrams into a preallocated buffer rather than
+            # allocate max_size bytes for each of them.
+            self._recv_buffer = memoryview(bytearray(self.max_size))
         self._loop.call_soon(self._protocol.connection_made, self)
         # only start reading when connection_made() has been called
         self._loop.call_soon(self._add_reader,
@@ -1224,6 +1257,9 @@ def get_write_buffer_size(self):
         return self._buffer_size
 
     def _read_ready(self):
+        if self._batch_size is not None:
+            self._read_ready__batch()
+            return
         if self._conn_lost:
             return
         try:
@@ -1239,6 +1275,31 @@ def _read_ready(self):
         else:
             self._protocol.datagram_received(data, addr)
 
+    def _read_ready__batch(self):
+        if self._conn_lost:
+            return
+        # Drain up to _batch_size datagrams and pass them all at once.
+        datagrams = []
+        buf = self._recv_buffer
+        error = None
+        try:
+            while len(datagrams) < self._batch_size:
+                nbytes, addr = self._sock.recvfrom_into(buf)
+                datagrams.append((bytes(buf[:nbytes]), addr))
+        except (BlockingIOError, InterruptedError):
+            pass
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as exc:
+            error = exc
+        # Deliver the datagrams received before an error first.
+        if datagrams:
+            self._protocol.datagrams_received(datagrams)
+        if isinstance(error, OSError):
+            self._protocol.error_received(error)
+        elif error is not None:
+            self._fatal_error(error, 'Fatal read error on datagram transport')
+
     def sendto(self, data, addr=None):
         if not isinstance(data, (bytes, bytearray, memoryview)):
             raise TypeError(f'data argument must be a bytes-like object, '
@@ -173,6 +173,16 @@ def get_write_buffer_size(self):
         """Return the current size of the write buffers."""
         return self._ssl_protocol._get_write_buffer_size()
 
+    def set_write_coalescing(self, enabled):
+        """Enable or disable write coalescing.
+
+        The TLS records are coalesced by the underlying transport.
+        """
+        self._ssl_protocol._transport.set_write_coalescing(enabled)
+
+    def get_write_coalescing(self):
+        return self._ssl_protocol._transport.get_write_coalescing()
+
     def set_read_buffer_limits(self, high=None, low=None):
         """Set the high- and low-water limits for read flow control.
 
@@ -703,7 +713,7 @@ def _do_write(self):
                 count = self._sslobj.write(data)
                 data_len = len(data)
                 if count < data_len:
-                    self._write_backlog[0] = data[count:]
+                    self._write_backlog[0] = memoryview(data)[count:]
                     self._write_buffer_size -= count
                 else:
                     del self._write_backlog[0]
@@ -5,6 +5,7 @@
 import collections
 import socket
 import sys
+import threading
 import warnings
 import weakref
 
@@ -22,6 +23,29 @@
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
 
+# Size of the buffer into which transports read the data of a stream before
+# it is appended to the buffer of its StreamReader (the maximum amount of
+# data read at once by the selector transports), and of the chunks into which
+# readexactly() lets them read large amounts of data directly.
+_RECV_BUFFER_SIZE = 256 * 1024
+
+# Smaller reads go through the internal buffer of the StreamReader, so
+# that the transport does not receive a few bytes per system call.
+_DIRECT_READ_MIN_SIZE = 64 * 1024
+
+_recv_buffers = threading.local()
+
+
+def _get_recv_buffer():
+    # The data is copied out of the buffer by buffer_updated() before the
+    # transport returns to the event loop, so that all the streams of an event
+    # loop (and thus of a thread) can share the same buffer.
+    try:
+        return _recv_buffers.buffer
+    except AttributeError:
+        buf = _recv_buffers.buffer = memoryview(bytearray(_RECV_BUFFER_SIZE))
+        return buf
+
 
 async def open_connection(host=None, port=None, *,
                           limit=_DEFAULT_LIMIT, **kwds):
@@ -177,16 +201,28 @@ def _get_close_waiter(self, stream):
         raise NotImplementedError
 
 
-class StreamReaderProtocol(FlowControlMixin, protocols.Protocol):
+class StreamReaderProtocol(FlowControlMixin, protocols.BufferedProtocol):
     """Helper class to adapt between Protocol and StreamReader.
 
     (This is a helper class instead of making StreamReader itself a
     Protocol subclass, because the StreamReader has other potential
     uses, and to prevent the user of the StreamReader to accidentally
     call inappropriate methods of the protocol.)
+
+    Transports supporting the buffered protocol read the data directly
+    into a buffer provided by the StreamReader, the other ones call
+    data_received().
     """
 
     _source_traceback = None
+    _data_received_overridden = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Keep passing the data through data_received() to subclasses
+        # which override it.
+        cls._data_received_overridden = (
+            cls.data_received is not StreamReaderProtocol.data_received)
 
     def __init__(self, stream_reader, client_connected_cb=None, loop=None):
         super().__init__(loop=loop)
@@ -280,6 +316,20 @@ def data_received(self, data):
         if reader is not None:
             reader.feed_data(data)
 
+    def get_buffer(self, sizehint):
+        reader = self._stream_reader
+        if reader is None or self._data_received_overridden:
+            return _get_recv_buffer()
+        return reader._get_buffer()
+
+    def buffer_updated(self, nbytes):
+        if self._data_received_overridden:
+            self.data_received(bytes(_get_recv_buffer()[:nbytes]))
+            return
+        reader = self._stream_reader
+        if reader is not None:
+            reader._buffer_updated(nbytes)
+
     def eof_received(self):
         reader = self._stream_reader
         if reader is not None:
@@ -385,6 +435,20 @@ async def drain(self):
             await sleep(0)
         await self._protocol._drain_helper()
 
+    async def sendfile(self, file, offset=0, count=None):
+        """Send a file with loop.sendfile() and return the bytes sent.
+
+        The file is sent with os.sendfile() where possible.  Otherwise,
+        for example over TLS, it is read in the file I/O thread pool while
+        it is written.
+        """
+        if self._reader is not None:
+            exc = self._reader.exception()
+            if exc is not None:
+                raise exc
+        return await self._loop.sendfile(self._transport, file,
+                                         offset, count)
+
     async def start_tls(self, sslcontext, *,
                         server_hostname=None,
                         ssl_handshake_timeout=None,
@@ -431,6 +495,10 @@ def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
         self._exception = None
         self._transport = None
         self._paused = False
+        # The buffer of a read coroutine into which the transport can read
+        # directly, and the number of bytes it read into it.
+        self._readinto_buffer = None
+        self._readinto_nbytes = 0
         if self._loop.get_debug():
             self._source_traceback = format_helpers.extract_stack(
                 sys._getframe(1))
@@ -512,10 +580,30 @@ def feed_data(self, data):
             else:
                 self._paused = True
 
-    async def _wait_for_data(self, func_name):
+    def _get_buffer(self):
+        # Called by StreamReaderProtocol.get_buffer().
+        if self._readinto_buffer is not None:
+            return self._readinto_buffer
+        return _get_recv_buffer()
+
+    def _buffer_updated(self, nbytes):
+        # Called by StreamReaderProtocol.buffer_updated().
+        if self._readinto_buffer is None:
+            self.feed_data(_get_recv_buffer()[:nbytes])
+        elif nbytes:
+            # Let the next reads of the transport go to the internal buffer.
+            self._readinto_buffer = None
+            self._readinto_nbytes = nbytes
+            self._wakeup_waiter()
+
+    async def _wait_for_data(self, func_name, readinto_buffer=None):
         """Wait until feed_data() or feed_eof() is called.
 
         If stream was paused, automatically resume it.
+
+        If readinto_buffer is given, a transport supporting the buffered
+        protocol reads the data directly into it, and _readinto_nbytes is
+        set to the number of bytes read.
         """
         # StreamReader uses a future to link the protocol feed_data() method
         # to a read coroutine. Running two read coroutines at the same time
@@ -535,10 +623,12 @@ async def _wait_for_data(self, func_name):
             self._transport.resume_reading()
 
         self._waiter = self._loop.create_future()
+        self._readinto_buffer = readinto_buffer
         try:
             await self._waiter
         finally:
             self._waiter = None
+            self._readinto_buffer = None
 
     async def readline(self):
         """Read chunk of data from the stream until newline (b'\n') is found.
@@ -736,6 +826,66 @@ async def read(self, n=-1):
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buf):
+        """Read up to len(buf) bytes from the stream into buf.
+
+        buf must be a writable bytes-like object.  Return the number of
+        bytes read as soon as at least 1 byte is available.  If EOF is
+        received before any byte is read, or if buf is empty, return 0.
+
+        When the internal buffer is empty, transports supporting the
+        buffered protocol read the incoming data directly into buf,
+        without copying it.
+
+        Returned value is not limited with limit, configured at stream
+        creation.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        view = memoryview(buf).cast('B')
+        if view.readonly:
+            raise TypeError('readinto() argument must be read-write '
+                            'bytes-like object')
+        return await self._readinto(view, 'readinto')
+
+    async def _readinto(self, view, func_name):
+        if not view:
+            return 0
+
+        if not self._buffer and not self._eof:
+            if len(view) < _DIRECT_READ_MIN_SIZE:
+                await self._wait_for_data(func_name)
+            else:
+                nbytes = await self._wait_for_data_into(view, func_name)
+                if nbytes:
+                    return nbytes
+
+        # This will work right even if buffer is less than n bytes
+        nbytes = min(len(view), len(self._buffer))
+        view[:nbytes] = memoryview(self._buffer)[:nbytes]
+        del self._buffer[:nbytes]
+
+        self._maybe_resume_transport()
+        return nbytes
+
+    async def _wait_for_data_into(self, view, func_name):
+        # Return the number of bytes read directly into view.
+        self._readinto_nbytes = 0
+        try:
+            await self._wait_for_data(func_name, view)
+        except BaseException:
+            # Leave the data already read into view to the next read.
+            self._buffer[:0] = view[:self._readinto_nbytes]
+            raise
+        finally:
+            nbytes = self._readinto_nbytes
+            self._readinto_nbytes = 0
+        return nbytes
+
     async def readexactly(self, n):
         """Read exactly `n` bytes.
 
@@ -760,6 +910,9 @@ async def readexactly(self, n):
         if n == 0:
             return b''
 
+        if n - len(self._buffer) > _RECV_BUFFER_SIZE and not self._eof:
+            return await self._readexactly_large(n)
+
         while len(self._buffer) < n:
             if self._eof:
                 incomplete = bytes(self._buffer)
@@ -777,6 +930,38 @@ async def readexactly(self, n):
         self._maybe_resume_transport()
         return data
 
+    async def _readexactly_large(self, n):
+        # Let the transport read the missing data directly into chunks of
+        # _RECV_BUFFER_SIZE bytes, rather than copy it to the internal buffer
+        # and back.  The chunks are only allocated once the data they hold
+        # is expected, so that the peer cannot make us allocate n bytes.
+        chunks = [bytes(self._buffer)]
+        nread = filled = len(self._buffer)
+        self._buffer.clear()
+        try:
+            while nread < n:
+                chunk = bytearray(min(n - nread, _RECV_BUFFER_SIZE))
+                view = memoryview(chunk)
+                chunks.append(view)
+                filled = 0
+                while filled < len(chunk):
+                    nbytes = await self._readinto(view[filled:],
+                                                  'readexactly')
+                    if not nbytes:
+                        chunks[-1] = view[:filled]
+                        incomplete = b''.join(chunks)
+                        raise exceptions.IncompleteReadError(incomplete, n)
+                    filled += nbytes
+                    nread += nbytes
+        except exceptions.IncompleteReadError:
+            raise
+        except BaseException:
+            # Leave the data read so far to the next read.
+            chunks[-1] = chunks[-1][:filled]
+            self._buffer[:0] = b''.join(chunks)
+            raise
+        return b''.join(chunks)
+
     def __aiter__(self):
         return self
 
@@ -1,5 +1,7 @@
 __all__ = 'create_subprocess_exec', 'create_subprocess_shell'
 
+import os
+import stat
 import subprocess
 
 from . import events
@@ -13,6 +15,77 @@
 STDOUT = subprocess.STDOUT
 DEVNULL = subprocess.DEVNULL
 
+_HAS_SPLICE = hasattr(os, 'splice')
+# Maximum number of bytes moved by one splice() or read() call.
+_SPLICE_SIZE = 1024 * 1024
+
+
+def _set_ready(fut):
+    if not fut.done():
+        fut.set_result(None)
+
+
+async def _wait_readable(loop, fd):
+    fut = loop.create_future()
+    loop.add_reader(fd, _set_ready, fut)
+    try:
+        await fut
+    finally:
+        loop.remove_reader(fd)
+
+
+async def _wait_writable(loop, fd):
+    fut = loop.create_future()
+    loop.add_writer(fd, _set_ready, fut)
+    try:
+        await fut
+    finally:
+        loop.remove_writer(fd)
+
+
+async def _write_all(loop, fd, data):
+    data = memoryview(data)
+    while data:
+        try:
+            n = os.write(fd, data)
+        except BlockingIOError:
+            await _wait_writable(loop, fd)
+        else:
+            data = data[n:]
+
+
+async def _copy_fd(loop, src_fd, dst_fd):
+    # Copy the data of the non-blocking pipe src_fd to dst_fd until EOF and
+    # return the number of bytes copied.  Regular files cannot be waited
+    # for, but they never block.
+    wait_writable = not stat.S_ISREG(os.fstat(dst_fd).st_mode)
+    total = 0
+    src_ready = False
+    while True:
+        try:
+            if _HAS_SPLICE:
+                # Move the data from the pipe buffer to dst_fd in the
+                # kernel.  EAGAIN means that either the pipe is empty or
+                # dst_fd is full.
+                n = os.splice(src_fd, dst_fd, _SPLICE_SIZE,
+                              flags=os.SPLICE_F_MOVE | os.SPLICE_F_NONBLOCK)
+            else:
+                data = os.read(src_fd, _SPLICE_SIZE)
+                n = len(data)
+        except BlockingIOError:
+            if src_ready and wait_writable:
+                await _wait_writable(loop, dst_fd)
+            else:
+                await _wait_readable(loop, src_fd)
+                src_ready = True
+            continue
+        if not n:
+            return total
+        if not _HAS_SPLICE:
+            await _write_all(loop, dst_fd, data)
+        total += n
+        src_ready = False
+
 
 class SubprocessStreamProtocol(streams.FlowControlMixin,
                                protocols.SubprocessProtocol):
@@ -165,6 +238,54 @@ async def _feed_stdin(self, input):
             logger.debug('%r communicate: close stdin', self)
         self.stdin.close()
 
+    async def splice_stdout(self, dst):
+        """Send the standard output of the process to dst until EOF.
+
+        Return the number of bytes sent.
+        """
+        return await self._splice(1, dst)
+
+    async def splice_stderr(self, dst):
+        """Send the standard error of the process to dst until EOF.
+
+        Return the number of bytes sent.
+        """
+        return await self._splice(2, dst)
+
+    async def _splice(self, fd, dst):
+        stream = self.stdout if fd == 1 else self.stderr
+        if stream is None:
+            name = 'stdout' if fd == 1 else 'stderr'
+            raise ValueError(f'{name} of the process is not a pipe')
+        dst_fd = dst if isinstance(dst, int) else dst.fileno()
+        # SPLICE_F_NONBLOCK only applies to the pipe: make dst_fd
+        # non-blocking while the data is sent, so that the event loop is
+        # not blocked when it is full.  Regular files never block.
+        blocking = (not stat.S_ISREG(os.fstat(dst_fd).st_mode) and
+                    os.get_blocking(dst_fd))
+        if blocking:
+            os.set_blocking(dst_fd, False)
+        transport = self._transport.get_pipe_transport(fd)
+        if transport is not None:
+            transport.pause_reading()
+        try:
+            # Send the data already read by the stream first.
+            data = bytes(stream._buffer)
+            stream._buffer.clear()
+            await _write_all(self._loop, dst_fd, data)
+            total = len(data)
+            if (transport is not None and not transport.is_closing() and
+                    not stream._eof):
+                src_fd = transport.get_extra_info('pipe').fileno()
+                total += await _copy_fd(self._loop, src_fd, dst_fd)
+        finally:
+            # Feed EOF to the stream, the pipe cannot be read anymore.
+            if transport is not None:
+                transport.close()
+            if blocking:
+                os.set_blocking(dst_fd, True)
+        return total
+
     async def _noop(self):
         return None
 
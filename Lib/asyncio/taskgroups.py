@@ -4,6 +4,8 @@
 
 __all__ = ("TaskGroup",)
 
+import collections
+
 from . import events
 from . import exceptions
 from . import tasks
@@ -184,6 +186,71 @@ def create_task(self, coro, *, name=None, context=None):
             task.add_done_callback(self._on_task_done)
         return task
 
+    def map(self, func, iterable, /, *, limit, ordered=True):
+        """Run func on each item of iterable in tasks of this group.
+
+        Return an asynchronous iterator of the results.  Items are taken
+        from iterable, which can be an asynchronous iterable, only when
+        fewer than limit tasks are running, and the results are produced
+        in the order of the items if ordered is true, or as soon as they
+        are available otherwise.
+
+        Example use:
+
+            async with asyncio.TaskGroup() as group:
+                async for page in group.map(fetch, urls, limit=10):
+                    print(page)
+
+        If a task fails, the group is aborted as usual and the iteration
+        stops.  The tasks started by the iterator whose result has not
+        been produced are cancelled when the iterator is closed.
+        """
+        if limit < 1:
+            raise ValueError('limit must be at least 1')
+        return self._map(func, iterable, limit, ordered)
+
+    async def _map(self, func, iterable, limit, ordered):
+        is_async = hasattr(iterable, '__aiter__')
+        items = aiter(iterable) if is_async else iter(iterable)
+        # The tasks whose result has not been produced, at most limit.
+        pending = collections.deque() if ordered else set()
+        exhausted = False
+        try:
+            while True:
+                while (not exhausted and len(pending) < limit and
+                       not self._aborting):
+                    try:
+                        if is_async:
+                            item = await anext(items)
+                        else:
+                            item = next(items)
+                    except (StopIteration, StopAsyncIteration):
+                        exhausted = True
+                        break
+                    task = self.create_task(func(item))
+                    if ordered:
+                        pending.append(task)
+                    else:
+                        pending.add(task)
+                if not pending or self._aborting:
+                    return
+                if ordered:
+                    if not pending[0].done():
+                        await tasks.wait((pending[0],))
+                    done = (pending.popleft(),)
+                else:
+                    done, _ = await tasks.wait(
+                        pending, return_when=tasks.FIRST_COMPLETED)
+                    pending.difference_update(done)
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        # The group is aborting and will raise the error.
+                        return
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
     # Since Python 3.8 Tasks propagate all exceptions correctly,
     # except for KeyboardInterrupt and SystemExit which are
     # still considered special.
@@ -6,6 +6,7 @@
     'wait', 'wait_for', 'as_completed', 'sleep',
     'gather', 'shield', 'ensure_future', 'run_coroutine_threadsafe',
     'current_task', 'all_tasks',
+    'set_task_accounting', 'get_task_accounting',
     'create_eager_task_factory', 'eager_task_factory',
     '_register_task', '_unregister_task', '_enter_task', '_leave_task',
 )
@@ -16,6 +17,7 @@
 import inspect
 import itertools
 import math
+import time
 import types
 import weakref
 from types import GenericAlias
@@ -33,6 +35,10 @@
 # is not thread safe. See bpo-11866 for a longer explanation.
 _task_name_counter = itertools.count(1).__next__
 
+# Whether the tasks account for their steps when created, see
+# set_task_accounting().
+_task_accounting = False
+
 
 def current_task(loop=None):
     """Return a currently executed task."""
@@ -81,6 +87,11 @@ class Task(futures._PyFuture):  # Inherit Python Task implementation
     # status is still pending
     _log_destroy_pending = True
 
+    # The accounting of the steps if enabled: a list of the number of steps,
+    # their CPU time, their wall-clock time, the time spent waiting between
+    # them and the perf_counter() time at which the task was suspended.
+    _stats = None
+
     def __init__(self, coro, *, loop=None, name=None, context=None,
                  eager_start=False):
         super().__init__(loop=loop)
@@ -101,6 +112,8 @@ def __init__(self, coro, *, loop=None, name=None, context=None,
         self._must_cancel = False
         self._fut_waiter = None
         self._coro = coro
+        if _task_accounting:
+            self._stats = [0, 0.0, 0.0, 0.0, time.perf_counter()]
         if context is None:
             self._context = contextvars.copy_context()
         else:
@@ -134,6 +147,18 @@ def get_coro(self):
     def get_context(self):
         return self._context
 
+    def get_stats(self):
+        """Return the accounting of the steps of the task, or None.
+
+        The dict has the number of steps, the cpu_time and run_time spent
+        running them, and the wait_time spent between them, in seconds.
+        """
+        if self._stats is None:
+            return None
+        steps, cpu_time, run_time, wait_time, _ = self._stats
+        return {'steps': steps, 'cpu_time': cpu_time,
+                'run_time': run_time, 'wait_time': wait_time}
+
     def get_name(self):
         return self._name
 
@@ -249,7 +274,10 @@ def __eager_start(self):
         try:
             _register_eager_task(self)
             try:
-                self._context.run(self.__step_run_and_handle_result, None)
+                if self._stats is None:
+                    self._context.run(self.__step_run_and_handle_result, None)
+                else:
+                    self._context.run(self.__step_with_stats, None)
             finally:
                 _unregister_eager_task(self)
         finally:
@@ -275,11 +303,30 @@ def __step(self, exc=None):
 
         _enter_task(self._loop, self)
         try:
-            self.__step_run_and_handle_result(exc)
+            if self._stats is None:
+                self.__step_run_and_handle_result(exc)
+            else:
+                self.__step_with_stats(exc)
         finally:
             _leave_task(self._loop, self)
             self = None  # Needed to break cycles when an exception occurs.
 
+    def __step_with_stats(self, exc):
+        stats = self._stats
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        stats[3] += start - stats[4]
+        try:
+            self.__step_run_and_handle_result(exc)
+        finally:
+            cpu_end = time.thread_time()
+            end = time.perf_counter()
+            stats[0] += 1
+            stats[1] += cpu_end - cpu_start
+            stats[2] += end - start
+            stats[4] = end
+            self = None  # Needed to break cycles when an exception occurs.
+
     def __step_run_and_handle_result(self, exc):
         coro = self._coro
         try:
@@ -1029,6 +1076,24 @@ def factory(loop, coro, *, name=None, context=None):
 _current_tasks = {}
 
 
+def set_task_accounting(enabled):
+    """Enable or disable the accounting of the steps of new tasks.
+
+    The tasks created while the accounting is enabled count their steps,
+    the CPU and wall-clock time spent running them and the time spent
+    waiting between them, see Task.get_stats().
+    """
+    global _task_accounting
+    _task_accounting = bool(enabled)
+    if _c_set_task_accounting is not None:
+        _c_set_task_accounting(_task_accounting)
+
+
+def get_task_accounting():
+    """Return whether new tasks account for their steps."""
+    return _task_accounting
+
+
 def _register_task(task):
     """Register an asyncio Task scheduled to run on an event loop."""
     _scheduled_tasks.add(task)
@@ -1102,3 +1167,8 @@ def _unregister_eager_task(task):
     _c_leave_task = _leave_task
     _c_swap_current_task = _swap_current_task
     _c_all_tasks = all_tasks
+
+try:
+    from _asyncio import _set_task_accounting as _c_set_task_accounting
+except ImportError:
+    _c_set_task_accounting = None
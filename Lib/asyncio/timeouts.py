@@ -59,6 +59,8 @@ def reschedule(self, when: Optional[float]) -> None:
         self._when = when
 
         if self._timeout_handler is not None:
+            if when is not None and self._move_timeout_handler(when):
+                return
             self._timeout_handler.cancel()
 
         if when is None:
@@ -70,6 +72,16 @@ def reschedule(self, when: Optional[float]) -> None:
             else:
                 self._timeout_handler = loop.call_at(when, self._on_timeout)
 
+    def _move_timeout_handler(self, when: float) -> bool:
+        # Move the timer rather than replace it, if the loop can.
+        loop = events.get_running_loop()
+        if (when <= loop.time() or
+                not isinstance(self._timeout_handler, events.TimerHandle)):
+            return False
+        reschedule = getattr(loop, '_reschedule_timer', None)
+        return reschedule is not None and reschedule(self._timeout_handler,
+                                                     when)
+
     def expired(self) -> bool:
         """Is timeout expired during execution?"""
         return self._state in (_State.EXPIRING, _State.EXPIRED)
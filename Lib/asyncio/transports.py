@@ -105,6 +105,21 @@ def get_write_buffer_limits(self):
         positive number of bytes."""
         raise NotImplementedError
 
+    def set_write_coalescing(self, enabled):
+        """Enable or disable write coalescing.
+
+        When enabled, write() and writelines() only buffer the data, and
+        the data written until the next iteration of the event loop is
+        sent at once, with a single system call if possible.  This saves
+        system calls for protocols which write a message in several parts,
+        at the cost of a short delay.
+        """
+        raise NotImplementedError
+
+    def get_write_coalescing(self):
+        """Return True if write coalescing is enabled."""
+        raise NotImplementedError
+
     def write(self, data):
         """Write some data bytes to the transport.
 
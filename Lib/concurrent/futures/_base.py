@@ -5,9 +5,12 @@
 
 import collections
 import logging
+import queue
 import threading
 import time
 import types
+import weakref
+from itertools import islice
 
 FIRST_COMPLETED = 'FIRST_COMPLETED'
 FIRST_EXCEPTION = 'FIRST_EXCEPTION'
@@ -314,6 +317,23 @@ def _result_or_cancel(fut, timeout=None):
         del fut
 
 
+def _pop_done(done, pending, timeout=None):
+    """Return the next future put on the done queue by a done callback.
+
+    The future is discarded from the pending set so that only futures that
+    are not yet yielded get cancelled if the result iterator is closed.
+    """
+    if timeout is not None and timeout < 0:
+        # The deadline has passed, only take a future that is already done.
+        timeout = 0
+    try:
+        fut = done.get(timeout=timeout)
+    except queue.Empty:
+        raise TimeoutError from None
+    pending.discard(fut)
+    return fut
+
+
 class Future(object):
     """Represents the result of an asynchronous computation."""
 
@@ -572,7 +592,8 @@ def submit(self, fn, /, *args, **kwargs):
         """
         raise NotImplementedError()
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None,
+            ordered=True):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -584,20 +605,47 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before being passed to a child process. This argument is only
                 used by ProcessPoolExecutor; it is ignored by
                 ThreadPoolExecutor.
+            buffersize: The number of submitted tasks whose results have not
+                yet been yielded. If the buffer is full, iteration over the
+                iterables pauses until a result is yielded from the buffer.
+                If None, all input elements are eagerly collected, and a task is
+                submitted for each.
+            ordered: If False, results are yielded as soon as their call
+                completes instead of in the order of the input elements.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
-            be evaluated out-of-order.
+            be evaluated out-of-order. If ordered is False, the results may
+            also be yielded out-of-order.
 
         Raises:
             TimeoutError: If the entire result iterator could not be generated
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if buffersize is not None and not isinstance(buffersize, int):
+            raise TypeError("buffersize must be an integer or None")
+        if buffersize is not None and buffersize < 1:
+            raise ValueError("buffersize must be None or > 0")
+
+        if not ordered:
+            return self._map_unordered(fn, zip(*iterables), timeout,
+                                       buffersize)
+
         if timeout is not None:
             end_time = timeout + time.monotonic()
 
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        zipped_iterables = zip(*iterables)
+        if buffersize:
+            fs = collections.deque(
+                self.submit(fn, *args)
+                for args in islice(zipped_iterables, buffersize))
+        else:
+            fs = [self.submit(fn, *args) for args in zipped_iterables]
+
+        # Use a weak reference to ensure that the executor can be garbage
+        # collected independently of the result_iterator closure.
+        executor_weakref = weakref.ref(self)
 
         # Yield must be hidden in closure so that the futures are submitted
         # before the first iterator value is required.
@@ -606,6 +654,12 @@ def result_iterator():
                 # reverse to keep finishing order
                 fs.reverse()
                 while fs:
+                    if (
+                        buffersize
+                        and (executor := executor_weakref())
+                        and (args := next(zipped_iterables, None))
+                    ):
+                        fs.appendleft(executor.submit(fn, *args))
                     # Careful not to keep a reference to the popped future
                     if timeout is None:
                         yield _result_or_cancel(fs.pop())
@@ -616,6 +670,47 @@ def result_iterator():
                     future.cancel()
         return result_iterator()
 
+    def _map_unordered(self, fn, zipped_iterables, timeout, buffersize):
+        if timeout is not None:
+            end_time = timeout + time.monotonic()
+
+        # Futures are put on the done queue by their done callback, so the
+        # result iterator never waits on a call that is slower than others.
+        done = queue.SimpleQueue()
+        pending = set()
+
+        def submit(executor, args):
+            future = executor.submit(fn, *args)
+            pending.add(future)
+            future.add_done_callback(done.put)
+
+        if buffersize:
+            for args in islice(zipped_iterables, buffersize):
+                submit(self, args)
+        else:
+            for args in zipped_iterables:
+                submit(self, args)
+
+        executor_weakref = weakref.ref(self)
+
+        def result_iterator():
+            try:
+                while pending:
+                    if buffersize and (executor := executor_weakref()):
+                        if args := next(zipped_iterables, None):
+                            submit(executor, args)
+                        del executor
+                    # Careful not to keep a reference to the popped future
+                    if timeout is None:
+                        yield _result_or_cancel(_pop_done(done, pending))
+                    else:
+                        yield _result_or_cancel(_pop_done(
+                            done, pending, end_time - time.monotonic()))
+            finally:
+                for future in pending:
+                    future.cancel()
+        return result_iterator()
+
     def shutdown(self, wait=True, *, cancel_futures=False):
         """Clean-up the resources associated with the Executor.
 
@@ -0,0 +1,208 @@
+"""Implements InterpreterPoolExecutor."""
+
+import functools
+import pickle
+import threading
+from concurrent.futures import thread as _thread
+import _interpreters
+import _interpqueues
+
+
+class ExecutionFailed(_interpreters.InterpreterError):
+    """An unhandled exception happened during execution."""
+
+    def __init__(self, excinfo):
+        msg = excinfo.formatted
+        if not msg:
+            if excinfo.type and excinfo.msg:
+                msg = f'{excinfo.type.__name__}: {excinfo.msg}'
+            else:
+                msg = excinfo.type.__name__ or excinfo.msg
+        super().__init__(msg)
+        self.excinfo = excinfo
+
+    def __str__(self):
+        try:
+            formatted = self.excinfo.errdisplay
+        except Exception:
+            return super().__str__()
+        else:
+            return f"""
+{super().__str__()}
+
+Uncaught in the interpreter:
+
+{formatted}
+""".strip()
+
+
+class BrokenInterpreterPool(_thread.BrokenThreadPool):
+    """
+    Raised when a worker interpreter in an InterpreterPoolExecutor failed
+    initializing.
+    """
+
+
+# Formats of the items put in the results queue of a worker.
+_SHARED_ONLY = 0
+_PICKLED = 1
+
+# What happens to an item left in the results queue when the worker
+# interpreter which put it is destroyed: _interpqueues.get() raises.
+_UNBOUND_ERROR = 2
+
+# Run in the worker interpreter for each call.  The pickled call is bound
+# to "_task" in its __main__ module and the result is put in the queue
+# whose ID is bound to "_resultsid".
+_RUN_TASK = compile(
+    'from concurrent.futures.interpreter import _run_task\n'
+    '_run_task(_task, _resultsid)\n',
+    '<interpreter pool task>', 'exec')
+
+
+def _run_task(task, resultsid):
+    # Called in the worker interpreter.
+    try:
+        fn, args, kwargs = pickle.loads(task)
+        result = fn(*args, **kwargs)
+    except BaseException as exc:
+        # Send the exception back as a result so that the caller gets the
+        # original exception rather than an ExecutionFailed wrapper, when
+        # it can be pickled.
+        try:
+            result = pickle.dumps(exc)
+        except Exception:
+            raise exc from None
+        _interpqueues.put(resultsid, (True, result), _PICKLED,
+                          _UNBOUND_ERROR)
+        return
+    try:
+        # Most results (None, numbers, strings, bytes and tuples of them)
+        # are shared without pickling.
+        _interpqueues.put(resultsid, (False, result), _SHARED_ONLY,
+                          _UNBOUND_ERROR)
+    except _interpreters.NotShareableError:
+        _interpqueues.put(resultsid, (False, pickle.dumps(result)),
+                          _PICKLED, _UNBOUND_ERROR)
+
+
+class _WorkerContext:
+    """The interpreter owned by a worker thread."""
+
+    def __init__(self, shared, initdata):
+        self.interpid = None
+        self.resultsid = None
+        interpid = _interpreters.create(reqrefs=True)
+        try:
+            _interpreters.incref(interpid)
+            self.interpid = interpid
+            self.resultsid = _interpqueues.create(0, _PICKLED, _UNBOUND_ERROR)
+            attrs = dict(shared or ())
+            attrs['_resultsid'] = self.resultsid
+            _interpreters.set___main___attrs(interpid, attrs)
+            if initdata is not None:
+                self.run(initdata)
+        except BaseException:
+            self.close()
+            raise
+
+    def run(self, task):
+        excinfo = _interpreters.exec(self.interpid, _RUN_TASK,
+                                     {'_task': task}, restrict=True)
+        if excinfo is not None:
+            raise ExecutionFailed(excinfo)
+        obj, fmt, _ = _interpqueues.get(self.resultsid)
+        raised, result = obj
+        if fmt == _PICKLED:
+            result = pickle.loads(result)
+        if raised:
+            try:
+                raise result
+            finally:
+                # Break the reference cycle with the exception.
+                result = None
+        return result
+
+    def close(self):
+        if self.resultsid is not None:
+            resultsid, self.resultsid = self.resultsid, None
+            try:
+                _interpqueues.destroy(resultsid)
+            except _interpqueues.QueueNotFoundError:
+                pass
+        if self.interpid is not None:
+            interpid, self.interpid = self.interpid, None
+            try:
+                _interpreters.decref(interpid)
+            except _interpreters.InterpreterNotFoundError:
+                pass
+
+
+# The _WorkerContext of the current worker thread.  It is closed by
+# _finalize_worker() before the thread exits, while the thread can still
+# switch to the interpreter to destroy it.
+_local = threading.local()
+
+
+def _init_worker(shared, initdata):
+    _local.context = _WorkerContext(shared, initdata)
+
+
+def _finalize_worker():
+    context = getattr(_local, 'context', None)
+    if context is not None:
+        del _local.context
+        context.close()
+
+
+def _call_in_worker(task):
+    return _local.context.run(task)
+
+
+class InterpreterPoolExecutor(_thread.ThreadPoolExecutor):
+
+    BROKEN = BrokenInterpreterPool
+
+    def __init__(self, max_workers=None, thread_name_prefix='',
+                 initializer=None, initargs=(), *, shared=None,
+                 work_stealing=False, idle_timeout=None, min_workers=0):
+        """Initializes a new InterpreterPoolExecutor instance.
+
+        Each worker thread runs the calls in its own interpreter.  The
+        callables and their arguments and results are pickled to cross
+        the interpreter boundary.
+
+        Args:
+            max_workers: The maximum number of interpreters that can be used
+                to execute the given calls.
+            thread_name_prefix: An optional name prefix to give our threads.
+            initializer: A callable used to initialize each worker
+                interpreter.
+            initargs: A tuple of arguments to pass to the initializer.
+            shared: An optional mapping of shareable objects bound in the
+                __main__ module of each worker interpreter.
+            work_stealing, idle_timeout, min_workers: See
+                ThreadPoolExecutor.
+        """
+        if initializer is not None:
+            if not callable(initializer):
+                raise TypeError("initializer must be a callable")
+            initdata = pickle.dumps((initializer, initargs, {}))
+        else:
+            initdata = None
+        if shared is not None:
+            shared = dict(shared)
+            for name, value in shared.items():
+                if not _interpreters.is_shareable(value):
+                    raise ValueError(f"shared value {name!r} is not "
+                                     f"shareable between interpreters")
+        super().__init__(max_workers, thread_name_prefix,
+                         functools.partial(_init_worker, shared, initdata),
+                         work_stealing=work_stealing,
+                         idle_timeout=idle_timeout, min_workers=min_workers)
+        self._finalizer = _finalize_worker
+
+    def submit(self, fn, /, *args, **kwargs):
+        task = pickle.dumps((fn, args, kwargs))
+        return super().submit(_call_in_worker, task)
+    submit.__doc__ = _thread.ThreadPoolExecutor.submit.__doc__
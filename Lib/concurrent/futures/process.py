@@ -52,8 +52,10 @@
 # This import is required to load the multiprocessing.connection submodule
 # so that it can be accessed later as `mp.connection`
 import multiprocessing.connection
+from multiprocessing.pool import AutoChunksize
 from multiprocessing.queues import Queue
 import threading
+import time
 import weakref
 from functools import partial
 import itertools
@@ -202,6 +204,22 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+def _process_timed_chunk(fn, timed_chunk):
+    """ Processes a chunk of an iterable passed to map and times it.
+
+    Runs the function passed to map() on a chunk of the iterable
+    split by an AutoChunksize. The dispatch time and queued flag
+    are passed back untouched with the execution time and results.
+
+    This function is run in a separate process.
+
+    """
+    dispatched, queued, chunk = timed_chunk
+    start = time.perf_counter()
+    results = [fn(*args) for args in chunk]
+    return dispatched, queued, time.perf_counter() - start, results
+
+
 def _sendback_result(result_queue, work_id, result=None, exception=None,
                      exit_pid=None):
     """Safely send back the given result or exception"""
@@ -626,6 +644,38 @@ def _chain_from_iterable_of_lists(iterable):
             yield element.pop()
 
 
+class _AutoChunker(object):
+    """Splits the arguments of map() into chunks sized by an AutoChunksize
+    and reports the timings of the completed chunks back to it."""
+
+    def __init__(self, tuner, iterable, max_workers, length=None):
+        self.tuner = tuner
+        self.iterable = iterable
+        self.max_workers = max_workers
+        # The number of items, if it is known, which caps the chunk size.
+        self.length = length
+        self.in_flight = 0
+
+    def chunks(self):
+        while True:
+            size = self.tuner._next_chunksize(self.length, self.max_workers)
+            chunk = tuple(itertools.islice(self.iterable, size))
+            if not chunk:
+                return
+            # A chunk sent while every worker is busy waits in the call
+            # queue, so its latency does not reflect the IPC cost.
+            queued = self.in_flight >= self.max_workers
+            self.in_flight += 1
+            yield (time.monotonic(), queued, chunk)
+
+    def results(self, iterable):
+        for dispatched, queued, exec_time, results in iterable:
+            self.in_flight -= 1
+            self.tuner._record(len(results), exec_time,
+                               time.monotonic() - dispatched, queued)
+            yield results
+
+
 class BrokenProcessPool(_base.BrokenExecutor):
     """
     Raised when a process in a ProcessPoolExecutor terminated abruptly
@@ -813,7 +863,8 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1,
+            buffersize=None, ordered=True):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -824,22 +875,55 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If "auto" or a multiprocessing.pool.AutoChunksize instance,
+                the size of each chunk is tuned from the execution time of
+                the previous ones.
+            buffersize: The number of submitted chunks whose results have not
+                yet been yielded. If the buffer is full, iteration over the
+                iterables pauses until a result is yielded from the buffer.
+                If None, all input elements are eagerly collected, and a task is
+                submitted for each chunk.
+            ordered: If False, the results of each chunk are yielded as soon
+                as the chunk completes instead of in the order of the input
+                elements.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
-            be evaluated out-of-order.
+            be evaluated out-of-order. If ordered is False, the results may
+            also be yielded out-of-order.
 
         Raises:
             TimeoutError: If the entire result iterator could not be generated
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if chunksize == "auto":
+            chunksize = AutoChunksize()
+        if isinstance(chunksize, AutoChunksize):
+            # Chunks are only sized once the previous ones have completed, so
+            # the iterables must be consumed lazily.
+            if buffersize is None:
+                buffersize = 2 * self._max_workers
+            length = None
+            if iterables and all(hasattr(it, '__len__') for it in iterables):
+                length = min(map(len, iterables))
+            chunker = _AutoChunker(chunksize, zip(*iterables),
+                                   self._max_workers, length)
+            results = super().map(partial(_process_timed_chunk, fn),
+                                  chunker.chunks(),
+                                  timeout=timeout,
+                                  buffersize=buffersize,
+                                  ordered=ordered)
+            return _chain_from_iterable_of_lists(chunker.results(results))
+
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
         results = super().map(partial(_process_chunk, fn),
                               itertools.batched(zip(*iterables), chunksize),
-                              timeout=timeout)
+                              timeout=timeout,
+                              buffersize=buffersize,
+                              ordered=ordered)
         return _chain_from_iterable_of_lists(results)
 
     def shutdown(self, wait=True, *, cancel_futures=False):
@@ -6,9 +6,11 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 from concurrent.futures import _base
+import collections
 import itertools
 import queue
 import threading
+import time
 import types
 import weakref
 import os
@@ -66,7 +68,132 @@ def run(self):
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
-def _worker(executor_reference, work_queue, initializer, initargs):
+class _WorkStealingQueue:
+    """A work queue made of one deque per worker thread.
+
+    It has the subset of the queue.SimpleQueue API used by the executor.
+    Items put from a worker thread go to the deque of that thread; other
+    items are spread over the deques in turn.  A worker takes the oldest
+    item of its own deque and, when it is empty, steals the oldest item of
+    another deque, so worker threads do not contend on a single lock.
+
+    A None sentinel is only returned once every deque is empty, so that the
+    items put before the sentinel are run first, as with a FIFO queue.
+    """
+
+    def __init__(self, num_deques):
+        deques = [collections.deque() for _ in range(num_deques)]
+        self._deques = deques
+        # For each deque index, the deques in the order they are looked at
+        # by its owner, so that thieves do not all start with the same one.
+        self._search_orders = [deques[i:] + deques[:i]
+                               for i in range(num_deques)]
+        self._next_deque = itertools.count().__next__
+        # Maps the ident of each worker thread to the index of its deque.
+        self._owners = {}
+        self._next_owner = itertools.count().__next__
+        # Protects _parked and _sentinels.
+        self._lock = threading.Lock()
+        # Locks that idle worker threads block on until an item is put.
+        self._parked = []
+        self._sentinels = 0
+
+    def add_worker(self, ident):
+        self._owners[ident] = self._next_owner() % len(self._deques)
+
+    def remove_worker(self, ident):
+        self._owners.pop(ident, None)
+
+    def _wake_one(self):
+        # Must be called with self._lock held.
+        if self._parked:
+            self._parked.pop().release()
+
+    def _unpark(self, waiter):
+        with self._lock:
+            try:
+                self._parked.remove(waiter)
+            except ValueError:
+                # The waiter was woken up concurrently: pass it on.
+                self._wake_one()
+
+    def put(self, item, block=True, timeout=None):
+        if item is None:
+            with self._lock:
+                self._sentinels += 1
+                self._wake_one()
+            return
+        index = self._owners.get(threading.get_ident())
+        if index is None:
+            index = self._next_deque() % len(self._deques)
+        self._deques[index].append(item)
+        if self._parked:
+            with self._lock:
+                self._wake_one()
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def _take(self, index):
+        for dq in self._search_orders[index]:
+            if dq:
+                try:
+                    return dq.popleft()
+                except IndexError:
+                    # Emptied concurrently by another worker.
+                    pass
+        with self._lock:
+            if self._sentinels:
+                self._sentinels -= 1
+                return None
+        raise queue.Empty
+
+    def get(self, block=True, timeout=None):
+        index = self._owners.get(threading.get_ident(), 0)
+        if timeout is not None:
+            endtime = time.monotonic() + timeout
+        while True:
+            try:
+                return self._take(index)
+            except queue.Empty:
+                if not block:
+                    raise
+            waiter = threading.Lock()
+            waiter.acquire()
+            with self._lock:
+                self._parked.append(waiter)
+            # An item may have been put before the waiter was parked.
+            try:
+                item = self._take(index)
+            except queue.Empty:
+                pass
+            else:
+                self._unpark(waiter)
+                return item
+            if timeout is None:
+                waiter.acquire()
+            else:
+                remaining = max(endtime - time.monotonic(), 0)
+                if not waiter.acquire(timeout=remaining):
+                    self._unpark(waiter)
+                    return self._take(index)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def empty(self):
+        return not any(self._deques) and not self._sentinels
+
+    def qsize(self):
+        return sum(map(len, self._deques)) + self._sentinels
+
+
+def _worker(executor_reference, work_queue, initializer, initargs,
+            finalizer=None):
+    if isinstance(work_queue, _WorkStealingQueue):
+        # Register before running anything, so that the calls submitted by
+        # the initializer are queued to this thread too.
+        work_queue.add_worker(threading.get_ident())
     if initializer is not None:
         try:
             initializer(*initargs)
@@ -83,10 +210,24 @@ def _worker(executor_reference, work_queue, initializer, initargs):
             except queue.Empty:
                 # attempt to increment idle count if queue is empty
                 executor = executor_reference()
+                idle_timeout = None
                 if executor is not None:
-                    executor._idle_semaphore.release()
+                    with executor._idle_lock:
+                        executor._idle_count += 1
+                    idle_timeout = executor._idle_timeout
                 del executor
-                work_item = work_queue.get(block=True)
+                while True:
+                    try:
+                        work_item = work_queue.get(block=True,
+                                                   timeout=idle_timeout)
+                        break
+                    except queue.Empty:
+                        # Exit if the worker has been idle for idle_timeout
+                        # seconds and the pool can shrink.
+                        executor = executor_reference()
+                        if executor is None or executor._retire_idle_worker():
+                            return
+                        del executor
 
             if work_item is not None:
                 work_item.run()
@@ -110,6 +251,16 @@ def _worker(executor_reference, work_queue, initializer, initargs):
             del executor
     except BaseException:
         _base.LOGGER.critical('Exception in worker', exc_info=True)
+    finally:
+        if finalizer is not None:
+            try:
+                finalizer()
+            except BaseException:
+                _base.LOGGER.critical('Exception in finalizer:',
+                                      exc_info=True)
+
+
+ThreadCounts = collections.namedtuple('ThreadCounts', ['live', 'idle', 'busy'])
 
 
 class BrokenThreadPool(_base.BrokenExecutor):
@@ -120,11 +271,14 @@ class BrokenThreadPool(_base.BrokenExecutor):
 
 class ThreadPoolExecutor(_base.Executor):
 
+    BROKEN = BrokenThreadPool
+
     # Used to assign unique thread names when thread_name_prefix is not supplied.
     _counter = itertools.count().__next__
 
     def __init__(self, max_workers=None, thread_name_prefix='',
-                 initializer=None, initargs=()):
+                 initializer=None, initargs=(), *, work_stealing=False,
+                 idle_timeout=None, min_workers=0):
         """Initializes a new ThreadPoolExecutor instance.
 
         Args:
@@ -133,6 +287,15 @@ def __init__(self, max_workers=None, thread_name_prefix='',
             thread_name_prefix: An optional name prefix to give our threads.
             initializer: A callable used to initialize worker threads.
             initargs: A tuple of arguments to pass to the initializer.
+            work_stealing: If True, each worker thread has its own queue of
+                calls and takes calls from the queues of the other workers
+                when its own is empty. Calls submitted from a worker thread
+                are queued to that thread.
+            idle_timeout: The number of seconds after which a worker thread
+                which has no call to execute exits. If None, worker threads
+                live as long as the executor.
+            min_workers: The number of worker threads which are kept alive
+                when idle_timeout is set.
         """
         if max_workers is None:
             # ThreadPoolExecutor is often used to:
@@ -149,10 +312,28 @@ def __init__(self, max_workers=None, thread_name_prefix='',
         if initializer is not None and not callable(initializer):
             raise TypeError("initializer must be a callable")
 
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be greater than 0")
+        if not 0 <= min_workers <= max_workers:
+            raise ValueError("min_workers must be between 0 and max_workers")
+
         self._max_workers = max_workers
-        self._work_queue = queue.SimpleQueue()
-        self._idle_semaphore = threading.Semaphore(0)
+        self._idle_timeout = idle_timeout
+        self._min_workers = min_workers
+        self._thread_counter = itertools.count().__next__
+        self._work_stealing = work_stealing
+        if work_stealing:
+            self._work_queue = _WorkStealingQueue(max_workers)
+        else:
+            self._work_queue = queue.SimpleQueue()
+        # The number of idle worker threads, which have not been handed a
+        # call yet.
+        self._idle_count = 0
+        self._idle_lock = threading.Lock()
         self._threads = set()
+        # Worker threads which exited after idle_timeout, joined by shutdown()
+        # until they are gone.
+        self._retired_threads = weakref.WeakSet()
         self._broken = False
         self._shutdown = False
         self._shutdown_lock = threading.Lock()
@@ -160,11 +341,14 @@ def __init__(self, max_workers=None, thread_name_prefix='',
                                     ("ThreadPoolExecutor-%d" % self._counter()))
         self._initializer = initializer
         self._initargs = initargs
+        # Called by each worker thread before it exits, if the initializer
+        # succeeded.
+        self._finalizer = None
 
     def submit(self, fn, /, *args, **kwargs):
         with self._shutdown_lock, _global_shutdown_lock:
             if self._broken:
-                raise BrokenThreadPool(self._broken)
+                raise self.BROKEN(self._broken)
 
             if self._shutdown:
                 raise RuntimeError('cannot schedule new futures after shutdown')
@@ -182,8 +366,10 @@ def submit(self, fn, /, *args, **kwargs):
 
     def _adjust_thread_count(self):
         # if idle threads are available, don't spin new threads
-        if self._idle_semaphore.acquire(timeout=0):
-            return
+        with self._idle_lock:
+            if self._idle_count:
+                self._idle_count -= 1
+                return
 
         # When the executor gets lost, the weakref callback will wake up
         # the worker threads.
@@ -193,16 +379,47 @@ def weakref_cb(_, q=self._work_queue):
         num_threads = len(self._threads)
         if num_threads < self._max_workers:
             thread_name = '%s_%d' % (self._thread_name_prefix or self,
-                                     num_threads)
+                                     self._thread_counter())
             t = threading.Thread(name=thread_name, target=_worker,
                                  args=(weakref.ref(self, weakref_cb),
                                        self._work_queue,
                                        self._initializer,
-                                       self._initargs))
+                                       self._initargs,
+                                       self._finalizer))
             t.start()
             self._threads.add(t)
             _threads_queues[t] = self._work_queue
 
+    def _retire_idle_worker(self):
+        # Called by a worker thread which has been idle for idle_timeout
+        # seconds.  Return True if it must exit.
+        with self._shutdown_lock:
+            if (_shutdown or self._shutdown
+                    or len(self._threads) <= self._min_workers):
+                return False
+            # Take back the idle count added by the worker.  If it was
+            # already taken, a call has been submitted for it to run.
+            with self._idle_lock:
+                if not self._idle_count:
+                    return False
+                self._idle_count -= 1
+            t = threading.current_thread()
+            self._threads.discard(t)
+            # The thread stays in _threads_queues, so that _python_exit()
+            # joins it if it is still running.
+            self._retired_threads.add(t)
+            if self._work_stealing:
+                self._work_queue.remove_worker(t.ident)
+            return True
+
+    def thread_counts(self):
+        """Returns a ThreadCounts named tuple with the number of worker
+        threads which are alive, idle and busy running a call."""
+        with self._shutdown_lock:
+            live = len(self._threads)
+            idle = min(self._idle_count, live)
+        return ThreadCounts(live, idle, live - idle)
+
     def _initializer_failed(self):
         with self._shutdown_lock:
             self._broken = ('A thread initializer failed, the thread pool '
@@ -214,7 +431,7 @@ def _initializer_failed(self):
                 except queue.Empty:
                     break
                 if work_item is not None:
-                    work_item.future.set_exception(BrokenThreadPool(self._broken))
+                    work_item.future.set_exception(self.BROKEN(self._broken))
 
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
@@ -234,6 +451,6 @@ def shutdown(self, wait=True, *, cancel_futures=False):
             # _work_queue.get(block=True) from permanently blocking.
             self._work_queue.put(None)
         if wait:
-            for t in self._threads:
+            for t in list(self._threads) + list(self._retired_threads):
                 t.join()
     shutdown.__doc__ = _base.Executor.shutdown.__doc__
@@ -31,9 +31,11 @@
 
 
 __all__ = ['BASIC_FORMAT', 'BufferingFormatter', 'CRITICAL', 'DEBUG', 'ERROR',
-           'FATAL', 'FileHandler', 'Filter', 'Formatter', 'Handler', 'INFO',
-           'LogRecord', 'Logger', 'LoggerAdapter', 'NOTSET', 'NullHandler',
-           'StreamHandler', 'WARN', 'WARNING', 'addLevelName', 'basicConfig',
+           'DuplicateFilter', 'FATAL', 'FileHandler', 'Filter', 'Formatter',
+           'Handler', 'INFO', 'JSONFormatter', 'LogRecord', 'Logger',
+           'LoggerAdapter', 'NOTSET', 'NullHandler', 'RateLimitingFilter',
+           'SamplingFilter', 'StreamHandler', 'WARN', 'WARNING',
+           'addLevelName', 'basicConfig',
            'captureWarnings', 'critical', 'debug', 'disable', 'error',
            'exception', 'fatal', 'getLevelName', 'getLogger', 'getLoggerClass',
            'info', 'log', 'makeLogRecord', 'setLoggerClass', 'shutdown',
@@ -84,6 +86,13 @@
 #
 logAsyncioTasks = True
 
+#
+# If you want log records to only collect the information about the caller,
+# the thread, the process and the asyncio task which is used by the
+# formatters of the handlers, set this to True
+#
+leanRecords = False
+
 #---------------------------------------------------------------------------
 #   Level related stuff
 #---------------------------------------------------------------------------
@@ -191,6 +200,10 @@ def currentframe():
 # Setting _srcfile to None will prevent findCaller() from being called. This
 # way, you can avoid the overhead of fetching caller information.
 
+# The record attributes which need findCaller().
+_CALLER_FIELDS = frozenset(('pathname', 'filename', 'module', 'lineno',
+                            'funcName'))
+
 # The following is based on warnings._is_internal_frame. It makes sure that
 # frames of the import mechanism are skipped when logging at module level and
 # using a stacklevel value greater than one.
@@ -296,9 +309,15 @@ class LogRecord(object):
     information to be logged.
     """
     def __init__(self, name, level, pathname, lineno,
-                 msg, args, exc_info, func=None, sinfo=None, **kwargs):
+                 msg, args, exc_info, func=None, sinfo=None, *, fields=None,
+                 **kwargs):
         """
         Initialize a logging record with interesting information.
+
+        If fields is not None, it is the set of the attributes which are
+        used: the file name, module, thread name, process name, process ID
+        and asyncio task name are only computed if they are in it, and are
+        None otherwise.
         """
         ct = time.time_ns()
         self.name = name
@@ -328,12 +347,15 @@ def __init__(self, name, level, pathname, lineno,
         self.levelname = getLevelName(level)
         self.levelno = level
         self.pathname = pathname
-        try:
-            self.filename = os.path.basename(pathname)
-            self.module = os.path.splitext(self.filename)[0]
-        except (TypeError, ValueError, AttributeError):
-            self.filename = pathname
-            self.module = "Unknown module"
+        if fields is None or 'filename' in fields or 'module' in fields:
+            try:
+                self.filename = os.path.basename(pathname)
+                self.module = os.path.splitext(self.filename)[0]
+            except (TypeError, ValueError, AttributeError):
+                self.filename = pathname
+                self.module = "Unknown module"
+        else:
+            self.filename = self.module = None
         self.exc_info = exc_info
         self.exc_text = None      # used to cache the traceback text
         self.stack_info = sinfo
@@ -352,12 +374,17 @@ def __init__(self, name, level, pathname, lineno,
         self.relativeCreated = (ct - _startTime) / 1e6
         if logThreads:
             self.thread = threading.get_ident()
-            self.threadName = threading.current_thread().name
+            if fields is None or 'threadName' in fields:
+                self.threadName = threading.current_thread().name
+            else:
+                self.threadName = None
         else: # pragma: no cover
             self.thread = None
             self.threadName = None
         if not logMultiprocessing: # pragma: no cover
             self.processName = None
+        elif fields is not None and 'processName' not in fields:
+            self.processName = None
         else:
             self.processName = 'MainProcess'
             mp = sys.modules.get('multiprocessing')
@@ -370,13 +397,14 @@ def __init__(self, name, level, pathname, lineno,
                     self.processName = mp.current_process().name
                 except Exception: #pragma: no cover
                     pass
-        if logProcesses and hasattr(os, 'getpid'):
+        if (logProcesses and hasattr(os, 'getpid')
+            and (fields is None or 'process' in fields)):
             self.process = os.getpid()
         else:
             self.process = None
 
         self.taskName = None
-        if logAsyncioTasks:
+        if logAsyncioTasks and (fields is None or 'taskName' in fields):
             asyncio = sys.modules.get('asyncio')
             if asyncio:
                 try:
@@ -447,6 +475,7 @@ class PercentStyle(object):
     asctime_format = '%(asctime)s'
     asctime_search = '%(asctime)'
     validation_pattern = re.compile(r'%\(\w+\)[#0+ -]*(\*|\d+)?(\.(\*|\d+))?[diouxefgcrsa%]', re.I)
+    field_pattern = re.compile(r'%\(([^)]*)\)')
 
     def __init__(self, fmt, *, defaults=None):
         self._fmt = fmt or self.default_format
@@ -455,6 +484,10 @@ def __init__(self, fmt, *, defaults=None):
     def usesTime(self):
         return self._fmt.find(self.asctime_search) >= 0
 
+    def usedFields(self):
+        """Return the names of the fields used by the format"""
+        return frozenset(self.field_pattern.findall(self._fmt))
+
     def validate(self):
         """Validate the input format, ensure it matches the correct style"""
         if not self.validation_pattern.search(self._fmt):
@@ -489,6 +522,18 @@ def _format(self, record):
             values = record.__dict__
         return self._fmt.format(**values)
 
+    def usedFields(self):
+        fields = set()
+        formats = [self._fmt]
+        while formats:
+            for _, fieldname, spec, _ in _str_formatter.parse(formats.pop()):
+                if fieldname:
+                    fields.add(re.match(r'[^.[]*', fieldname).group())
+                if spec:
+                    # The format spec can contain nested fields.
+                    formats.append(spec)
+        return frozenset(fields)
+
     def validate(self):
         """Validate the input format, ensure it is the correct string formatting style"""
         fields = set()
@@ -521,6 +566,9 @@ def usesTime(self):
         fmt = self._fmt
         return fmt.find('$asctime') >= 0 or fmt.find(self.asctime_search) >= 0
 
+    def usedFields(self):
+        return frozenset(self._tpl.get_identifiers())
+
     def validate(self):
         pattern = Template.pattern
         fields = set()
@@ -596,6 +644,8 @@ class Formatter(object):
     """
 
     converter = time.localtime
+    _time_cache = None
+    _fields_cache = None
 
     def __init__(self, fmt=None, datefmt=None, style='%', validate=True, *,
                  defaults=None):
@@ -644,14 +694,22 @@ def formatTime(self, record, datefmt=None):
         signature as time.localtime() or time.gmtime(). To change it for all
         formatters, for example if you want all logging times to be shown in GMT,
         set the 'converter' attribute in the Formatter class.
+
+        The formatted time is cached until the next second, since the format
+        cannot depend on the fractional part of the time.
         """
-        ct = self.converter(record.created)
-        if datefmt:
-            s = time.strftime(datefmt, ct)
+        converter = self.converter
+        fmt = datefmt or self.default_time_format
+        second = record.created // 1
+        cache = self._time_cache
+        if (cache is not None and cache[0] == second and cache[1] == fmt
+            and cache[2] == converter):
+            s = cache[3]
         else:
-            s = time.strftime(self.default_time_format, ct)
-            if self.default_msec_format:
-                s = self.default_msec_format % (s, record.msecs)
+            s = time.strftime(fmt, converter(record.created))
+            self._time_cache = (second, fmt, converter, s)
+        if not datefmt and self.default_msec_format:
+            s = self.default_msec_format % (s, record.msecs)
         return s
 
     def formatException(self, ei):
@@ -679,6 +737,29 @@ def usesTime(self):
         """
         return self._style.usesTime()
 
+    def usedFields(self):
+        """
+        Return the set of the names of the record attributes used by format().
+
+        Return None if they are not known, which is the case when format() or
+        formatMessage() are overridden, or when the format is invalid.
+        """
+        cls = type(self)
+        if (cls.format is not Formatter.format
+            or cls.formatMessage is not Formatter.formatMessage):
+            return None
+        # This is called for each record when leanRecords is true.
+        fmt = self._style._fmt
+        cache = self._fields_cache
+        if cache is not None and cache[0] is fmt:
+            return cache[1]
+        try:
+            fields = self._style.usedFields()
+        except ValueError:
+            fields = None
+        self._fields_cache = (fmt, fields)
+        return fields
+
     def formatMessage(self, record):
         return self._style.format(record)
 
@@ -770,6 +851,148 @@ def format(self, records):
             rv = rv + self.formatFooter(records)
         return rv
 
+_INF = float('inf')
+
+class JSONFormatter(Formatter):
+    """
+    Formatter instances which format a record as a JSON object on one line.
+
+    The object contains the selected fields of the record and, unless extra
+    is false, the attributes which were added to the record with the extra
+    argument of the logging methods.  The other attributes of the record are
+    not looked at.
+
+    fields is a sequence of the names of the record attributes to output, or
+    a mapping of the keys of the JSON object to these names.  The "message"
+    and "asctime" fields are computed like by Formatter.format().  Fields
+    which the record does not have are taken from defaults if it has them,
+    otherwise they are omitted.  If there is exception or stack information,
+    it is formatted like by Formatter.format() and output under the
+    "exc_info" and "stack_info" keys.
+
+    Values which are not JSON serializable, including non-finite floats, are
+    converted with str().  Attributes which are added to the records by a
+    custom record factory (see setLogRecordFactory()) or by filters are
+    output as extras.
+    """
+
+    default_fields = ('asctime', 'levelname', 'name', 'message')
+
+    def __init__(self, fields=None, datefmt=None, *, defaults=None,
+                 extra=True, ensure_ascii=True):
+        """
+        Initialize the formatter with the specified fields and date format.
+
+        If fields is not specified, default_fields is used.
+        """
+        import json.encoder
+
+        Formatter.__init__(self, datefmt=datefmt)
+        if fields is None:
+            fields = self.default_fields
+        if hasattr(fields, 'items'):
+            items = list(fields.items())
+        else:
+            items = [(name, name) for name in fields]
+        for key, name in items:
+            if not isinstance(key, str) or not isinstance(name, str):
+                raise TypeError('JSONFormatter fields must be strings, not %r'
+                                % ((key, name),))
+        self.fields = dict(items)
+        self.defaults = defaults or {}
+        self.extra = extra
+        self.ensure_ascii = ensure_ascii
+        if ensure_ascii:
+            self._encode_str = json.encoder.encode_basestring_ascii
+        else:
+            self._encode_str = json.encoder.encode_basestring
+        # The C encoder is used for the values which are not strings.
+        self._encode = json.encoder.JSONEncoder(
+            ensure_ascii=ensure_ascii, allow_nan=False, separators=(',', ':'),
+            default=str).encode
+        # The keys are encoded once, with the separator which follows them.
+        self._fields = [(self._encode_str(key) + ':', name)
+                        for key, name in items]
+        self._names = frozenset(self.fields.values())
+        self._uses_message = 'message' in self._names
+        self._uses_time = 'asctime' in self._names
+        self._exc_info_key = self._encode_str('exc_info') + ':'
+        self._stack_info_key = self._encode_str('stack_info') + ':'
+        # Any other attribute is an extra.
+        self._reserved = (frozenset(LogRecord(None, None, '', 0, '', (), None)
+                                    .__dict__)
+                          | {'message', 'asctime'} | self._names)
+
+    def usesTime(self):
+        """
+        Check if the fields include the creation time of the record.
+        """
+        return self._uses_time
+
+    def usedFields(self):
+        """
+        Return the set of the names of the record attributes used by format(),
+        or None if format() is overridden.
+        """
+        if type(self).format is not JSONFormatter.format:
+            return None
+        return self._names
+
+    def _encodeValue(self, value):
+        t = type(value)
+        if t is str:
+            return self._encode_str(value)
+        if t is int:
+            return int.__repr__(value)
+        if t is float and -_INF < value < _INF:
+            return float.__repr__(value)
+        if value is None:
+            return 'null'
+        try:
+            return self._encode(value)
+        except (TypeError, ValueError):
+            # NaN and infinities are not valid JSON, and neither are the keys
+            # of a dict which are not strings, numbers or None.
+            return self._encode_str(str(value))
+
+    def format(self, record):
+        """
+        Format the specified record as a JSON object.
+        """
+        if self._uses_message:
+            record.message = record.getMessage()
+        if self._uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+        values = record.__dict__
+        defaults = self.defaults
+        encode = self._encodeValue
+        parts = []
+        for key, name in self._fields:
+            try:
+                value = values[name]
+            except KeyError:
+                if name not in defaults:
+                    continue
+                value = defaults[name]
+            parts.append(key + encode(value))
+        if record.exc_info:
+            # Cache the traceback text to avoid converting it multiple times
+            # (it's constant anyway)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            parts.append(self._exc_info_key + self._encode_str(record.exc_text))
+        if record.stack_info:
+            parts.append(self._stack_info_key +
+                         self._encode_str(self.formatStack(record.stack_info)))
+        if self.extra:
+            reserved = self._reserved
+            encode_str = self._encode_str
+            for name, value in values.items():
+                if name not in reserved:
+                    parts.append(encode_str(name) + ':' + encode(value))
+        return '{' + ','.join(parts) + '}'
+
 #---------------------------------------------------------------------------
 #   Filter classes and functions
 #---------------------------------------------------------------------------
@@ -828,6 +1051,8 @@ def addFilter(self, filter):
         """
         if not (filter in self.filters):
             self.filters.append(filter)
+            if isinstance(filter, _MessageFilter):
+                filter._owners.add(self)
 
     def removeFilter(self, filter):
         """
@@ -835,6 +1060,8 @@ def removeFilter(self, filter):
         """
         if filter in self.filters:
             self.filters.remove(filter)
+            if isinstance(filter, _MessageFilter):
+                filter._owners.discard(self)
 
     def filter(self, record):
         """
@@ -872,6 +1099,257 @@ def filter(self, record):
                 record = result
         return record
 
+_messageFilters = weakref.WeakSet()  # flushed by shutdown()
+
+class _MessageFilter(Filter):
+    """
+    Base class for the filters which decide from the logger name, the level
+    and the message of an event, so that a logger can apply them before the
+    record is created.
+    """
+    def __init__(self):
+        Filter.__init__(self)
+        # The message admitted by filterMessage() in this thread, and the
+        # number of suppressed messages to report, for filter() to pass the
+        # record created for it without deciding again.  Logger._log() drops
+        # it once the record was handled.
+        self._admitted = threading.local()
+        # The loggers and handlers the filter is attached to, which are
+        # passed the records reporting the suppressed messages.
+        self._owners = weakref.WeakSet()
+        _messageFilters.add(self)
+
+    def _popSummaries(self, flush):
+        """
+        Return the (name, level, msg, args, suppressed) tuples of the last
+        message suppressed for each key whose suppressed messages are to be
+        reported on their own, and reset their count.  If flush is true, all
+        the suppressed messages are to be reported.
+        """
+        return []
+
+    def _logSummaries(self, summaries):
+        for name, level, msg, args, suppressed in summaries:
+            record = _logRecordFactory(name, level, "", 0, msg, args, None,
+                                       None)
+            record.msg = '%s (%d similar messages suppressed)' % (
+                record.getMessage(), suppressed)
+            record.args = None
+            for owner in list(self._owners):
+                if isinstance(owner, Logger) and owner.name != name:
+                    # The filters of a logger only see its own events.
+                    continue
+                previous = getattr(self._admitted, 'value', None)
+                # Let the record pass this filter.
+                self._admitted.value = (record.msg, 0)
+                try:
+                    owner.handle(record)
+                finally:
+                    self._admitted.value = previous
+
+    def flush(self):
+        """
+        Report the messages suppressed since the last message like them was
+        logged, if any, to the loggers and handlers the filter is attached to.
+
+        This is called by shutdown().
+        """
+        self._logSummaries(self._popSummaries(True))
+
+    def _admit(self, name, level, msg, args):
+        """
+        Return the number of messages suppressed since the last admitted one
+        like this one, or -1 if this message is to be suppressed.
+        """
+        raise NotImplementedError('_admit must be implemented '
+                                  'by _MessageFilter subclasses')
+
+    def filterMessage(self, name, level, msg, args):
+        """
+        Determine if an event is to be logged, before its record is created.
+
+        This is called by the logging methods of the loggers the filter is
+        attached to, with the name of the logger and the level, message and
+        arguments of the event.  Return True if the event should be logged,
+        or False otherwise.
+        """
+        suppressed = self._admit(name, level, msg, args)
+        if suppressed < 0:
+            return False
+        self._admitted.value = (msg, suppressed)
+        return True
+
+    def filter(self, record):
+        """
+        Determine if the specified record is to be logged.
+
+        If messages like it were suppressed, return a copy of the record whose
+        message reports their number.
+        """
+        admitted = getattr(self._admitted, 'value', None)
+        if admitted is not None and admitted[0] is record.msg:
+            # The record of the event admitted by filterMessage().
+            self._admitted.value = None
+            suppressed = admitted[1]
+        else:
+            suppressed = self._admit(record.name, record.levelno, record.msg,
+                                     record.args)
+            if suppressed < 0:
+                return False
+        if not suppressed:
+            return True
+        record = makeLogRecord(record.__dict__)
+        record.msg = '%s (%d similar messages suppressed)' % (
+            record.getMessage(), suppressed)
+        record.args = None
+        return record
+
+class SamplingFilter(_MessageFilter):
+    """
+    Filter which passes a random sample of the events, each with probability
+    rate.
+    """
+    def __init__(self, rate):
+        """
+        Initialize the filter with the probability of passing an event,
+        between 0.0 and 1.0.
+        """
+        from random import random
+
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError('rate must be between 0.0 and 1.0')
+        _MessageFilter.__init__(self)
+        self.rate = rate
+        self._random = random
+
+    def _admit(self, name, level, msg, args):
+        return 0 if self._random() < self.rate else -1
+
+class RateLimitingFilter(_MessageFilter):
+    """
+    Filter which limits the rate of the events of each logger and message
+    template, with a token bucket.
+
+    The events with the same logger name and message template (the msg
+    argument of the logging methods) can pass at an average of rate events
+    per second, in bursts of up to burst events.  The others are suppressed,
+    and their number is reported in the message of the next event which
+    passes.  If no such event comes by the time one could pass, the number
+    is reported with the last suppressed message when the filter is next
+    called, or by flush().  The state of at most maxKeys different messages
+    is kept, the oldest one is dropped after that.
+    """
+    def __init__(self, rate, burst=1, maxKeys=1000):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if burst < 1:
+            raise ValueError('burst must be at least 1')
+        _MessageFilter.__init__(self)
+        self.rate = rate
+        self.burst = burst
+        self.maxKeys = maxKeys
+        # Map the keys of the messages to their number of tokens, the time
+        # at which it was computed, the number of suppressed messages and
+        # the (name, level, msg, args) of the last one.
+        self._buckets = {}
+        # The keys with suppressed messages, and the earliest time at which
+        # one of them can pass.
+        self._pending = {}
+        self._nextReport = float('inf')
+        self._lock = threading.Lock()
+
+    def _key(self, name, msg, args):
+        return (name, msg)
+
+    def _admit(self, name, level, msg, args):
+        key = self._key(name, msg, args)
+        try:
+            hash(key)
+        except TypeError:
+            # An unhashable message or arguments.
+            key = repr(key)
+        now = time.monotonic()
+        buckets = self._buckets
+        pending = self._pending
+        summaries = None
+        with self._lock:
+            bucket = buckets.get(key)
+            if bucket is None:
+                if len(buckets) >= self.maxKeys:
+                    oldest = next(iter(buckets))
+                    old = buckets.pop(oldest)
+                    if old[2]:
+                        del pending[oldest]
+                        summaries = [(*old[3], old[2])]
+                buckets[key] = [self.burst - 1, now, 0, None]
+                suppressed = 0
+            else:
+                tokens = min(self.burst,
+                             bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+                if tokens < 1:
+                    bucket[0] = tokens
+                    if not bucket[2]:
+                        pending[key] = bucket
+                        self._nextReport = min(self._nextReport,
+                                               now + (1 - tokens) / self.rate)
+                    bucket[2] += 1
+                    bucket[3] = (name, level, msg, args)
+                    suppressed = -1
+                else:
+                    suppressed = bucket[2]
+                    bucket[0] = tokens - 1
+                    bucket[2] = 0
+                    bucket[3] = None
+                    if suppressed:
+                        del pending[key]
+            if now >= self._nextReport:
+                summaries = (summaries or []) + self._popReady(now, False)
+        if summaries:
+            self._logSummaries(summaries)
+        return suppressed
+
+    def _popReady(self, now, flush):
+        # Called with the lock held.  Report the keys which have suppressed
+        # messages and a token to pass one more.
+        summaries = []
+        nextReport = float('inf')
+        for key, bucket in list(self._pending.items()):
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            if tokens >= 1 or flush:
+                summaries.append((*bucket[3], bucket[2]))
+                bucket[0] = max(tokens - 1, 0)
+                bucket[1] = now
+                bucket[2] = 0
+                bucket[3] = None
+                del self._pending[key]
+            else:
+                nextReport = min(nextReport, now + (1 - tokens) / self.rate)
+        self._nextReport = nextReport
+        return summaries
+
+    def _popSummaries(self, flush):
+        with self._lock:
+            return self._popReady(time.monotonic(), flush)
+
+class DuplicateFilter(RateLimitingFilter):
+    """
+    Filter which suppresses the duplicates of an event for some time.
+
+    After an event passes, the events of the same logger with the same
+    message and arguments are suppressed for interval seconds.  The number of
+    suppressed events is reported in the message of the next one which
+    passes.
+    """
+    def __init__(self, interval=60.0, maxKeys=1000):
+        if interval <= 0:
+            raise ValueError('interval must be positive')
+        RateLimitingFilter.__init__(self, 1.0 / interval, 1, maxKeys)
+        self.interval = interval
+
+    def _key(self, name, msg, args):
+        return (name, msg, args)
+
 #---------------------------------------------------------------------------
 #   Handler classes and functions
 #---------------------------------------------------------------------------
@@ -997,6 +1475,25 @@ def format(self, record):
             fmt = _defaultFormatter
         return fmt.format(record)
 
+    def usedFields(self):
+        """
+        Return the set of the names of the record attributes used by this
+        handler, or None if they are not known.
+
+        This is used to collect only the information which is needed when
+        leanRecords is true.  The default implementation returns the fields
+        used by the formatter, or None if the handler has filters, which could
+        use any field.  Handlers which use more than the formatted record
+        should override this method.
+        """
+        if self.filters:
+            return None
+        if self.formatter:
+            fmt = self.formatter
+        else:
+            fmt = _defaultFormatter
+        return fmt.usedFields()
+
     def emit(self, record):
         """
         Do whatever it takes to actually log the specified logging record.
@@ -1007,6 +1504,16 @@ def emit(self, record):
         raise NotImplementedError('emit must be implemented '
                                   'by Handler subclasses')
 
+    def emitBatch(self, records):
+        """
+        Emit a batch of logging records.
+
+        This version calls emit() for each record.  Subclasses can override
+        it to output the records at once, for example with a single write.
+        """
+        for record in records:
+            self.emit(record)
+
     def handle(self, record):
         """
         Conditionally emit the specified logging record.
@@ -1026,6 +1533,25 @@ def handle(self, record):
                 self.emit(record)
         return rv
 
+    def handleBatch(self, records):
+        """
+        Conditionally emit a batch of logging records.
+
+        Each record is filtered like by handle(), then the records which
+        passed the filters are emitted with emitBatch(), with the I/O thread
+        lock acquired once.
+        """
+        batch = []
+        for record in records:
+            rv = self.filter(record)
+            if isinstance(rv, LogRecord):
+                record = rv
+            if rv:
+                batch.append(record)
+        if batch:
+            with self.lock:
+                self.emitBatch(batch)
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -1157,6 +1683,38 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def emitBatch(self, records):
+        """
+        Emit a batch of records.
+
+        The formatted records are written to the stream with a single write,
+        then the stream is flushed once.  If a subclass overrides emit(), it
+        is called for each record instead.
+        """
+        if type(self).emit is not StreamHandler.emit:
+            Handler.emitBatch(self, records)
+            return
+        self._writeBatch(records)
+
+    def _writeBatch(self, records):
+        msgs = []
+        for record in records:
+            try:
+                msgs.append(self.format(record) + self.terminator)
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+        if not msgs:
+            return
+        try:
+            self.stream.write(''.join(msgs))
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(records[-1])
+
     def setStream(self, stream):
         """
         Sets the StreamHandler's stream to the specified value,
@@ -1263,6 +1821,23 @@ def emit(self, record):
         if self.stream:
             StreamHandler.emit(self, record)
 
+    def emitBatch(self, records):
+        """
+        Emit a batch of records.
+
+        The formatted records are written to the file with a single write,
+        like by StreamHandler.emitBatch().  If a subclass overrides emit(),
+        it is called for each record instead.
+        """
+        if type(self).emit is not FileHandler.emit:
+            Handler.emitBatch(self, records)
+            return
+        if self.stream is None:
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+        if self.stream:
+            self._writeBatch(records)
+
     def __repr__(self):
         level = getLevelName(self.level)
         return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, level)
@@ -1623,13 +2198,20 @@ def findCaller(self, stack_info=False, stacklevel=1):
         return co.co_filename, f.f_lineno, co.co_name, sinfo
 
     def makeRecord(self, name, level, fn, lno, msg, args, exc_info,
-                   func=None, extra=None, sinfo=None):
+                   func=None, extra=None, sinfo=None, *, fields=None):
         """
         A factory method which can be overridden in subclasses to create
         specialized LogRecords.
+
+        fields is only passed when leanRecords is true and neither this
+        method nor the record factory were replaced, see LogRecord.
         """
-        rv = _logRecordFactory(name, level, fn, lno, msg, args, exc_info, func,
-                             sinfo)
+        if fields is None:
+            rv = _logRecordFactory(name, level, fn, lno, msg, args, exc_info,
+                                   func, sinfo)
+        else:
+            rv = _logRecordFactory(name, level, fn, lno, msg, args, exc_info,
+                                   func, sinfo, fields=fields)
         if extra is not None:
             for key in extra:
                 if (key in ["message", "asctime"]) or (key in rv.__dict__):
@@ -1643,25 +2225,95 @@ def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False,
         Low-level logging routine which creates a LogRecord and then calls
         all the handlers of this logger to handle the record.
         """
-        sinfo = None
-        if _srcfile:
-            #IronPython doesn't track Python frames, so findCaller raises an
-            #exception on some versions of IronPython. We trap it here so that
-            #IronPython can use logging.
-            try:
-                fn, lno, func, sinfo = self.findCaller(stack_info, stacklevel)
-            except ValueError: # pragma: no cover
+        admitted = None
+        if self.filters:
+            admitted = self._filterMessage(level, msg, args)
+            if admitted is None:
+                return
+        try:
+            sinfo = None
+            fields = None
+            if (leanRecords and _logRecordFactory is LogRecord
+                    and type(self).makeRecord is Logger.makeRecord):
+                # Custom factories and makeRecord() overrides may not accept
+                # fields: they are given complete records.
+                fields = self._usedFields()
+            if _srcfile and (stack_info or fields is None
+                             or not fields.isdisjoint(_CALLER_FIELDS)):
+                #IronPython doesn't track Python frames, so findCaller raises
+                #an exception on some versions of IronPython. We trap it here
+                #so that IronPython can use logging.
+                try:
+                    fn, lno, func, sinfo = self.findCaller(stack_info,
+                                                           stacklevel)
+                except ValueError: # pragma: no cover
+                    fn, lno, func = "(unknown file)", 0, "(unknown function)"
+            else:
                 fn, lno, func = "(unknown file)", 0, "(unknown function)"
-        else: # pragma: no cover
-            fn, lno, func = "(unknown file)", 0, "(unknown function)"
-        if exc_info:
-            if isinstance(exc_info, BaseException):
-                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
-            elif not isinstance(exc_info, tuple):
-                exc_info = sys.exc_info()
-        record = self.makeRecord(self.name, level, fn, lno, msg, args,
-                                 exc_info, func, extra, sinfo)
-        self.handle(record)
+            if exc_info:
+                if isinstance(exc_info, BaseException):
+                    exc_info = (type(exc_info), exc_info,
+                                exc_info.__traceback__)
+                elif not isinstance(exc_info, tuple):
+                    exc_info = sys.exc_info()
+            if fields is None:
+                record = self.makeRecord(self.name, level, fn, lno, msg, args,
+                                         exc_info, func, extra, sinfo)
+            else:
+                record = self.makeRecord(self.name, level, fn, lno, msg, args,
+                                         exc_info, func, extra, sinfo,
+                                         fields=fields)
+            self.handle(record)
+        finally:
+            if admitted:
+                # Drop the admissions which were not consumed by the filters,
+                # because the logger is disabled or another filter rejected
+                # the record, so that they cannot apply to another record.
+                for f in admitted:
+                    f._admitted.value = None
+
+    def _filterMessage(self, level, msg, args):
+        """
+        Consult the filters which can decide before the record is created,
+        such as RateLimitingFilter.
+
+        Return None if one of them rejects the event, otherwise the list of
+        the _MessageFilter instances which admitted it.
+        """
+        admitted = []
+        for f in self.filters:
+            filterMessage = getattr(f, 'filterMessage', None)
+            if filterMessage is not None:
+                if not filterMessage(self.name, level, msg, args):
+                    return None
+                if isinstance(f, _MessageFilter):
+                    admitted.append(f)
+        return admitted
+
+    def _usedFields(self):
+        """
+        Return the set of the record attributes used by the filters of this
+        logger and by the handlers which callHandlers() would call, or None
+        if they are not known.
+        """
+        if self.filters:
+            return None
+        fields = set()
+        found = False
+        c = self
+        while c:
+            for hdlr in c.handlers:
+                found = True
+                used = hdlr.usedFields()
+                if used is None:
+                    return None
+                fields |= used
+            if not c.propagate:
+                break
+            c = c.parent
+        if not found and lastResort:
+            return lastResort.usedFields()
+        return fields
 
     def handle(self, record):
         """
@@ -2228,6 +2880,14 @@ def shutdown(handlerList=_handlerList):
 
     Should be called at application exit.
     """
+    # Report the messages suppressed by the filters before the handlers are
+    # closed.
+    for f in list(_messageFilters):
+        try:
+            f.flush()
+        except: # ignore everything, as we're shutting down
+            if raiseExceptions:
+                raise
     for wr in reversed(handlerList[:]):
         #errors might occur, for example, if files are locked
         #we just ignore them if raiseExceptions is not set
@@ -720,9 +720,15 @@ def configure_formatter(self, config):
             if defaults is not None:
                 kwargs['defaults'] = defaults
 
+            if isinstance(c, type) and issubclass(c, logging.JSONFormatter):
+                # JSONFormatter takes fields instead of a format and a style.
+                for name in ('extra', 'ensure_ascii'):
+                    if name in config:
+                        kwargs[name] = config[name]
+                result = c(config.get('fields', None), dfmt, **kwargs)
             # A TypeError would be raised if "validate" key is passed in with a formatter callable
             # that does not accept "validate" as a parameter
-            if 'validate' in config:  # if user hasn't mentioned it, the default will be fine
+            elif 'validate' in config:  # if user hasn't mentioned it, the default will be fine
                 result = c(fmt, dfmt, style, config['validate'], **kwargs)
             else:
                 result = c(fmt, dfmt, style, **kwargs)
@@ -756,11 +762,16 @@ def _configure_queue_handler(self, klass, **kwargs):
         else:
             q = queue.Queue()  # unbounded
 
-        rhl = kwargs.pop('respect_handler_level', False)
+        lkwargs = {'respect_handler_level':
+                       kwargs.pop('respect_handler_level', False)}
+        # Only passed if configured, custom listeners may not support them.
+        for name in ('batch_size', 'batch_timeout'):
+            if name in kwargs:
+                lkwargs[name] = kwargs.pop(name)
         lklass = kwargs.pop('listener', logging.handlers.QueueListener)
         handlers = kwargs.pop('handlers', [])
 
-        listener = lklass(q, *handlers, respect_handler_level=rhl)
+        listener = lklass(q, *handlers, **lkwargs)
         handler = klass(q, **kwargs)
         handler.listener = listener
         return handler
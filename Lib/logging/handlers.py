@@ -32,8 +32,10 @@
 import re
 import socket
 import struct
+import sys
 import threading
 import time
+import traceback
 
 #
 # Some constants...
@@ -57,9 +59,13 @@ class BaseRotatingHandler(logging.FileHandler):
     namer = None
     rotator = None
 
-    def __init__(self, filename, mode, encoding=None, delay=False, errors=None):
+    def __init__(self, filename, mode, encoding=None, delay=False, errors=None,
+                 *, background=False):
         """
         Use the specified filename for streamed logging
+
+        If background is true, the files are rotated on a background thread,
+        see doRollover().
         """
         logging.FileHandler.__init__(self, filename, mode=mode,
                                      encoding=encoding, delay=delay,
@@ -67,6 +73,10 @@ def __init__(self, filename, mode, encoding=None, delay=False, errors=None):
         self.mode = mode
         self.encoding = encoding
         self.errors = errors
+        self.background = background
+        self._rotations = None
+        self._rotationThread = None
+        self._rotationCount = 0
 
     def emit(self, record):
         """
@@ -122,13 +132,77 @@ def rotate(self, source, dest):
         else:
             self.rotator(source, dest)
 
+    def close(self):
+        """
+        Close the stream, and wait for the rotations which are done in the
+        background.
+        """
+        try:
+            logging.FileHandler.close(self)
+        finally:
+            thread = self._rotationThread
+            if thread is not None:
+                self._rotationThread = None
+                self._rotations.put(None)
+                thread.join()
+
+    def _moveAside(self):
+        """
+        Rename the base file to a temporary name, so that a new base file can
+        be opened while the old one is rotated in the background.
+
+        Return the temporary name, or None if the base file does not exist.
+        """
+        if not os.path.exists(self.baseFilename):
+            return None
+        # Another process may rotate the same file, or may have left a file
+        # behind, which must not be replaced.
+        while True:
+            self._rotationCount += 1
+            source = "%s.rotating.%d.%d" % (self.baseFilename, os.getpid(),
+                                            self._rotationCount)
+            if not os.path.exists(source):
+                break
+        os.replace(self.baseFilename, source)
+        return source
+
+    def _submitRotation(self, func, *args):
+        """
+        Call func(*args) on the rotation thread, after the rotations which
+        were submitted before.
+        """
+        thread = self._rotationThread
+        # The thread does not survive a fork.
+        if thread is None or not thread.is_alive():
+            self._rotations = queue.SimpleQueue()
+            thread = threading.Thread(target=self._rotationWorker,
+                                      args=(self._rotations,),
+                                      name='logging rotation', daemon=True)
+            thread.start()
+            self._rotationThread = thread
+        self._rotations.put((func, args))
+
+    def _rotationWorker(self, rotations):
+        while (item := rotations.get()) is not None:
+            func, args = item
+            try:
+                func(*args)
+            except Exception:
+                # There is no record to pass to handleError().
+                if logging.raiseExceptions and sys.stderr:
+                    try:
+                        sys.stderr.write('--- Logging error ---\n')
+                        traceback.print_exc(file=sys.stderr)
+                    except OSError:
+                        pass
+
 class RotatingFileHandler(BaseRotatingHandler):
     """
     Handler for logging to a set of files, which switches from one file
     to the next when the current file reaches a certain size.
     """
     def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
-                 encoding=None, delay=False, errors=None):
+                 encoding=None, delay=False, errors=None, *, background=False):
         """
         Open the specified file and use it as the stream for logging.
 
@@ -148,6 +222,13 @@ def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
         respectively.
 
         If maxBytes is zero, rollover never occurs.
+
+        The size of the file is only looked up when it is opened, then the
+        size of each record is added to it.
+
+        If background is true, only the renaming of the file being written
+        to is done synchronously, the other files are renamed, and the file
+        is passed to the rotator, on a background thread.
         """
         # If rotation/rollover is wanted, it doesn't make sense to use another
         # mode. If for example 'w' were specified, then if there were multiple
@@ -159,9 +240,56 @@ def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
         if "b" not in mode:
             encoding = io.text_encoding(encoding)
         BaseRotatingHandler.__init__(self, filename, mode, encoding=encoding,
-                                     delay=delay, errors=errors)
+                                     delay=delay, errors=errors,
+                                     background=background)
         self.maxBytes = maxBytes
         self.backupCount = backupCount
+        # The stream whose size is tracked, its size in bytes, whether it
+        # is a regular file, and whether it writes "\n" as os.linesep.
+        self._sizeStream = None
+        self._size = 0
+        self._regularFile = True
+        self._translateNewlines = False
+        # The last record passed to shouldRollover(), and its formatted text.
+        self._lastFormatted = None
+
+    def emit(self, record):
+        """
+        Emit a record.
+
+        Output the record to the file, catering for rollover as described
+        in doRollover(), and add its size to the size of the file.
+        """
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                if self.mode != 'w' or not self._closed:
+                    self.stream = self._open()
+            if self.stream:
+                # Reuse the text formatted by shouldRollover().
+                last = self._lastFormatted
+                self._lastFormatted = None
+                if last is not None and last[0] is record:
+                    msg = last[1]
+                else:
+                    msg = self.format(record) + self.terminator
+                self.stream.write(msg)
+                self.flush()
+                if self._sizeStream is self.stream:
+                    self._size += self._encodedSize(msg)
+        except RecursionError:  # See issue 36272
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _encodedSize(self, msg):
+        if self._translateNewlines:
+            msg = msg.replace('\n', os.linesep)
+        if msg.isascii():
+            return len(msg)
+        encoding = getattr(self.stream, 'encoding', None) or 'utf-8'
+        return len(msg.encode(encoding, 'replace'))
 
     def doRollover(self):
         """
@@ -171,21 +299,29 @@ def doRollover(self):
             self.stream.close()
             self.stream = None
         if self.backupCount > 0:
-            for i in range(self.backupCount - 1, 0, -1):
-                sfn = self.rotation_filename("%s.%d" % (self.baseFilename, i))
-                dfn = self.rotation_filename("%s.%d" % (self.baseFilename,
-                                                        i + 1))
-                if os.path.exists(sfn):
-                    if os.path.exists(dfn):
-                        os.remove(dfn)
-                    os.rename(sfn, dfn)
-            dfn = self.rotation_filename(self.baseFilename + ".1")
-            if os.path.exists(dfn):
-                os.remove(dfn)
-            self.rotate(self.baseFilename, dfn)
+            if not self.background:
+                self._rotateFiles(self.baseFilename)
+            elif (source := self._moveAside()) is not None:
+                self._submitRotation(self._rotateFiles, source)
         if not self.delay:
             self.stream = self._open()
 
+    def _rotateFiles(self, source):
+        """
+        Rename the backup files, then rotate source to the first one.
+        """
+        for i in range(self.backupCount - 1, 0, -1):
+            sfn = self.rotation_filename("%s.%d" % (self.baseFilename, i))
+            dfn = self.rotation_filename("%s.%d" % (self.baseFilename, i + 1))
+            if os.path.exists(sfn):
+                if os.path.exists(dfn):
+                    os.remove(dfn)
+                os.rename(sfn, dfn)
+        dfn = self.rotation_filename(self.baseFilename + ".1")
+        if os.path.exists(dfn):
+            os.remove(dfn)
+        self.rotate(source, dfn)
+
     def shouldRollover(self, record):
         """
         Determine if rollover should occur.
@@ -196,16 +332,25 @@ def shouldRollover(self, record):
         if self.stream is None:                 # delay was set...
             self.stream = self._open()
         if self.maxBytes > 0:                   # are we rolling over?
-            pos = self.stream.tell()
-            if not pos:
+            if self._sizeStream is not self.stream:
+                # The file was (re)opened, emit() tracks its size after that.
+                self._sizeStream = self.stream
+                self._size = self.stream.tell()
+                # See bpo-45401: Never rollover anything other than regular files
+                self._regularFile = not (os.path.exists(self.baseFilename) and
+                                         not os.path.isfile(self.baseFilename))
+                # Text files opened by _open() translate newlines, "\n" is
+                # written as "\r\n" on Windows.
+                self._translateNewlines = (
+                    os.linesep != '\n' and
+                    isinstance(self.stream, io.TextIOBase))
+            if not self._size:
                 # gh-116263: Never rollover an empty file
                 return False
-            msg = "%s\n" % self.format(record)
-            if pos + len(msg) >= self.maxBytes:
-                # See bpo-45401: Never rollover anything other than regular files
-                if os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename):
-                    return False
-                return True
+            msg = self.format(record) + self.terminator
+            self._lastFormatted = (record, msg)
+            if self._size + self._encodedSize(msg) >= self.maxBytes:
+                return self._regularFile
         return False
 
 class TimedRotatingFileHandler(BaseRotatingHandler):
@@ -215,13 +360,18 @@ class TimedRotatingFileHandler(BaseRotatingHandler):
 
     If backupCount is > 0, when rollover is done, no more than backupCount
     files are kept - the oldest ones are deleted.
+
+    If background is true, the log file is renamed to a temporary name when
+    rollover is done, then it is passed to the rotator and the oldest files
+    are looked for and deleted on a background thread.
     """
     def __init__(self, filename, when='h', interval=1, backupCount=0,
                  encoding=None, delay=False, utc=False, atTime=None,
-                 errors=None):
+                 errors=None, *, background=False):
         encoding = io.text_encoding(encoding)
         BaseRotatingHandler.__init__(self, filename, 'a', encoding=encoding,
-                                     delay=delay, errors=errors)
+                                     delay=delay, errors=errors,
+                                     background=background)
         self.when = when.upper()
         self.backupCount = backupCount
         self.utc = utc
@@ -449,14 +599,24 @@ def doRollover(self):
         if self.stream:
             self.stream.close()
             self.stream = None
-        self.rotate(self.baseFilename, dfn)
-        if self.backupCount > 0:
-            for s in self.getFilesToDelete():
-                os.remove(s)
+        if not self.background:
+            self._rotateFiles(self.baseFilename, dfn)
+        else:
+            self._submitRotation(self._rotateFiles, self._moveAside(), dfn)
         if not self.delay:
             self.stream = self._open()
         self.rolloverAt = self.computeRollover(currentTime)
 
+    def _rotateFiles(self, source, dfn):
+        """
+        Rotate source to dfn, then delete the oldest files.
+        """
+        if source is not None:
+            self.rotate(source, dfn)
+        if self.backupCount > 0:
+            for s in self.getFilesToDelete():
+                os.remove(s)
+
 class WatchedFileHandler(logging.FileHandler):
     """
     A handler for logging to a file, which watches the file
@@ -664,6 +824,12 @@ def makePickle(self, record):
         slen = struct.pack(">L", len(s))
         return slen + s
 
+    def usedFields(self):
+        """
+        All the attributes of the record are sent.
+        """
+        return None
+
     def handleError(self, record):
         """
         Handle an error during logging.
@@ -693,6 +859,32 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def emitBatch(self, records):
+        """
+        Emit a batch of records.
+
+        The pickles of the records are sent to the socket with a single
+        send().  If a subclass overrides emit() or send(), like
+        DatagramHandler which sends one datagram per record, emit() is
+        called for each record instead.
+        """
+        cls = type(self)
+        if (cls.emit is not SocketHandler.emit
+            or cls.send is not SocketHandler.send):
+            logging.Handler.emitBatch(self, records)
+            return
+        pickles = []
+        for record in records:
+            try:
+                pickles.append(self.makePickle(record))
+            except Exception:
+                self.handleError(record)
+        if pickles:
+            try:
+                self.send(b''.join(pickles))
+            except Exception:
+                self.handleError(records[-1])
+
     def close(self):
         """
         Closes the socket.
@@ -1242,6 +1434,12 @@ def mapLogRecord(self, record):
         """
         return record.__dict__
 
+    def usedFields(self):
+        """
+        All the attributes of the record are sent by default.
+        """
+        return None
+
     def getConnection(self, host, secure):
         """
         get a HTTP[S]Connection.
@@ -1263,42 +1461,75 @@ def emit(self, record):
         Send the record to the web server as a percent-encoded dictionary
         """
         try:
-            import urllib.parse
-            host = self.host
-            h = self.getConnection(host, self.secure)
-            url = self.url
-            data = urllib.parse.urlencode(self.mapLogRecord(record))
-            if self.method == "GET":
-                if (url.find('?') >= 0):
-                    sep = '&'
-                else:
-                    sep = '?'
-                url = url + "%c%s" % (sep, data)
-            h.putrequest(self.method, url)
-            # support multiple hosts on one IP address...
-            # need to strip optional :port from host, if present
-            i = host.find(":")
-            if i >= 0:
-                host = host[:i]
-            # See issue #30904: putrequest call above already adds this header
-            # on Python 3.x.
-            # h.putheader("Host", host)
-            if self.method == "POST":
-                h.putheader("Content-type",
-                            "application/x-www-form-urlencoded")
-                h.putheader("Content-length", str(len(data)))
-            if self.credentials:
-                import base64
-                s = ('%s:%s' % self.credentials).encode('utf-8')
-                s = 'Basic ' + base64.b64encode(s).strip().decode('ascii')
-                h.putheader('Authorization', s)
-            h.endheaders()
-            if self.method == "POST":
-                h.send(data.encode('utf-8'))
-            h.getresponse()    #can't do anything with the result
+            h = self.getConnection(self.host, self.secure)
+            self._request(h, record)
         except Exception:
             self.handleError(record)
 
+    def emitBatch(self, records):
+        """
+        Emit a batch of records.
+
+        The records are sent with one request each like by emit(), but the
+        requests reuse the same connection, if the web server keeps it
+        alive.  If a subclass overrides emit(), it is called for each record
+        instead.
+        """
+        if type(self).emit is not HTTPHandler.emit:
+            logging.Handler.emitBatch(self, records)
+            return
+        h = None
+        try:
+            for record in records:
+                try:
+                    if h is None:
+                        h = self.getConnection(self.host, self.secure)
+                    # Read the response, so that the connection can be
+                    # used for the next request.
+                    self._request(h, record).read()
+                except Exception:
+                    self.handleError(record)
+                    if h is not None:
+                        h.close()
+                        h = None
+        finally:
+            if h is not None:
+                h.close()
+
+    def _request(self, h, record):
+        import urllib.parse
+        host = self.host
+        url = self.url
+        data = urllib.parse.urlencode(self.mapLogRecord(record))
+        if self.method == "GET":
+            if (url.find('?') >= 0):
+                sep = '&'
+            else:
+                sep = '?'
+            url = url + "%c%s" % (sep, data)
+        h.putrequest(self.method, url)
+        # support multiple hosts on one IP address...
+        # need to strip optional :port from host, if present
+        i = host.find(":")
+        if i >= 0:
+            host = host[:i]
+        # See issue #30904: putrequest call above already adds this header
+        # on Python 3.x.
+        # h.putheader("Host", host)
+        if self.method == "POST":
+            h.putheader("Content-type",
+                        "application/x-www-form-urlencoded")
+            h.putheader("Content-length", str(len(data)))
+        if self.credentials:
+            import base64
+            s = ('%s:%s' % self.credentials).encode('utf-8')
+            s = 'Basic ' + base64.b64encode(s).strip().decode('ascii')
+            h.putheader('Authorization', s)
+        h.endheaders()
+        if self.method == "POST":
+            h.send(data.encode('utf-8'))
+        return h.getresponse()
+
 class BufferingHandler(logging.Handler):
     """
   A handler class which buffers logging records in memory. Whenever each
@@ -1322,6 +1553,12 @@ def shouldFlush(self, record):
         """
         return (len(self.buffer) >= self.capacity)
 
+    def usedFields(self):
+        """
+        The buffered records can be used in any way when flushed.
+        """
+        return None
+
     def emit(self, record):
         """
         Emit a record.
@@ -1483,6 +1720,12 @@ def prepare(self, record):
         record.stack_info = None
         return record
 
+    def usedFields(self):
+        """
+        The handlers of the listener can use any attribute of the record.
+        """
+        return None
+
     def emit(self, record):
         """
         Emit a record.
@@ -1503,24 +1746,39 @@ class QueueListener(object):
     """
     _sentinel = None
 
-    def __init__(self, queue, *handlers, respect_handler_level=False):
+    def __init__(self, queue, *handlers, respect_handler_level=False,
+                 batch_size=1, batch_timeout=0.0):
         """
         Initialise an instance with the specified queue and
         handlers.
+
+        If batch_size is greater than 1, up to batch_size records are
+        dequeued at once and passed to the handlers as a batch: the records
+        which are already in the queue, and those which arrive within
+        batch_timeout seconds of the first one.
         """
+        if batch_size < 1:
+            raise ValueError('batch_size must be a positive integer')
+        if batch_timeout < 0:
+            raise ValueError('batch_timeout must be non-negative')
         self.queue = queue
         self.handlers = handlers
         self._thread = None
         self.respect_handler_level = respect_handler_level
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
 
-    def dequeue(self, block):
+    def dequeue(self, block, timeout=None):
         """
         Dequeue a record and return it, optionally blocking.
 
         The base implementation uses get. You may want to override this method
         if you want to use timeouts or work with custom queue implementations.
+        The timeout is only passed when batch_timeout is set.
         """
-        return self.queue.get(block)
+        if timeout is None:
+            return self.queue.get(block)
+        return self.queue.get(block, timeout)
 
     def start(self):
         """
@@ -1559,6 +1817,61 @@ def handle(self, record):
             if process:
                 handler.handle(record)
 
+    def _handle_batch(self, records):
+        """
+        Handle a batch of records.
+
+        The records which pass the level of a handler, if respected, are
+        passed to its handleBatch() method.  Handlers without this method
+        handle the records one at a time.
+        """
+        if type(self).handle is not QueueListener.handle:
+            for record in records:
+                self.handle(record)
+            return
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            if not self.respect_handler_level:
+                batch = records
+            else:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+            if not batch:
+                continue
+            handle_batch = getattr(handler, 'handleBatch', None)
+            if handle_batch is not None:
+                handle_batch(batch)
+            else:
+                for record in batch:
+                    handler.handle(record)
+
+    def _dequeue_batch(self):
+        """
+        Wait for a record, then dequeue up to batch_size records, stopping
+        at the sentinel.
+
+        The records which arrive within batch_timeout seconds of the first
+        one are waited for by passing a timeout to dequeue(), otherwise only
+        the records already in the queue are dequeued.
+        """
+        record = self.dequeue(True)
+        records = [record]
+        if self.batch_timeout:
+            deadline = time.monotonic() + self.batch_timeout
+        while record is not self._sentinel and len(records) < self.batch_size:
+            try:
+                if self.batch_timeout:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    record = self.dequeue(True, timeout)
+                else:
+                    record = self.dequeue(False)
+            except queue.Empty:
+                break
+            records.append(record)
+        return records
+
     def _monitor(self):
         """
         Monitor the queue for records, and ask the handler
@@ -1569,6 +1882,24 @@ def _monitor(self):
         """
         q = self.queue
         has_task_done = hasattr(q, 'task_done')
+        if self.batch_size > 1:
+            while True:
+                try:
+                    records = self._dequeue_batch()
+                except queue.Empty:
+                    break
+                stop = records[-1] is self._sentinel
+                count = len(records)
+                if stop:
+                    records.pop()
+                if records:
+                    self._handle_batch(records)
+                if has_task_done:
+                    for _ in range(count):
+                        q.task_done()
+                if stop:
+                    break
+            return
         while True:
             try:
                 record = self.dequeue(True)
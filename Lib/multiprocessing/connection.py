@@ -35,6 +35,13 @@
         raise
     _winapi = None
 
+try:
+    import _posixshmem
+except ImportError:
+    _HAVE_SHARED_MEMORY = False
+else:
+    _HAVE_SHARED_MEMORY = True
+
 #
 #
 #
@@ -45,6 +52,10 @@
 
 _mmap_counter = itertools.count()
 
+# The connections returned by Pipe() send the out-of-band pickle buffers
+# (see PEP 574) of at least this many bytes through shared memory.
+_SHARED_MEMORY_THRESHOLD = 1024 * 1024
+
 default_family = 'AF_INET'
 families = ['AF_INET']
 
@@ -108,12 +119,155 @@ def address_type(address):
     else:
         raise ValueError('address type of %r unrecognized' % address)
 
+#
+# Pickling with large buffers sent through shared memory
+#
+
+class _SharedMemoryMessage:
+    '''
+    Pickle data whose out-of-band buffers were copied to shared memory
+    segments.  Unpickling it maps the segments and unlinks them.
+
+    segments is a list of (name, nbytes) pairs, since a segment can be
+    larger than the buffer copied to it, and tracker identifies the
+    resource tracker with which the segments were registered.
+    '''
+    def __init__(self, data, segments, tracker):
+        self.data = data
+        self.segments = segments
+        self.tracker = tracker
+
+    def __reduce__(self):
+        return _load_shared_memory_message, (self.data, self.segments,
+                                             self.tracker)
+
+def _tracker_id():
+    # Identify the resource tracker of this process by its pipe, which the
+    # processes using the same tracker share, or return None if it is not
+    # running.  The tracker is not started here.
+    from . import resource_tracker
+    fd = resource_tracker._resource_tracker._fd
+    if fd is None:
+        return None
+    try:
+        st = os.fstat(fd)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+def _keep_out_of_band(buf, threshold, buffers):
+    # buffer_callback for the pickler: buffers of at least threshold bytes
+    # are appended to buffers and pickled out-of-band.
+    try:
+        nbytes = buf.raw().nbytes
+    except BufferError:
+        # Not contiguous
+        return True
+    if nbytes < threshold:
+        return True
+    # The segments are registered with the resource tracker of the sender
+    # and unregistered by the receiver, so this is only done when a tracker
+    # is already running, and therefore likely shared with the receiver.
+    # Processes started with spawn or forkserver are always given one.
+    if _tracker_id() is None:
+        return True
+    buffers.append(buf)
+    return False
+
+def _dumps_shared(obj, threshold):
+    buffers = []
+    data = _ForkingPickler.dumps(
+        obj, 5, buffer_callback=lambda buf: _keep_out_of_band(buf, threshold,
+                                                              buffers))
+    if not buffers:
+        return data
+    return _to_shared_memory(data, buffers)
+
+def _to_shared_memory(data, buffers):
+    from . import shared_memory
+    segments = []
+    try:
+        for buf in buffers:
+            with buf.raw() as m:
+                shm = shared_memory.SharedMemory(create=True, size=m.nbytes)
+                segments.append(shm)
+                shm.buf[:] = m
+    except BaseException:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+        raise
+    # The segments stay registered with the resource tracker, which
+    # unlinks them if the message is never received.
+    for shm in segments:
+        shm.close()
+    message = _SharedMemoryMessage(
+        bytes(data), [(shm.name, buf.raw().nbytes)
+                      for shm, buf in zip(segments, buffers)],
+        _tracker_id())
+    return _ForkingPickler.dumps(message)
+
+class _MessagePickler:
+    '''
+    Pickles successive messages for a connection with a single pickler,
+    which is much cheaper than creating one for each message.
+    '''
+    def __init__(self, threshold=None):
+        self._file = io.BytesIO()
+        self._buffers = buffers = []
+        if threshold is None:
+            self._pickler = _ForkingPickler(self._file)
+        else:
+            self._pickler = _ForkingPickler(
+                self._file, 5,
+                buffer_callback=lambda buf: _keep_out_of_band(buf, threshold,
+                                                              buffers))
+
+    def dumps(self, obj):
+        file = self._file
+        try:
+            self._pickler.dump(obj)
+            data = file.getvalue()
+        finally:
+            file.seek(0)
+            file.truncate()
+            self._pickler.clear_memo()
+            buffers = self._buffers.copy()
+            self._buffers.clear()
+        if buffers:
+            return _to_shared_memory(data, buffers)
+        return data
+
+def _attach_shared_buffer(name, nbytes, unregister):
+    from . import resource_tracker, shared_memory
+    shm = shared_memory.SharedMemory(name, track=False)
+    try:
+        # Keep the mapping alive after the segment is unlinked and its file
+        # descriptor closed.
+        buf, shm._mmap = shm._mmap, None
+        shm.unlink()
+        if unregister:
+            resource_tracker.unregister(shm._name, "shared_memory")
+    finally:
+        shm.close()
+    # The size of the segment may have been rounded up to whole pages.
+    return memoryview(buf)[:nbytes]
+
+def _load_shared_memory_message(data, segments, tracker):
+    # If the sender does not share the tracker of this process, the segments
+    # cannot be unregistered from here: its tracker will find them unlinked.
+    unregister = tracker is not None and tracker == _tracker_id()
+    buffers = [_attach_shared_buffer(name, nbytes, unregister)
+               for name, nbytes in segments]
+    return _ForkingPickler.loads(data, buffers=buffers)
+
 #
 # Connection classes
 #
 
 class _ConnectionBase:
     _handle = None
+    _shared_memory_threshold = None
 
     def __init__(self, handle, readable=True, writable=True):
         handle = handle.__index__()
@@ -199,11 +353,26 @@ def send_bytes(self, buf, offset=0, size=None):
             raise ValueError("buffer length < offset + size")
         self._send_bytes(m[offset:offset + size])
 
+    def _send_messages(self, bufs):
+        # Send each buffer as a message.
+        for buf in bufs:
+            self._send_bytes(buf)
+
     def send(self, obj):
         """Send a (picklable) object"""
         self._check_closed()
         self._check_writable()
-        self._send_bytes(_ForkingPickler.dumps(obj))
+        self._send_bytes(self._dumps(obj))
+
+    def _dumps(self, obj):
+        threshold = self._shared_memory_threshold
+        if threshold is None:
+            return _ForkingPickler.dumps(obj)
+        return _dumps_shared(obj, threshold)
+
+    def _message_pickler(self):
+        # Return a _MessagePickler to pickle several messages for send().
+        return _MessagePickler(self._shared_memory_threshold)
 
     def recv_bytes(self, maxlength=None):
         """
@@ -426,6 +595,22 @@ def _send_bytes(self, buf):
                 # to avoid "broken pipe" errors if the other end closed the pipe.
                 self._send(header + buf)
 
+    def _send_messages(self, bufs):
+        # Send each buffer as a message, writing the small ones together.
+        batch = bytearray()
+        for buf in bufs:
+            n = len(buf)
+            if n > 16384:
+                if batch:
+                    self._send(batch)
+                    batch = bytearray()
+                self._send_bytes(buf)
+            else:
+                batch += struct.pack("!i", n)
+                batch += buf
+        if batch:
+            self._send(batch)
+
     def _recv_bytes(self, maxsize=None):
         buf = self._recv(4)
         size, = struct.unpack("!i", buf.getvalue())
@@ -545,6 +730,9 @@ def Pipe(duplex=True):
             c1 = Connection(fd1, writable=False)
             c2 = Connection(fd2, readable=False)
 
+        if _HAVE_SHARED_MEMORY:
+            c1._shared_memory_threshold = _SHARED_MEMORY_THRESHOLD
+            c2._shared_memory_threshold = _SHARED_MEMORY_THRESHOLD
         return c1, c2
 
 else:
@@ -1183,8 +1371,12 @@ def rebuild_pipe_connection(dh, readable, writable):
 else:
     def reduce_connection(conn):
         df = reduction.DupFd(conn.fileno())
-        return rebuild_connection, (df, conn.readable, conn.writable)
-    def rebuild_connection(df, readable, writable):
+        return rebuild_connection, (df, conn.readable, conn.writable,
+                                    conn._shared_memory_threshold)
+    def rebuild_connection(df, readable, writable,
+                           shared_memory_threshold=None):
         fd = df.detach()
-        return Connection(fd, readable, writable)
+        conn = Connection(fd, readable, writable)
+        conn._shared_memory_threshold = shared_memory_threshold
+        return conn
     reduction.register(Connection, reduce_connection)
@@ -7,13 +7,14 @@
 # Licensed to PSF under a Contributor Agreement.
 #
 
-__all__ = ['Pool', 'ThreadPool']
+__all__ = ['Pool', 'ThreadPool', 'AutoChunksize']
 
 #
 # Imports
 #
 
 import collections
+import functools
 import itertools
 import os
 import queue
@@ -50,6 +51,11 @@ def mapstar(args):
 def starmapstar(args):
     return list(itertools.starmap(args[0], args[1]))
 
+def _timed_call(mapper, args):
+    start = time.perf_counter()
+    result = mapper(args)
+    return time.perf_counter() - start, result
+
 #
 # Hack to embed stringification of remote traceback in local traceback
 #
@@ -143,6 +149,145 @@ def _helper_reraises_exception(ex):
     'Pickle-able helper function for use by _guarded_task_generation.'
     raise ex
 
+#
+# Coalescing of the messages sent through the pool queues
+#
+
+# A batch of messages is written as soon as it holds this many messages or
+# bytes, and at the latest _BATCH_DELAY seconds after its first message.
+_BATCH_MESSAGES = 64
+_BATCH_BYTES = 64 * 1024
+_BATCH_DELAY = 0.001
+
+class _Batcher:
+    """
+    Pickles messages for a connection and buffers them, to write them with
+    a single call of write().
+
+    The batch is written when it is full, when flush() is called, or by a
+    background thread once its first message has waited for _BATCH_DELAY
+    seconds, so that no message is held back for longer than that.  The
+    thread sleeps until a batch is started.
+
+    If write() fails, failed() is called with the messages of the batch,
+    which are dropped.
+    """
+    def __init__(self, conn, write, failed):
+        self._conn = conn
+        self._write = write
+        self._failed = failed
+        self._cond = threading.Condition(threading.Lock())
+        self._pickler = None
+        self._messages = []
+        self._nbytes = 0
+        self._deadline = None
+        self._thread = None
+        self._closed = False
+
+    def put(self, obj, tag=None, timed=True):
+        """Pickle obj and buffer it.  tag is passed along to write().
+
+        If timed is false, the caller flushes the batch itself without
+        blocking in between, and the batch is not bounded in time until
+        a timed message is added to it.
+        """
+        with self._cond:
+            if self._pickler is None:
+                self._pickler = self._conn._message_pickler()
+            data = self._pickler.dumps(obj)
+            if timed and self._deadline is None:
+                self._deadline = time.monotonic() + _BATCH_DELAY
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run,
+                                                    name='PoolBatcher',
+                                                    daemon=True)
+                    self._thread.start()
+                else:
+                    self._cond.notify()
+            self._messages.append((data, tag))
+            self._nbytes += len(data)
+            if (len(self._messages) >= _BATCH_MESSAGES
+                    or self._nbytes >= _BATCH_BYTES):
+                self._flush()
+
+    def flush(self):
+        with self._cond:
+            self._flush()
+
+    def _flush(self):
+        messages = self._messages
+        if messages:
+            self._messages = []
+            self._nbytes = 0
+            self._deadline = None
+            # Pick up the reducers registered in the meantime.
+            self._pickler = None
+            try:
+                self._write(messages)
+            except Exception as e:
+                self._failed(messages, e)
+
+    def _run(self):
+        with self._cond:
+            while not self._closed:
+                if self._deadline is None:
+                    self._cond.wait()
+                    continue
+                delay = self._deadline - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                try:
+                    self._flush()
+                except Exception as e:
+                    util.debug('pool batcher failed to write: %r', e)
+
+    def close(self):
+        with self._cond:
+            try:
+                self._flush()
+            finally:
+                self._closed = True
+                self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+class _TaskBatcher(_Batcher):
+    """
+    Buffers the tasks sent to the workers.  Each task is still written as
+    its own message, which any worker can read.
+    """
+    def __init__(self, writer, cache):
+        super().__init__(writer, self._send, self._fail)
+        self._cache = cache
+
+    def __call__(self, task):
+        self.put(task, task)
+
+    def untimed(self, task):
+        # For the tasks of a list, which are all sent in one go.
+        self.put(task, task, timed=False)
+
+    def direct(self, task):
+        # Write a lone task right away, after the tasks buffered before it.
+        with self._cond:
+            self._flush()
+            self._conn.send(task)
+
+    def _send(self, messages):
+        self._conn._send_messages([data for data, task in messages])
+
+    def _fail(self, messages, exc):
+        # Like Pool._handle_tasks() does for the tasks it fails to send.
+        for data, task in messages:
+            if task is None:
+                continue
+            job, idx = task[:2]
+            try:
+                self._cache[job]._set(idx, (False, exc))
+            except KeyError:
+                pass
+
 #
 # Class representing a process pool
 #
@@ -235,9 +380,12 @@ def __init__(self, processes=None, initializer=None, initargs=(),
         self._worker_handler.start()
 
 
+        put = self._quick_put
+        if hasattr(self._inqueue, '_writer'):
+            put = _TaskBatcher(self._inqueue._writer, self._cache)
         self._task_handler = threading.Thread(
             target=Pool._handle_tasks,
-            args=(self._taskqueue, self._quick_put, self._outqueue,
+            args=(self._taskqueue, put, self._outqueue,
                   self._pool, self._cache)
             )
         self._task_handler.daemon = True
@@ -477,6 +625,22 @@ def _map_async(self, func, iterable, mapper, chunksize=None, callback=None,
         if not hasattr(iterable, '__len__'):
             iterable = list(iterable)
 
+        if chunksize == 'auto':
+            chunksize = AutoChunksize()
+        if isinstance(chunksize, AutoChunksize):
+            result = _AutoMapResult(self, chunksize, len(iterable), callback,
+                                    error_callback=error_callback)
+            self._taskqueue.put(
+                (
+                    self._guarded_task_generation(
+                        result._job,
+                        functools.partial(_timed_call, mapper),
+                        result._task_batches(func, iterable)),
+                    None
+                )
+            )
+            return result
+
         if chunksize is None:
             chunksize, extra = divmod(len(iterable), len(self._pool) * 4)
             if extra:
@@ -527,9 +691,22 @@ def _handle_workers(cls, cache, taskqueue, ctx, Process, processes,
     @staticmethod
     def _handle_tasks(taskqueue, put, outqueue, pool, cache):
         thread = threading.current_thread()
+        # put() may buffer the tasks, see _TaskBatcher.
+        flush = getattr(put, 'flush', None)
+        untimed_put = getattr(put, 'untimed', put)
+        direct_put = getattr(put, 'direct', put)
 
         for taskseq, set_length in iter(taskqueue.get, None):
             task = None
+            if isinstance(taskseq, list):
+                # Unlike a generator, a list cannot block between two tasks.
+                # A lone task is not worth buffering if no more are coming.
+                if len(taskseq) == 1 and taskqueue.empty():
+                    send = direct_put
+                else:
+                    send = untimed_put
+            else:
+                send = put
             try:
                 # iterating taskseq cannot fail
                 for task in taskseq:
@@ -537,7 +714,7 @@ def _handle_tasks(taskqueue, put, outqueue, pool, cache):
                         util.debug('task handler found thread._state != RUN')
                         break
                     try:
-                        put(task)
+                        send(task)
                     except Exception as e:
                         job, idx = task[:2]
                         try:
@@ -549,10 +726,12 @@ def _handle_tasks(taskqueue, put, outqueue, pool, cache):
                         util.debug('doing set_length()')
                         idx = task[1] if task else -1
                         set_length(idx + 1)
+                    if flush is not None and taskqueue.empty():
+                        flush()
                     continue
                 break
             finally:
-                task = taskseq = job = None
+                task = taskseq = job = send = None
         else:
             util.debug('task handler got sentinel')
 
@@ -563,8 +742,12 @@ def _handle_tasks(taskqueue, put, outqueue, pool, cache):
 
             # tell workers there is no more work
             util.debug('task handler sending sentinel to workers')
-            for p in pool:
-                put(None)
+            try:
+                for p in pool:
+                    put(None)
+            finally:
+                if flush is not None:
+                    put.close()
         except OSError:
             util.debug('task handler got OSError when sending sentinels')
 
@@ -830,6 +1013,89 @@ def _set(self, i, success_result):
                 self._event.set()
                 self._pool = None
 
+#
+# Class whose instances are returned by `Pool.map_async()` when the
+# chunksize is chosen by an `AutoChunksize` instance
+#
+
+class _AutoMapResult(MapResult):
+
+    def __init__(self, pool, tuner, length, callback, error_callback):
+        ApplyResult.__init__(self, pool, callback,
+                             error_callback=error_callback)
+        self._success = True
+        self._value = [None] * length
+        self._tuner = tuner
+        self._processes = pool._processes
+        # Only a couple of chunks per process are dispatched ahead, so that
+        # later chunks are sized from the timings of the earlier ones.
+        self._window = 2 * pool._processes
+        # Maps the index of each dispatched chunk to its
+        # (start, size, dispatch time, queued) tuple.
+        self._chunks = {}
+        self._cond = threading.Condition(threading.Lock())
+        self._number_left = length
+        if length == 0:
+            self._event.set()
+            del self._cache[self._job]
+
+    def _task_batches(self, func, iterable):
+        # Run by the task handler thread.
+        thread = threading.current_thread()
+        it = iter(iterable)
+        length = len(self._value)
+        start = 0
+        for i in itertools.count():
+            with self._cond:
+                while len(self._chunks) >= self._window:
+                    if thread._state != RUN:
+                        return
+                    self._cond.wait(0.1)
+                size = self._tuner._next_chunksize(length, self._processes)
+                x = tuple(itertools.islice(it, size))
+                if not x:
+                    return
+                queued = len(self._chunks) >= self._processes
+                self._chunks[i] = (start, len(x), time.monotonic(), queued)
+            start += len(x)
+            yield (func, x)
+
+    def _set(self, i, success_result):
+        success, result = success_result
+        with self._cond:
+            chunk = self._chunks.pop(i, None)
+            self._cond.notify()
+        if chunk is None:
+            # The iterable raised while the chunks were being generated.
+            self._number_left = 0
+        else:
+            start, size, dispatched, queued = chunk
+            self._number_left -= size
+            if success:
+                exec_time, result = result
+                self._tuner._record(size, exec_time,
+                                    time.monotonic() - dispatched, queued)
+        if success and self._success:
+            self._value[start:start+size] = result
+            if self._number_left == 0:
+                if self._callback:
+                    self._callback(self._value)
+                del self._cache[self._job]
+                self._event.set()
+                self._pool = None
+        else:
+            if not success and self._success:
+                # only store first exception
+                self._success = False
+                self._value = result
+            if self._number_left == 0:
+                # only consider the result ready once all jobs are done
+                if self._error_callback:
+                    self._error_callback(self._value)
+                del self._cache[self._job]
+                self._event.set()
+                self._pool = None
+
 #
 # Class whose instances are returned by `Pool.imap()`
 #
@@ -914,6 +1180,95 @@ def _set(self, i, obj):
                 del self._cache[self._job]
                 self._pool = None
 
+#
+# Chunk size auto-tuning
+#
+
+ChunkStats = collections.namedtuple('ChunkStats',
+                                    ['size', 'exec_time', 'latency'])
+
+class AutoChunksize(object):
+    '''
+    Chooses the chunksize of map-like methods from the timings of the chunks
+    that have already completed.
+
+    Chunks start with a single item.  After each chunk, the size of the next
+    ones is moved (at most halved or doubled) toward the number of items that
+    take *target_duration* seconds to execute.  If sending a chunk and
+    receiving its result takes a noticeable fraction of that duration, the
+    target is raised so that the IPC cost stays small.
+    '''
+
+    # Weight of the latest chunk in the moving averages.
+    _SMOOTHING = 0.25
+    # The execution time of a chunk is kept at least this many times longer
+    # than its IPC overhead.
+    _OVERHEAD_RATIO = 10
+
+    def __init__(self, target_duration=0.05, history=1000):
+        if target_duration <= 0:
+            raise ValueError("target_duration must be greater than 0")
+        self.target_duration = target_duration
+        self._lock = threading.Lock()
+        self._chunksize = 1
+        self._item_time = None
+        self._overhead = None
+        self._stats = collections.deque(maxlen=history)
+
+    def __repr__(self):
+        return (f'<{self.__class__.__qualname__} '
+                f'target_duration={self.target_duration} '
+                f'chunksize={self._chunksize}>')
+
+    @property
+    def chunksize(self):
+        '''The size of the next chunk to be dispatched.'''
+        return self._chunksize
+
+    def stats(self):
+        '''
+        Return a list of `ChunkStats` for the most recently completed chunks.
+        '''
+        with self._lock:
+            return list(self._stats)
+
+    def _next_chunksize(self, length=None, workers=1):
+        size = self._chunksize
+        if length is not None:
+            # Never use larger chunks than the default chunksize of
+            # `Pool.map()`, which splits an input of known length into four
+            # chunks per worker.
+            size = min(size, max(1, -(-length // (4 * workers))))
+        return size
+
+    def _record(self, size, exec_time, latency, queued):
+        with self._lock:
+            self._stats.append(ChunkStats(size, exec_time, latency))
+            item_time = exec_time / size
+            if self._item_time is None:
+                self._item_time = item_time
+            else:
+                self._item_time += self._SMOOTHING * (item_time -
+                                                      self._item_time)
+            # A chunk which waited behind others measures the queue rather
+            # than the IPC cost.
+            if not queued:
+                overhead = max(latency - exec_time, 0.0)
+                if self._overhead is None:
+                    self._overhead = overhead
+                else:
+                    self._overhead += self._SMOOTHING * (overhead -
+                                                         self._overhead)
+            goal = self.target_duration
+            if self._overhead is not None:
+                goal = max(goal, self._OVERHEAD_RATIO * self._overhead)
+            current = self._chunksize
+            if self._item_time > 0:
+                ideal = int(goal / self._item_time)
+            else:
+                ideal = current * 2
+            self._chunksize = max(1, current // 2, min(ideal, current * 2))
+
 #
 #
 #
@@ -233,6 +233,98 @@ def get_nowait(self):
         '''
         return self.get(block=False)
 
+    def put_many(self, items, block=True, timeout=None):
+        '''Put the items of an iterable into the queue, in order.
+
+        The items which fit in the queue are put at once.  If optional args
+        'block' is true and 'timeout' is None (the default), block if
+        necessary until free slots are available for the remaining items.
+        If 'timeout' is a non-negative number, it blocks at most 'timeout'
+        seconds and raises the Full exception if not all the items were put
+        within that time; the items put until then stay in the queue.
+        Otherwise ('block' is false), put all the items if enough free
+        slots are immediately available, else raise the Full exception
+        without putting any ('timeout' is ignored in that case).
+
+        Raises ShutDown if the queue has been shut down.
+        '''
+        items = list(items)
+        with self.not_full:
+            if self.is_shutdown:
+                raise ShutDown
+            if self.maxsize <= 0:
+                for item in items:
+                    self._put(item)
+                self.unfinished_tasks += len(items)
+                self.not_empty.notify(len(items))
+                return
+            if not block:
+                if self._qsize() + len(items) > self.maxsize:
+                    raise Full
+            elif timeout is not None:
+                if timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                endtime = time() + timeout
+            i = 0
+            while True:
+                n = min(len(items) - i, self.maxsize - self._qsize())
+                if n > 0:
+                    for item in items[i:i+n]:
+                        self._put(item)
+                    i += n
+                    self.unfinished_tasks += n
+                    self.not_empty.notify(n)
+                if i == len(items):
+                    return
+                if timeout is None:
+                    self.not_full.wait()
+                else:
+                    remaining = endtime - time()
+                    if remaining <= 0.0:
+                        raise Full
+                    self.not_full.wait(remaining)
+                if self.is_shutdown:
+                    raise ShutDown
+
+    def get_many(self, max_items, block=True, timeout=None):
+        '''Remove and return a list of up to 'max_items' items from the queue.
+
+        Wait for an item like get(), then remove all the available items up
+        to 'max_items' at once.  The 'block' and 'timeout' arguments have
+        the same meaning as for get().
+
+        Raises ShutDown if the queue has been shut down and is empty,
+        or if the queue has been shut down immediately.
+        '''
+        if max_items <= 0:
+            raise ValueError("'max_items' must be a positive integer")
+        with self.not_empty:
+            if self.is_shutdown and not self._qsize():
+                raise ShutDown
+            if not block:
+                if not self._qsize():
+                    raise Empty
+            elif timeout is None:
+                while not self._qsize():
+                    self.not_empty.wait()
+                    if self.is_shutdown and not self._qsize():
+                        raise ShutDown
+            elif timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            else:
+                endtime = time() + timeout
+                while not self._qsize():
+                    remaining = endtime - time()
+                    if remaining <= 0.0:
+                        raise Empty
+                    self.not_empty.wait(remaining)
+                    if self.is_shutdown and not self._qsize():
+                        raise ShutDown
+            n = min(max_items, self._qsize())
+            items = [self._get() for _ in range(n)]
+            self.not_full.notify(n)
+            return items
+
     def shutdown(self, immediate=False):
         '''Shut-down the queue, making queue gets and puts raise ShutDown.
 
@@ -361,6 +453,31 @@ def put_nowait(self, item):
         '''
         return self.put(item, block=False)
 
+    def put_many(self, items, block=True, timeout=None):
+        '''Put the items of an iterable on the queue, in order.
+
+        The optional 'block' and 'timeout' arguments are ignored, as this method
+        never blocks.  They are provided for compatibility with the Queue class.
+        '''
+        items = list(items)
+        self._queue.extend(items)
+        if items:
+            self._count.release(len(items))
+
+    def get_many(self, max_items, block=True, timeout=None):
+        '''Remove and return a list of up to 'max_items' items from the queue.
+
+        Wait for an item like get(), then remove all the available items up
+        to 'max_items'.  The 'block' and 'timeout' arguments have the same
+        meaning as for get().
+        '''
+        if max_items <= 0:
+            raise ValueError("'max_items' must be a positive integer")
+        items = [self.get(block, timeout)]
+        while len(items) < max_items and self._count.acquire(False):
+            items.append(self._queue.popleft())
+        return items
+
     def get_nowait(self):
         '''Remove and return an item from the queue without blocking.
 
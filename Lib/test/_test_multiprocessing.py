@@ -2455,6 +2455,9 @@ def test_namespace(self):
 #
 #
 
+def _active_thread_count(x):
+    return threading.active_count()
+
 def sqr(x, wait=0.0, event=None):
     if event is None:
         time.sleep(wait)
@@ -2565,6 +2568,34 @@ def test_map_chunksize(self):
         except multiprocessing.TimeoutError:
             self.fail("pool.map_async with chunksize stalled on null list")
 
+    def test_map_chunksize_auto(self):
+        pmap = self.pool.map
+        self.assertEqual(pmap(sqr, list(range(100)), chunksize='auto'),
+                         list(map(sqr, list(range(100)))))
+        self.assertEqual(pmap(sqr, [], chunksize='auto'), [])
+        tuples = list(zip(range(100), range(99,-1, -1)))
+        self.assertEqual(self.pool.starmap(mul, tuples, chunksize='auto'),
+                         list(itertools.starmap(mul, tuples)))
+        with self.assertRaises(ValueError):
+            pmap(int, ['1', 'a', '3'], chunksize='auto')
+
+    def test_map_chunksize_auto_stats(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        tuner = multiprocessing.pool.AutoChunksize()
+        self.assertEqual(self.pool.map(sqr, list(range(1000)), chunksize=tuner),
+                         list(map(sqr, list(range(1000)))))
+        stats = tuner.stats()
+        self.assertEqual(sum(s.size for s in stats), 1000)
+        self.assertEqual(min(s.size for s in stats), 1)
+        self.assertGreater(max(s.size for s in stats), 1)
+        # Chunks never exceed the default chunksize of Pool.map().
+        self.assertLessEqual(max(s.size for s in stats), 1000 // (4 * 4) + 1)
+        self.assertGreaterEqual(tuner.chunksize, 1)
+
+        with self.assertRaises(ValueError):
+            multiprocessing.pool.AutoChunksize(target_duration=0)
+
     def test_map_handle_iterable_exception(self):
         if self.TYPE == 'manager':
             self.skipTest('test not appropriate for {}'.format(self.TYPE))
@@ -2625,6 +2656,71 @@ def test_imap(self):
             self.assertEqual(next(it), i*i)
         self.assertRaises(StopIteration, it.__next__)
 
+    def test_imap_blocking_iterable(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        # The tasks already taken from the iterable are sent to the workers
+        # while the iterable blocks.
+        event = threading.Event()
+        def blocking_generator():
+            yield 2
+            event.wait(support.LONG_TIMEOUT)
+            yield 3
+        try:
+            it = self.pool.imap(sqr, blocking_generator())
+            self.assertEqual(it.next(timeout=support.SHORT_TIMEOUT), 4)
+        finally:
+            event.set()
+        self.assertEqual(list(it), [9])
+
+    def test_result_not_held_back(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        # The result of a task is sent while the worker runs the next one.
+        p = self.Pool(1)
+        try:
+            event = threading.Event() if self.TYPE == 'threads' else None
+            res = p.apply_async(sqr, (2,))
+            p.apply_async(sqr, (3, support.LONG_TIMEOUT, event))
+            self.assertEqual(res.get(timeout=support.SHORT_TIMEOUT), 4)
+        finally:
+            if event is not None:
+                event.set()
+            p.terminate()
+            p.join()
+
+    def test_task_write_failure(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        # The tasks of a batch which cannot be written fail.
+        def fail(messages):
+            raise OSError('spam')
+        p = self.Pool(1)
+        try:
+            p._inqueue._writer._send_messages = fail
+            res = p.map_async(sqr, range(3), chunksize=1)
+            with self.assertRaisesRegex(OSError, 'spam'):
+                res.get(timeout=support.SHORT_TIMEOUT)
+            it = p.imap(sqr, iter(range(3)))
+            with self.assertRaisesRegex(OSError, 'spam'):
+                it.next(timeout=support.SHORT_TIMEOUT)
+        finally:
+            # The worker waits for a task, holding the lock of the queue
+            # which terminate() takes.
+            del p._inqueue._writer._send_messages
+            p.terminate()
+            p.join()
+
+    def test_workers_do_not_start_threads(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        counts = self.pool.map(_active_thread_count, range(200), chunksize=1)
+        self.assertEqual(set(counts), {1})
+
     def test_imap_handle_iterable_exception(self):
         if self.TYPE == 'manager':
             self.skipTest('test not appropriate for {}'.format(self.TYPE))
@@ -3337,6 +3433,92 @@ def test_duplex_false(self):
             self.assertRaises(OSError, writer.recv)
             self.assertRaises(OSError, writer.poll)
 
+    @classmethod
+    def _echo_objects(cls, conn):
+        for obj in iter(conn.recv, None):
+            conn.send(obj)
+        conn.close()
+
+    def test_send_large_buffers(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        conn, child_conn = self.Pipe()
+        threshold = conn._shared_memory_threshold
+        if threshold is None:
+            self.skipTest('large buffers are not sent through shared memory')
+
+        p = self.Process(target=self._echo_objects, args=(child_conn,))
+        p.daemon = True
+        p.start()
+        child_conn.close()
+
+        small = bytearray(b'x' * (threshold - 1))
+        large = bytearray(range(256)) * (threshold // 256)
+        conn.send([small, large])
+        res = conn.recv()
+        self.assertEqual(res, [small, large])
+        self.assertIsInstance(res[1], bytearray)
+
+        conn.send(None)
+        p.join()
+        conn.close()
+
+    def test_shared_memory_segments_unlinked(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        conn, child_conn = self.Pipe(duplex=False)
+        self.addCleanup(conn.close)
+        self.addCleanup(child_conn.close)
+        threshold = child_conn._shared_memory_threshold
+        if threshold is None:
+            self.skipTest('large buffers are not sent through shared memory')
+
+        # Shared memory is only used when the resource tracker is running.
+        resource_tracker.ensure_running()
+        large = bytearray(threshold)
+        data = child_conn._dumps(pickle.PickleBuffer(large))
+        self.assertLess(len(data), threshold)
+        self.assertEqual(bytes(pickle.loads(data)), large)
+        # The receiver unlinked the segment.
+        self.assertRaises(FileNotFoundError, pickle.loads, data)
+
+    def test_shared_memory_buffer_size(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        conn, child_conn = self.Pipe(duplex=False)
+        self.addCleanup(conn.close)
+        self.addCleanup(child_conn.close)
+        threshold = child_conn._shared_memory_threshold
+        if threshold is None:
+            self.skipTest('large buffers are not sent through shared memory')
+
+        resource_tracker.ensure_running()
+        # The segment is rounded up to whole pages, the buffer is not.
+        large = bytearray(b'x' * (threshold + 1))
+        data = child_conn._dumps(pickle.PickleBuffer(large))
+        self.assertLess(len(data), threshold)
+        res = pickle.loads(data)
+        self.assertEqual(len(res), threshold + 1)
+        self.assertEqual(bytes(res), large)
+
+    def test_pipe_does_not_start_resource_tracker(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        cmd = '''if 1:
+            import multiprocessing as mp
+            import threading
+            from multiprocessing import resource_tracker
+            conn, child_conn = mp.Pipe()
+            data = bytearray(b'x' * (2 * 1024 * 1024 + 1))
+            t = threading.Thread(target=conn.send, args=(data,))
+            t.start()
+            assert child_conn.recv() == data
+            t.join()
+            print(resource_tracker._resource_tracker._pid)
+        '''
+        rc, out, err = script_helper.assert_python_ok('-c', cmd)
+        self.assertEqual(out.strip(), b'None')
+
     def test_spawn_close(self):
         # We test that a pipe connection can be closed by parent
         # process immediately after child is spawned.  On Windows this
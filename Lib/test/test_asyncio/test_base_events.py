@@ -488,6 +488,122 @@ def cb():
         # Ensure only uncancelled events remain scheduled
         self.assertTrue(all([not x._cancelled for x in self.loop._scheduled]))
 
+    def test_set_timer_resolution(self):
+        self.assertIsNone(self.loop.get_timer_resolution())
+        self.loop.set_timer_resolution(0.01)
+        self.assertEqual(self.loop.get_timer_resolution(), 0.01)
+        self.loop.set_timer_resolution(None)
+        self.assertIsNone(self.loop.get_timer_resolution())
+        for resolution in (0, -1, 0.0):
+            with self.assertRaises(ValueError):
+                self.loop.set_timer_resolution(resolution)
+        self.assertIsNone(self.loop.get_timer_resolution())
+
+    def test_set_timer_resolution_moves_timers(self):
+        cb = lambda: None
+        h1 = self.loop.call_later(10, cb)
+        self.loop.set_timer_resolution(0.1)
+        h2 = self.loop.call_later(20, cb)
+        self.assertEqual(self.loop._scheduled, [h1])
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+
+        self.loop.set_timer_resolution(0.5)
+        self.assertEqual(self.loop._scheduled, [h1])
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+
+        self.loop.set_timer_resolution(None)
+        self.assertEqual(sorted(self.loop._scheduled), [h1, h2])
+        self.assertTrue(h2._scheduled)
+
+    def test__run_once_timer_wheel(self):
+        self.loop.set_timer_resolution(0.5)
+        self.loop._process_events = mock.Mock()
+        calls = []
+        now = self.loop.time()
+        h1 = self.loop.call_at(now - 1, calls.append, 1)
+        h2 = self.loop.call_at(now - 2, calls.append, 2)
+        h3 = self.loop.call_at(now + 10, calls.append, 3)
+        self.assertEqual(self.loop._scheduled, [])
+        self.assertEqual(len(self.loop._timer_wheel), 3)
+
+        self.loop._run_once()
+        self.assertEqual(calls, [2, 1])
+        self.assertFalse(h1._scheduled)
+        self.assertFalse(h2._scheduled)
+        self.assertTrue(h3._scheduled)
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+
+        # The timer is due at the end of its bucket, never early.
+        self.loop._run_once()
+        timeout = self.loop._selector.select.call_args[0][0]
+        self.assertGreaterEqual(timeout, now + 10 - self.loop.time())
+        self.assertLessEqual(timeout, 10.5)
+        self.assertEqual(calls, [2, 1])
+
+    def test__run_once_timer_wheel_and_heap(self):
+        self.loop._process_events = mock.Mock()
+        h1 = self.loop.call_later(10, lambda: None)
+        self.loop.set_timer_resolution(1)
+        h2 = self.loop.call_later(100, lambda: None)
+
+        self.loop._run_once()
+        timeout = self.loop._selector.select.call_args[0][0]
+        self.assertTrue(9 < timeout <= 10, timeout)
+
+        h1.cancel()
+        self.loop._run_once()
+        timeout = self.loop._selector.select.call_args[0][0]
+        self.assertTrue(99 < timeout <= 101, timeout)
+
+        h2.cancel()
+        self.loop._run_once()
+        self.assertIsNone(self.loop._selector.select.call_args[0][0])
+
+    def test_timer_wheel_cancel(self):
+        self.loop.set_timer_resolution(0.01)
+        h1 = self.loop.call_later(10, lambda: None)
+        h2 = self.loop.call_later(10, lambda: None)
+        h1.cancel()
+        self.assertFalse(h1._scheduled)
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+        self.assertEqual(self.loop._timer_cancelled_count, 0)
+        h1.cancel()
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+        h2.cancel()
+        self.assertEqual(len(self.loop._timer_wheel), 0)
+
+    def test__run_once_timer_wheel_drops_empty_buckets(self):
+        self.loop.set_timer_resolution(0.5)
+        self.loop._process_events = mock.Mock()
+        now = self.loop.time()
+        for i in range(1, 11):
+            self.loop.call_at(now - i, lambda: None).cancel()
+        self.assertEqual(len(self.loop._timer_wheel), 0)
+
+        self.loop._run_once()
+        self.assertEqual(self.loop._timer_wheel._buckets, {})
+        self.assertEqual(self.loop._timer_wheel._ticks, [])
+
+    def test_reschedule_timer(self):
+        cb = lambda: None
+        h1 = self.loop.call_later(10, cb)
+        # Timers of the heap cannot be moved.
+        self.assertFalse(self.loop._reschedule_timer(h1, h1.when() + 1))
+
+        self.loop.set_timer_resolution(0.1)
+        h2 = self.loop.call_later(10, cb)
+        when = h2.when()
+        self.assertTrue(self.loop._reschedule_timer(h2, when + 0.01))
+        self.assertEqual(h2.when(), when + 0.01)
+        self.assertTrue(self.loop._reschedule_timer(h2, when + 20))
+        self.assertEqual(h2.when(), when + 20)
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+        self.assertEqual(self.loop._timer_wheel.pop_all(), [h2])
+
+        h3 = self.loop.call_later(10, cb)
+        h3.cancel()
+        self.assertFalse(self.loop._reschedule_timer(h3, when + 20))
+
     def test_run_until_complete_type_error(self):
         self.assertRaises(TypeError,
             self.loop.run_until_complete, 'blah')
@@ -1786,6 +1902,25 @@ def test_create_datagram_endpoint_sock(self):
         self.loop.run_until_complete(protocol.done)
         self.assertEqual('CLOSED', protocol.state)
 
+    def test_create_datagram_endpoint_batch_size(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(('127.0.0.1', 0))
+        fut = self.loop.create_datagram_endpoint(
+            lambda: MyDatagramProto(create_future=True, loop=self.loop),
+            sock=sock, batch_size=16)
+        transport, protocol = self.loop.run_until_complete(fut)
+        self.assertEqual(transport._batch_size, 16)
+        transport.close()
+        self.loop.run_until_complete(protocol.done)
+
+        for batch_size in (0, -1):
+            with self.subTest(batch_size=batch_size):
+                coro = self.loop.create_datagram_endpoint(
+                    MyDatagramProto, local_addr=('127.0.0.1', 0),
+                    batch_size=batch_size)
+                self.assertRaises(
+                    ValueError, self.loop.run_until_complete, coro)
+
     @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'No UNIX Sockets')
     def test_create_datagram_endpoint_sock_unix(self):
         fut = self.loop.create_datagram_endpoint(
@@ -1352,6 +1352,34 @@ def test_create_datagram_endpoint(self):
     def test_create_datagram_endpoint_ipv6(self):
         self._test_create_datagram_endpoint(('::1', 0), socket.AF_INET6)
 
+    def test_create_datagram_endpoint_batch_size(self):
+        batches = []
+
+        class BatchProto(MyDatagramProto):
+            def datagrams_received(self, datagrams):
+                batches.append(datagrams)
+                super().datagrams_received(datagrams)
+
+        coro = self.loop.create_datagram_endpoint(
+            lambda: BatchProto(loop=self.loop),
+            local_addr=('127.0.0.1', 0), batch_size=4)
+        transport, server = self.loop.run_until_complete(coro)
+        addr = transport.get_extra_info('sockname')
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            for i in range(10):
+                sock.sendto(b'%d' % i, addr)
+            test_utils.run_until(self.loop, lambda: server.nbytes == 10)
+            datagrams = [datagram for batch in batches for datagram in batch]
+            self.assertEqual(datagrams,
+                             [(b'%d' % i, sock.getsockname())
+                              for i in range(10)])
+            self.assertTrue(all(1 <= len(batch) <= 4 for batch in batches))
+
+        transport.close()
+        self.loop.run_until_complete(server.done)
+
     def test_create_datagram_endpoint_sock(self):
         sock = None
         local_address = ('127.0.0.1', 0)
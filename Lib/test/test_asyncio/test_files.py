@@ -0,0 +1,276 @@
+"""Tests for asyncio/files.py"""
+
+import asyncio
+import io
+import os
+import threading
+import unittest
+
+from asyncio import files
+from test.support import os_helper
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class AsyncFileTests(unittest.IsolatedAsyncioTestCase):
+
+    DATA = bytes(range(256)) * 1024
+
+    def setUp(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with open(os_helper.TESTFN, 'wb') as f:
+            f.write(self.DATA)
+
+    async def open(self, mode='rb', **kwargs):
+        file = await asyncio.open_file(os_helper.TESTFN, mode, **kwargs)
+        self.addAsyncCleanup(file.close)
+        return file
+
+    async def test_open(self):
+        file = await self.open(readahead=1000)
+        self.assertEqual(file.name, os_helper.TESTFN)
+        self.assertEqual(file.mode, 'rb')
+        self.assertTrue(file.readable())
+        self.assertFalse(file.writable())
+        self.assertTrue(file.seekable())
+        self.assertIsInstance(file.fileno(), int)
+        self.assertIn('pos=0', repr(file))
+        await file.close()
+        self.assertTrue(file.closed)
+        self.assertIn('closed', repr(file))
+        with self.assertRaises(ValueError):
+            await file.read()
+        with self.assertRaises(ValueError):
+            file.tell()
+        # close() is idempotent.
+        await file.close()
+
+    async def test_open_invalid(self):
+        with self.assertRaisesRegex(ValueError, 'binary'):
+            await asyncio.open_file(os_helper.TESTFN, 'r')
+        with self.assertRaisesRegex(ValueError, 'readahead'):
+            await asyncio.open_file(os_helper.TESTFN, 'rb', readahead=-1)
+        with self.assertRaises(FileNotFoundError):
+            await asyncio.open_file(os_helper.TESTFN + '.missing', 'rb')
+
+    @unittest.skipIf(os.name == 'nt', 'requires a character device')
+    async def test_open_not_regular(self):
+        with self.assertRaisesRegex(OSError, 'not a regular file'):
+            await asyncio.open_file(os.devnull, 'rb')
+
+    async def test_file_executor(self):
+        threads = []
+
+        def opener(path, flags):
+            threads.append(threading.current_thread().name)
+            return os.open(path, flags)
+
+        await self.open(opener=opener)
+        self.assertTrue(threads[0].startswith('asyncio-file-io'), threads)
+
+    async def test_context_manager(self):
+        async with await asyncio.open_file(os_helper.TESTFN, 'rb') as file:
+            self.assertEqual(await file.read(3), self.DATA[:3])
+        self.assertTrue(file.closed)
+
+    async def test_read(self):
+        file = await self.open(readahead=1000)
+        self.assertEqual(await file.read(10), self.DATA[:10])
+        self.assertEqual(file.tell(), 10)
+        # The first read() filled the buffer, the next part of the file is
+        # only read in advance once half of it was consumed.
+        self.assertIsNone(file._ahead)
+        self.assertEqual(await file.read(600), self.DATA[10:610])
+        self.assertEqual(file._ahead_offset, 1000)
+        self.assertEqual(await file.read(5000), self.DATA[610:5610])
+        self.assertEqual(await file.read(), self.DATA[5610:])
+        self.assertEqual(file.tell(), len(self.DATA))
+        self.assertEqual(await file.read(10), b'')
+        self.assertEqual(await file.read(), b'')
+
+    async def test_read_no_readahead(self):
+        file = await self.open(readahead=0)
+        chunks = []
+        while chunk := await file.read(100_000):
+            self.assertIsNone(file._ahead)
+            chunks.append(chunk)
+        self.assertEqual([len(chunk) for chunk in chunks],
+                         [100_000, 100_000, 62_144])
+        self.assertEqual(b''.join(chunks), self.DATA)
+
+    async def test_read_sequential(self):
+        file = await self.open(readahead=4096)
+        chunks = []
+        while chunk := await file.read(1000):
+            chunks.append(chunk)
+        self.assertEqual(b''.join(chunks), self.DATA)
+
+    async def test_read_concurrent(self):
+        file = await self.open()
+        read = asyncio.create_task(file.read(10))
+        await asyncio.sleep(0)
+        with self.assertRaisesRegex(RuntimeError, 'in progress'):
+            await file.read(10)
+        with self.assertRaisesRegex(RuntimeError, 'in progress'):
+            file.seek(0)
+        self.assertEqual(await read, self.DATA[:10])
+
+    async def test_seek(self):
+        file = await self.open(readahead=1000)
+        await file.read(10)
+        # Seeking inside the buffer keeps it.
+        self.assertEqual(file.seek(500), 500)
+        self.assertEqual(file._buffered(), 500)
+        self.assertEqual(await file.read(10), self.DATA[500:510])
+        self.assertEqual(file.seek(-20, os.SEEK_CUR), 490)
+        self.assertEqual(file._buffered(), 0)
+        self.assertEqual(await file.read(10), self.DATA[490:500])
+        self.assertEqual(file.seek(-10, os.SEEK_END), len(self.DATA) - 10)
+        self.assertEqual(await file.read(), self.DATA[-10:])
+        self.assertEqual(file.seek(len(self.DATA) + 10), len(self.DATA) + 10)
+        self.assertEqual(await file.read(), b'')
+        with self.assertRaises(OSError):
+            file.seek(-1)
+        with self.assertRaises(ValueError):
+            file.seek(0, 3)
+
+    async def test_write(self):
+        file = await self.open('r+b')
+        self.assertEqual(await file.read(10), self.DATA[:10])
+        self.assertEqual(await file.write(b'abc'), 3)
+        self.assertEqual(file.tell(), 13)
+        self.assertEqual(await file.write(memoryview(b'xyz')), 3)
+        file.seek(0)
+        self.assertEqual(await file.read(20),
+                         self.DATA[:10] + b'abcxyz' + self.DATA[16:20])
+
+    async def test_write_append(self):
+        file = await self.open('ab')
+        self.assertEqual(file.tell(), len(self.DATA))
+        other = await self.open('ab')
+        await other.write(b'abc')
+        self.assertEqual(await file.write(b'xyz'), 3)
+        self.assertEqual(file.tell(), len(self.DATA) + 6)
+        await file.close()
+        await other.close()
+        with open(os_helper.TESTFN, 'rb') as f:
+            self.assertEqual(f.read(), self.DATA + b'abcxyz')
+
+    async def test_pread_pwrite(self):
+        file = await self.open('r+b', readahead=1000)
+        await file.read(10)
+        self.assertEqual(await file.pread(5, 100), self.DATA[100:105])
+        self.assertEqual(await file.pread(5, len(self.DATA) - 2),
+                         self.DATA[-2:])
+        self.assertEqual(await file.pwrite(b'abc', 10), 3)
+        self.assertEqual(file.tell(), 10)
+        # pwrite() dropped the data read in advance.
+        self.assertEqual(await file.read(5), b'abc' + self.DATA[13:15])
+
+    async def test_pread_many_pwrite_many(self):
+        file = await self.open('r+b')
+        self.assertEqual(await file.pread_many([(3, 0), (3, 1000), (2, 5)]),
+                         [self.DATA[:3], self.DATA[1000:1003],
+                          self.DATA[5:7]])
+        self.assertEqual(
+            await file.pwrite_many([(b'abc', 0), (b'de', 1000)]), 5)
+        self.assertEqual(await file.pread_many(iter([(3, 0), (2, 1000)])),
+                         [b'abc', b'de'])
+
+    async def test_close_waits_for_readahead(self):
+        file = await self.open(readahead=1000)
+        await file.read(600)
+        ahead = file._ahead
+        self.assertIsNotNone(ahead)
+        await file.close()
+        self.assertTrue(ahead.done())
+
+    async def test_cancel_read(self):
+        file = await self.open()
+        read = asyncio.create_task(file.read(10))
+        await asyncio.sleep(0)
+        self.assertEqual(len(file._inflight), 1)
+        job, = file._inflight
+        read.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await read
+        # The job keeps running until close().
+        self.assertFalse(job.cancelled())
+        await file.close()
+        self.assertTrue(job.done())
+
+
+class ReadChunksTests(unittest.IsolatedAsyncioTestCase):
+
+    DATA = bytes(range(256)) * 100
+
+    async def read_chunks(self, file, count, blocksize):
+        chunks = files._read_chunks(file, count, blocksize)
+        try:
+            return [chunk async for chunk in chunks]
+        finally:
+            await chunks.aclose()
+
+    async def test_regular_file(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with open(os_helper.TESTFN, 'w+b') as f:
+            f.write(self.DATA)
+            f.seek(100)
+            chunks = await self.read_chunks(f, None, 10000)
+            self.assertEqual([len(chunk) for chunk in chunks],
+                             [10000, 10000, 5500])
+            self.assertEqual(b''.join(chunks), self.DATA[100:])
+            # The position of the file is not updated.
+            self.assertEqual(f.tell(), 100)
+            chunks = await self.read_chunks(f, 15000, 10000)
+            self.assertEqual([len(chunk) for chunk in chunks], [10000, 5000])
+            self.assertEqual(b''.join(chunks), self.DATA[100:15100])
+
+    async def test_file_object(self):
+        f = io.BytesIO(self.DATA)
+        chunks = await self.read_chunks(f, None, 10000)
+        self.assertEqual([len(chunk) for chunk in chunks],
+                         [10000, 10000, 5600])
+        self.assertEqual(b''.join(chunks), self.DATA)
+        f.seek(0)
+        chunks = await self.read_chunks(f, 15000, 10000)
+        self.assertEqual(b''.join(chunks), self.DATA[:15000])
+        self.assertEqual(f.tell(), 15000)
+
+    async def test_close_early(self):
+        f = io.BytesIO(self.DATA)
+        chunks = files._read_chunks(f, None, 1000)
+        self.assertEqual(await anext(chunks), self.DATA[:1000])
+        # The read of the next chunk is waited for.
+        await chunks.aclose()
+        self.assertEqual(f.tell(), 2000)
+
+
+class LoopFileExecutorTests(unittest.TestCase):
+
+    def test_close(self):
+        loop = asyncio.new_event_loop()
+        executor = loop._get_file_executor()
+        self.assertIs(loop._get_file_executor(), executor)
+        loop.close()
+        self.assertIsNone(loop._file_executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+
+    def test_shutdown_default_executor(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        executor = loop._get_file_executor()
+        executor.submit(print).result()
+        threads = list(executor._threads)
+        loop.run_until_complete(loop.shutdown_default_executor())
+        for thread in threads:
+            self.assertFalse(thread.is_alive())
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+"""Tests for asyncio/metrics.py"""
+
+import asyncio
+import functools
+import threading
+import unittest
+
+from asyncio import metrics
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+def callback():
+    pass
+
+
+async def coro():
+    pass
+
+
+class CallbackNameTests(unittest.TestCase):
+
+    def test_function(self):
+        self.assertEqual(metrics._callback_name(callback), 'callback')
+        self.assertEqual(metrics._callback_name(self.test_function),
+                         'CallbackNameTests.test_function')
+
+    def test_partial(self):
+        cb = functools.partial(functools.partial(callback))
+        self.assertEqual(metrics._callback_name(cb), 'callback')
+
+    def test_callable_object(self):
+        class Callback:
+            def __call__(self):
+                pass
+
+        self.assertEqual(metrics._callback_name(Callback()),
+                         'CallbackNameTests.test_callable_object.'
+                         '<locals>.Callback')
+
+    def test_task(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        task = loop.create_task(coro())
+        handle = loop._ready[-1]
+        self.assertEqual(metrics._callback_name(handle._callback), 'coro')
+        loop.run_until_complete(task)
+
+
+class LoopMetricsTests(unittest.TestCase):
+
+    def test_record_iteration(self):
+        m = asyncio.LoopMetrics()
+        self.assertEqual(m.snapshot(), {
+            'iterations': 0, 'iteration_time': 0.0,
+            'max_iteration_time': 0.0, 'select_time': 0.0,
+            'ready': 0, 'max_ready': 0, 'scheduled': 0, 'callbacks': {},
+        })
+        m._record_iteration(0.5, 0.25, 3, 2,
+                            [(callback, 1e-6), (callback, 1e-3),
+                             (coro, 2.0)])
+        m._record_iteration(0.25, 0.25, 1, 1, [(callback, 0.05)])
+        snapshot = m.snapshot()
+        self.assertEqual(snapshot['iterations'], 2)
+        self.assertEqual(snapshot['iteration_time'], 0.75)
+        self.assertEqual(snapshot['max_iteration_time'], 0.5)
+        self.assertEqual(snapshot['select_time'], 0.5)
+        self.assertEqual(snapshot['ready'], 1)
+        self.assertEqual(snapshot['max_ready'], 3)
+        self.assertEqual(snapshot['scheduled'], 1)
+        self.assertEqual(snapshot['callbacks'].keys(), {'callback', 'coro'})
+        stats = snapshot['callbacks']['callback']
+        self.assertEqual(stats['count'], 3)
+        self.assertAlmostEqual(stats['total_time'], 0.051001)
+        self.assertEqual(stats['histogram'], [1, 0, 1, 0, 1, 0, 0])
+        self.assertEqual(snapshot['callbacks']['coro']['histogram'],
+                         [0, 0, 0, 0, 0, 0, 1])
+
+        # The snapshot is a copy.
+        stats['histogram'][0] = 10
+        self.assertEqual(m.snapshot()['callbacks']['callback']['histogram'],
+                         [1, 0, 1, 0, 1, 0, 0])
+
+        m.reset()
+        self.assertEqual(m.snapshot()['iterations'], 0)
+        self.assertEqual(m.snapshot()['callbacks'], {})
+
+
+class LoopInstrumentationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def test_set_metrics(self):
+        self.assertIsNone(self.loop.get_metrics())
+        m = asyncio.LoopMetrics()
+        self.loop.set_metrics(m)
+        self.assertIs(self.loop.get_metrics(), m)
+        with self.assertRaises(TypeError):
+            self.loop.set_metrics({})
+        self.loop.set_metrics(None)
+        self.assertIsNone(self.loop.get_metrics())
+
+    def check_run(self, debug):
+        self.loop.set_debug(debug)
+        m = asyncio.LoopMetrics()
+        self.loop.set_metrics(m)
+        self.loop.call_later(3600, callback)
+
+        async def main():
+            for _ in range(3):
+                asyncio.get_running_loop().call_soon(callback)
+            await asyncio.sleep(0.01)
+
+        self.loop.run_until_complete(main())
+        snapshot = m.snapshot()
+        self.assertGreater(snapshot['iterations'], 1)
+        self.assertGreater(snapshot['iteration_time'], 0)
+        self.assertGreaterEqual(snapshot['iteration_time'],
+                                snapshot['select_time'])
+        self.assertGreaterEqual(snapshot['select_time'], 0.005)
+        self.assertGreaterEqual(snapshot['max_ready'], 3)
+        self.assertEqual(snapshot['scheduled'], 1)
+        self.assertEqual(snapshot['callbacks']['callback']['count'], 3)
+        self.assertEqual(sum(snapshot['callbacks']['callback']['histogram']),
+                         3)
+        self.assertIn('LoopInstrumentationTests.check_run.<locals>.main',
+                      snapshot['callbacks'])
+
+        self.loop.set_metrics(None)
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertEqual(m.snapshot(), snapshot)
+
+    def test_run(self):
+        self.check_run(False)
+
+    def test_run_debug(self):
+        self.check_run(True)
+
+    def test_timer_wheel_scheduled(self):
+        m = asyncio.LoopMetrics()
+        self.loop.set_metrics(m)
+        self.loop.set_timer_resolution(0.01)
+        self.loop.call_later(3600, callback)
+        self.loop.call_later(3600, callback).cancel()
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertEqual(m.snapshot()['scheduled'], 1)
+
+    def test_snapshot_from_thread(self):
+        m = asyncio.LoopMetrics()
+        self.loop.set_metrics(m)
+        snapshots = []
+
+        def poll():
+            for _ in range(100):
+                snapshots.append(m.snapshot())
+
+        async def main():
+            thread = threading.Thread(target=poll)
+            thread.start()
+            while thread.is_alive():
+                await asyncio.sleep(0)
+            thread.join()
+
+        self.loop.run_until_complete(main())
+        self.assertEqual(len(snapshots), 100)
+        iterations = [snapshot['iterations'] for snapshot in snapshots]
+        self.assertEqual(iterations, sorted(iterations))
+
+
+class TaskStatsTests(unittest.IsolatedAsyncioTestCase):
+
+    def tearDown(self):
+        asyncio.set_task_accounting(False)
+
+    async def test_task_stats(self):
+        async def worker(event):
+            await event.wait()
+
+        event = asyncio.Event()
+        untracked = asyncio.create_task(worker(event), name='untracked')
+        asyncio.set_task_accounting(True)
+        workers = [asyncio.create_task(worker(event), name=f'worker-{i % 2}')
+                   for i in range(3)]
+        other = asyncio.create_task(coro(), name='worker-0')
+        asyncio.set_task_accounting(False)
+        await asyncio.sleep(0)
+
+        # The done task is not returned by all_tasks().
+        stats = asyncio.task_stats()
+        self.assertEqual(list(stats),
+                         ['TaskStatsTests.test_task_stats.<locals>.worker'])
+        worker_stats = stats['TaskStatsTests.test_task_stats.<locals>.worker']
+        self.assertEqual(worker_stats['tasks'], 3)
+        self.assertEqual(worker_stats['steps'], 3)
+        self.assertAlmostEqual(
+            worker_stats['run_time'],
+            sum(task.get_stats()['run_time'] for task in workers))
+        stats = asyncio.task_stats(workers + [other])
+        self.assertEqual(sum(total['tasks'] for total in stats.values()), 4)
+
+        stats = asyncio.task_stats(workers + [other, untracked], key='name')
+        self.assertEqual(stats.keys(), {'worker-0', 'worker-1'})
+        self.assertEqual(stats['worker-0']['tasks'], 3)
+        self.assertEqual(stats['worker-1']['tasks'], 1)
+
+        with self.assertRaises(ValueError):
+            asyncio.task_stats(key='qualname')
+        event.set()
+        await asyncio.gather(untracked, *workers)
+
+    async def test_third_party_task(self):
+        self.assertEqual(asyncio.task_stats([asyncio.Future()]), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
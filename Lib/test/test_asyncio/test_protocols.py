@@ -50,8 +50,20 @@ def test_datagram_protocol(self):
         self.assertIsNone(dp.connection_lost(f))
         self.assertIsNone(dp.error_received(f))
         self.assertIsNone(dp.datagram_received(f, f))
+        self.assertIsNone(dp.datagrams_received([(f, f)]))
         self.assertFalse(hasattr(dp, '__dict__'))
 
+    def test_datagram_protocol_datagrams_received(self):
+        received = []
+
+        class Proto(asyncio.DatagramProtocol):
+            def datagram_received(self, data, addr):
+                received.append((data, addr))
+
+        datagrams = [(b'a', ('127.0.0.1', 1)), (b'b', ('127.0.0.1', 2))]
+        Proto().datagrams_received(datagrams)
+        self.assertEqual(received, datagrams)
+
     def test_subprocess_protocol(self):
         f = mock.Mock()
         sp = asyncio.SubprocessProtocol()
@@ -1,8 +1,11 @@
 """Tests for queues.py"""
 
 import asyncio
+import queue
+import threading
 import unittest
 from types import GenericAlias
+from unittest import mock
 
 
 def tearDownModule():
@@ -522,6 +525,99 @@ class PriorityQueueJoinTests(_QueueJoinTestMixin, unittest.IsolatedAsyncioTestCa
     q_class = asyncio.PriorityQueue
 
 
+class _QueueManyTestMixin:
+    q_class = None
+
+    async def test_put_many_get_many_nowait(self):
+        q = self.q_class(maxsize=5)
+        q.put_many_nowait(iter([3, 1, 2]))
+        self.assertEqual(q.qsize(), 3)
+        # Not enough free slots: nothing is put.
+        with self.assertRaises(asyncio.QueueFull):
+            q.put_many_nowait([4, 5, 6])
+        self.assertEqual(q.qsize(), 3)
+        items = q.get_many_nowait(2)
+        self.assertEqual(len(items), 2)
+        items += q.get_many_nowait(10)
+        self.assertEqual(sorted(items), [1, 2, 3])
+        with self.assertRaises(asyncio.QueueEmpty):
+            q.get_many_nowait(10)
+        with self.assertRaises(ValueError):
+            q.get_many_nowait(0)
+        with self.assertRaises(ValueError):
+            await q.get_many(0)
+
+    async def test_put_many_waits_for_free_slots(self):
+        q = self.q_class(maxsize=2)
+        putter = asyncio.create_task(q.put_many(range(5)))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertEqual(q.qsize(), 2)
+        items = []
+        while len(items) < 5:
+            items += await q.get_many(5)
+        await putter
+        self.assertEqual(sorted(items), list(range(5)))
+        self.assertEqual(q._unfinished_tasks, 5)
+
+    async def test_get_many_waits_for_items(self):
+        q = self.q_class()
+        getter = asyncio.create_task(q.get_many(3))
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+        q.put_many_nowait([2, 1, 4, 3])
+        self.assertEqual(len(await getter), 3)
+        self.assertEqual(q.qsize(), 1)
+
+    async def test_put_many_wakes_up_getters(self):
+        q = self.q_class()
+        getters = [asyncio.create_task(q.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        await q.put_many([1, 2, 3])
+        self.assertEqual(sorted(await asyncio.gather(*getters)), [1, 2, 3])
+
+    async def test_get_many_wakes_up_putters(self):
+        q = self.q_class(maxsize=2)
+        q.put_many_nowait([1, 2])
+        putters = [asyncio.create_task(q.put(i)) for i in (3, 4)]
+        await asyncio.sleep(0)
+        self.assertEqual(sorted(q.get_many_nowait(2)), [1, 2])
+        await asyncio.gather(*putters)
+        self.assertEqual(sorted(q.get_many_nowait(2)), [3, 4])
+
+    async def test_shutdown(self):
+        q = self.q_class(maxsize=2)
+        putter = asyncio.create_task(q.put_many(range(3)))
+        getter_q = self.q_class()
+        getter = asyncio.create_task(getter_q.get_many(2))
+        await asyncio.sleep(0)
+        q.shutdown()
+        getter_q.shutdown()
+        with self.assertRaises(asyncio.QueueShutDown):
+            await putter
+        with self.assertRaises(asyncio.QueueShutDown):
+            await getter
+        with self.assertRaises(asyncio.QueueShutDown):
+            q.put_many_nowait([1])
+        self.assertEqual(sorted(await q.get_many(5)), [0, 1])
+        with self.assertRaises(asyncio.QueueShutDown):
+            q.get_many_nowait(5)
+
+
+class QueueManyTests(_QueueManyTestMixin, unittest.IsolatedAsyncioTestCase):
+    q_class = asyncio.Queue
+
+
+class LifoQueueManyTests(_QueueManyTestMixin,
+                         unittest.IsolatedAsyncioTestCase):
+    q_class = asyncio.LifoQueue
+
+
+class PriorityQueueManyTests(_QueueManyTestMixin,
+                             unittest.IsolatedAsyncioTestCase):
+    q_class = asyncio.PriorityQueue
+
+
 class _QueueShutdownTestMixin:
     q_class = None
 
@@ -721,5 +817,145 @@ class PriorityQueueShutdownTests(
     q_class = asyncio.PriorityQueue
 
 
+class ThreadSafeQueueTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_repr(self):
+        q = asyncio.ThreadSafeQueue(maxsize=2)
+        q.put_nowait(1)
+        self.assertIn('maxsize=2', repr(q))
+        self.assertIn('queue=[1]', repr(q))
+        self.assertIn(hex(id(q)), repr(q))
+        self.assertTrue(str(q).startswith('<ThreadSafeQueue'))
+
+    async def test_is_queue(self):
+        q = asyncio.ThreadSafeQueue()
+        self.assertIsInstance(q, queue.Queue)
+        q.put(1)
+        await q.aput(2)
+        self.assertEqual(q.qsize(), 2)
+        self.assertEqual(await q.aget(), 1)
+        self.assertEqual(q.get(), 2)
+        self.assertRaises(queue.Empty, q.get_nowait)
+        q.task_done()
+        q.task_done()
+        q.join()
+
+    async def test_aget_from_thread(self):
+        q = asyncio.ThreadSafeQueue()
+
+        def producer():
+            for i in range(100):
+                q.put(i)
+
+        t = threading.Thread(target=producer)
+        t.start()
+        try:
+            self.assertEqual([await q.aget() for i in range(100)],
+                             list(range(100)))
+        finally:
+            t.join()
+
+    async def test_aput_to_thread(self):
+        q = asyncio.ThreadSafeQueue(maxsize=2)
+        consumer = asyncio.create_task(
+            asyncio.to_thread(lambda: [q.get() for i in range(100)]))
+        for i in range(100):
+            await q.aput(i)
+        self.assertEqual(await consumer, list(range(100)))
+
+    async def test_wakeups_coalesced(self):
+        q = asyncio.ThreadSafeQueue()
+        loop = asyncio.get_running_loop()
+        getters = [asyncio.create_task(q.aget()) for i in range(3)]
+        await asyncio.sleep(0)
+
+        def producer():
+            for i in range(10):
+                q.put(i)
+
+        with mock.patch.object(loop, 'call_soon_threadsafe',
+                               wraps=loop.call_soon_threadsafe) as m:
+            # Run the producer while the event loop is blocked.
+            t = threading.Thread(target=producer)
+            t.start()
+            t.join()
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(await asyncio.gather(*getters), [0, 1, 2])
+            self.assertEqual([await q.aget() for i in range(7)],
+                             list(range(3, 10)))
+            self.assertEqual(m.call_count, 1)
+
+    async def test_maxsize(self):
+        q = asyncio.ThreadSafeQueue(maxsize=1)
+        await q.aput(1)
+        putter = asyncio.create_task(q.aput(2))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        # A thread blocked in put() resumes once the task gets an item.
+        thread_putter = asyncio.create_task(asyncio.to_thread(q.put, 3))
+        self.assertEqual(await asyncio.to_thread(q.get), 1)
+        self.assertEqual({await q.aget(), await q.aget()}, {2, 3})
+        await putter
+        await thread_putter
+        self.assertTrue(q.empty())
+
+    async def test_cancelled_getter_wakes_next(self):
+        q = asyncio.ThreadSafeQueue()
+        getter1 = asyncio.create_task(q.aget())
+        getter2 = asyncio.create_task(q.aget())
+        await asyncio.sleep(0)
+        q.put_nowait(1)
+        getter1.cancel()
+        self.assertEqual(await getter2, 1)
+        with self.assertRaises(asyncio.CancelledError):
+            await getter1
+
+    async def test_cancelled_putter_wakes_next(self):
+        q = asyncio.ThreadSafeQueue(maxsize=1)
+        q.put_nowait(0)
+        putter1 = asyncio.create_task(q.aput(1))
+        putter2 = asyncio.create_task(q.aput(2))
+        await asyncio.sleep(0)
+        q.get_nowait()
+        putter1.cancel()
+        await putter2
+        with self.assertRaises(asyncio.CancelledError):
+            await putter1
+        self.assertEqual(q.get_nowait(), 2)
+
+    async def test_shutdown_from_thread(self):
+        q = asyncio.ThreadSafeQueue(maxsize=1)
+        getter = asyncio.create_task(q.aget())
+        await asyncio.sleep(0)
+        await asyncio.to_thread(q.shutdown)
+        with self.assertRaises(asyncio.QueueShutDown):
+            await getter
+        with self.assertRaises(asyncio.QueueShutDown):
+            await q.aput(1)
+        self.assertRaises(queue.ShutDown, q.put, 1)
+
+    async def test_shutdown_wakes_putter(self):
+        q = asyncio.ThreadSafeQueue(maxsize=1)
+        await q.aput(1)
+        putter = asyncio.create_task(q.aput(2))
+        await asyncio.sleep(0)
+        q.shutdown()
+        with self.assertRaises(asyncio.QueueShutDown):
+            await putter
+        # Gets still succeed until the queue is empty.
+        self.assertEqual(await q.aget(), 1)
+        with self.assertRaises(asyncio.QueueShutDown):
+            await q.aget()
+        self.assertRaises(queue.ShutDown, q.get)
+
+    async def test_shutdown_immediate(self):
+        q = asyncio.ThreadSafeQueue()
+        await q.aput(1)
+        q.shutdown(immediate=True)
+        with self.assertRaises(asyncio.QueueShutDown):
+            await q.aget()
+        q.join()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,234 @@
+"""Tests for asyncio/resolvers.py"""
+
+import asyncio
+import socket
+import unittest
+
+from unittest import mock
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class StubResolver(asyncio.AbstractResolver):
+    """Resolve every host name to 127.0.0.1, optionally after a delay."""
+
+    def __init__(self):
+        self.calls = []
+        self.waiter = None
+        self.exc = None
+
+    async def getaddrinfo(self, host, port, *,
+                          family=0, type=0, proto=0, flags=0):
+        self.calls.append((host, port, family, type, proto, flags))
+        if self.waiter is not None:
+            await self.waiter
+        if self.exc is not None:
+            raise self.exc
+        return [(socket.AF_INET, type or socket.SOCK_STREAM, proto, '',
+                 ('127.0.0.1', port))]
+
+
+class ThreadedResolverTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_getaddrinfo(self):
+        resolver = asyncio.ThreadedResolver()
+        infos = await resolver.getaddrinfo('127.0.0.1', 80,
+                                           family=socket.AF_INET,
+                                           type=socket.SOCK_STREAM)
+        self.assertEqual(infos, socket.getaddrinfo(
+            '127.0.0.1', 80, socket.AF_INET, socket.SOCK_STREAM))
+
+    async def test_abstract(self):
+        with self.assertRaises(NotImplementedError):
+            await asyncio.AbstractResolver().getaddrinfo('localhost', 80)
+
+
+class CachingResolverTests(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.stub = StubResolver()
+
+    async def test_default_resolver(self):
+        resolver = asyncio.CachingResolver()
+        self.assertIsInstance(resolver._resolver, asyncio.ThreadedResolver)
+        infos = await resolver.getaddrinfo('127.0.0.1', 80)
+        self.assertEqual(infos, socket.getaddrinfo('127.0.0.1', 80))
+
+    def test_invalid_arguments(self):
+        for ttl in (0, -1):
+            with self.assertRaises(ValueError):
+                asyncio.CachingResolver(ttl=ttl)
+        for maxsize in (0, -1):
+            with self.assertRaises(ValueError):
+                asyncio.CachingResolver(maxsize=maxsize)
+
+    async def test_cache(self):
+        resolver = asyncio.CachingResolver(self.stub)
+        self.assertEqual(resolver.cache_info(), (0, 0, 1024, 0))
+        infos = await resolver.getaddrinfo('example.test', 80)
+        self.assertEqual(infos[0][4], ('127.0.0.1', 80))
+        # The cache returns a copy of the result.
+        infos.clear()
+        infos = await resolver.getaddrinfo('example.test', 80)
+        self.assertEqual(infos[0][4], ('127.0.0.1', 80))
+        self.assertEqual(len(self.stub.calls), 1)
+        self.assertEqual(resolver.cache_info(), (1, 1, 1024, 1))
+
+        # Lookups with other arguments are cached separately.
+        await resolver.getaddrinfo('example.test', 80, type=socket.SOCK_DGRAM)
+        await resolver.getaddrinfo('example.test', 443)
+        self.assertEqual(len(self.stub.calls), 3)
+        self.assertEqual(self.stub.calls[1],
+                         ('example.test', 80, 0, socket.SOCK_DGRAM, 0, 0))
+        self.assertEqual(resolver.cache_info(), (1, 3, 1024, 3))
+
+        resolver.cache_clear()
+        self.assertEqual(resolver.cache_info(), (0, 0, 1024, 0))
+        await resolver.getaddrinfo('example.test', 80)
+        self.assertEqual(len(self.stub.calls), 4)
+
+    async def test_ttl(self):
+        resolver = asyncio.CachingResolver(self.stub, ttl=10)
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        with mock.patch.object(loop, 'time', return_value=now):
+            await resolver.getaddrinfo('example.test', 80)
+        with mock.patch.object(loop, 'time', return_value=now + 9.5):
+            await resolver.getaddrinfo('example.test', 80)
+        self.assertEqual(len(self.stub.calls), 1)
+        with mock.patch.object(loop, 'time', return_value=now + 10):
+            await resolver.getaddrinfo('example.test', 80)
+        self.assertEqual(len(self.stub.calls), 2)
+        self.assertEqual(resolver.cache_info(), (1, 2, 1024, 1))
+
+    async def test_maxsize(self):
+        resolver = asyncio.CachingResolver(self.stub, maxsize=2)
+        await resolver.getaddrinfo('a.test', 80)
+        await resolver.getaddrinfo('b.test', 80)
+        await resolver.getaddrinfo('a.test', 80)
+        # b.test is the least recently used lookup.
+        await resolver.getaddrinfo('c.test', 80)
+        self.assertEqual(resolver.cache_info(), (1, 3, 2, 2))
+        await resolver.getaddrinfo('a.test', 80)
+        await resolver.getaddrinfo('b.test', 80)
+        self.assertEqual([call[0] for call in self.stub.calls],
+                         ['a.test', 'b.test', 'c.test', 'b.test'])
+
+    async def test_coalesce(self):
+        resolver = asyncio.CachingResolver(self.stub)
+        self.stub.waiter = asyncio.get_running_loop().create_future()
+        lookups = [asyncio.create_task(resolver.getaddrinfo('example.test', 80))
+                   for _ in range(3)]
+        # Let the callers and then the lookup start.
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.assertEqual(len(self.stub.calls), 1)
+        self.stub.waiter.set_result(None)
+        results = await asyncio.gather(*lookups)
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+        self.assertIsNot(results[0], results[1])
+        self.assertEqual(len(self.stub.calls), 1)
+        self.assertEqual(resolver.cache_info(), (2, 1, 1024, 1))
+
+    async def test_coalesce_cancel(self):
+        resolver = asyncio.CachingResolver(self.stub)
+        self.stub.waiter = asyncio.get_running_loop().create_future()
+        first = asyncio.create_task(resolver.getaddrinfo('example.test', 80))
+        second = asyncio.create_task(resolver.getaddrinfo('example.test', 80))
+        await asyncio.sleep(0)
+        # Cancelling the caller which started the lookup does not cancel
+        # the lookup.
+        first.cancel()
+        await asyncio.sleep(0)
+        self.stub.waiter.set_result(None)
+        infos = await second
+        self.assertEqual(infos[0][4], ('127.0.0.1', 80))
+        self.assertTrue(first.cancelled())
+        self.assertEqual(resolver.cache_info().currsize, 1)
+
+    async def test_error(self):
+        resolver = asyncio.CachingResolver(self.stub)
+        self.stub.waiter = asyncio.get_running_loop().create_future()
+        self.stub.exc = socket.gaierror(socket.EAI_NONAME, 'unknown host')
+        lookups = [asyncio.create_task(resolver.getaddrinfo('example.test', 80))
+                   for _ in range(2)]
+        await asyncio.sleep(0)
+        self.stub.waiter.set_result(None)
+        results = await asyncio.gather(*lookups, return_exceptions=True)
+        self.assertIs(results[0], self.stub.exc)
+        self.assertIs(results[1], self.stub.exc)
+
+        # Errors are not cached.
+        self.stub.waiter = None
+        self.stub.exc = None
+        infos = await resolver.getaddrinfo('example.test', 80)
+        self.assertEqual(infos[0][4], ('127.0.0.1', 80))
+        self.assertEqual(len(self.stub.calls), 2)
+
+
+class LoopResolverTests(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.loop = asyncio.get_running_loop()
+        self.stub = StubResolver()
+        self.resolver = asyncio.CachingResolver(self.stub)
+        self.loop.set_resolver(self.resolver)
+
+    def test_set_resolver(self):
+        self.assertIs(self.loop.get_resolver(), self.resolver)
+        with self.assertRaises(TypeError):
+            self.loop.set_resolver(object())
+        self.loop.set_resolver(None)
+        self.assertIsNone(self.loop.get_resolver())
+
+    async def test_getaddrinfo(self):
+        infos = await self.loop.getaddrinfo('example.test', 80)
+        self.assertEqual(infos[0][4], ('127.0.0.1', 80))
+        self.assertEqual(self.stub.calls, [('example.test', 80, 0, 0, 0, 0)])
+
+    async def test_open_connection(self):
+        async def handle(reader, writer):
+            writer.write(await reader.readline())
+            writer.close()
+            await writer.wait_closed()
+
+        server = await asyncio.start_server(handle, '127.0.0.1', 0)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            for _ in range(2):
+                reader, writer = await asyncio.open_connection(
+                    'example.test', port)
+                writer.write(b'ping\n')
+                self.assertEqual(await reader.readline(), b'ping\n')
+                writer.close()
+                await writer.wait_closed()
+        self.assertEqual(len(self.stub.calls), 1)
+        self.assertEqual(self.resolver.cache_info().hits, 1)
+
+    async def test_create_datagram_endpoint(self):
+        received = self.loop.create_future()
+
+        class Protocol(asyncio.DatagramProtocol):
+            def datagram_received(self, data, addr):
+                received.set_result(data)
+
+        server, _ = await self.loop.create_datagram_endpoint(
+            Protocol, local_addr=('127.0.0.1', 0))
+        self.addCleanup(server.close)
+        port = server.get_extra_info('sockname')[1]
+        client, _ = await self.loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=('example.test', port),
+            family=socket.AF_INET)
+        self.addCleanup(client.close)
+        client.sendto(b'ping')
+        self.assertEqual(await received, b'ping')
+        self.assertEqual(self.stub.calls[0][:4],
+                         ('example.test', port, socket.AF_INET,
+                          socket.SOCK_DGRAM))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -867,6 +867,119 @@ def test_write_sendmsg_OSError(self):
                                    err,
                                    'Fatal write error on socket transport')
 
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_sendmsg_partial_bytes(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 2
+
+        transport = self.socket_transport(sendmsg=True)
+        transport._buffer.append(b'data')
+        transport._write_ready()
+        # The rest of the data is not copied.
+        self.assertIsInstance(transport._buffer[0], memoryview)
+        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+
+    def mock_sendmsg(self, nbytes=None):
+        calls = []
+        def sendmsg(buffers):
+            buffers = [bytes(buf) for buf in buffers]
+            calls.append(buffers)
+            return sum(map(len, buffers)) if nbytes is None else nbytes
+        self.sock.sendmsg = mock.Mock(side_effect=sendmsg)
+        return calls
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_coalescing(self):
+        calls = self.mock_sendmsg()
+        transport = self.socket_transport(sendmsg=True)
+        self.assertFalse(transport.get_write_coalescing())
+        transport.set_write_coalescing(True)
+        self.assertTrue(transport.get_write_coalescing())
+
+        transport.write(b'header')
+        transport.writelines([b'body', memoryview(b'trailer')])
+        transport.write(b'')
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertEqual(transport.get_write_buffer_size(), 17)
+        self.assertFalse(self.loop.writers)
+
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, [[b'header', b'body', b'trailer']])
+        self.assertFalse(transport._buffer)
+        self.assertFalse(self.loop.writers)
+
+        transport.writelines([b'next'])
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls[1:], [[b'next']])
+
+        transport.set_write_coalescing(False)
+        self.sock.send.return_value = 4
+        transport.write(b'last')
+        self.sock.send.assert_called_with(b'last')
+        self.assertEqual(len(calls), 2)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_coalescing_partial(self):
+        calls = self.mock_sendmsg(nbytes=3)
+        transport = self.socket_transport(sendmsg=True)
+        transport.set_write_coalescing(True)
+        transport.write(b'data1')
+        transport.write(b'data2')
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, [[b'data1', b'data2']])
+        self.assertEqual(list_to_buffer([b'a1', b'data2']), transport._buffer)
+        self.loop.assert_writer(7, transport._write_ready)
+
+        # The writer sends the rest of the data.
+        transport.write(b'data3')
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(len(calls), 1)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_coalescing_pause_writing(self):
+        self.mock_sendmsg()
+        transport = self.socket_transport(sendmsg=True)
+        transport.set_write_coalescing(True)
+        transport.set_write_buffer_limits(high=4)
+        transport.writelines([b'data', b'data'])
+        self.protocol.pause_writing.assert_called_with()
+        test_utils.run_briefly(self.loop)
+        self.protocol.resume_writing.assert_called_with()
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_coalescing_close(self):
+        calls = self.mock_sendmsg()
+        transport = self.socket_transport(sendmsg=True)
+        transport.set_write_coalescing(True)
+        transport.write(b'data')
+        transport.close()
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, [[b'data']])
+        self.protocol.connection_lost.assert_called_with(None)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_coalescing_abort(self):
+        self.mock_sendmsg()
+        transport = self.socket_transport(sendmsg=True)
+        transport.set_write_coalescing(True)
+        transport.write(b'data')
+        transport.abort()
+        test_utils.run_briefly(self.loop)
+        self.assertFalse(self.sock.sendmsg.called)
+        self.protocol.connection_lost.assert_called_with(None)
+
+    def test_write_coalescing_send(self):
+        self.sock.send.return_value = 4
+        transport = self.socket_transport()
+        transport.set_write_coalescing(True)
+        transport.write(b'data')
+        transport.write(b'more')
+        self.assertFalse(self.sock.send.called)
+        test_utils.run_briefly(self.loop)
+        self.sock.send.assert_called_once_with(b'data')
+        self.loop.assert_writer(7, transport._write_ready)
+
     @mock.patch('asyncio.selector_events.logger')
     def test_write_exception(self, m_log):
         err = self.sock.send.side_effect = OSError()
@@ -1203,14 +1316,73 @@ def setUp(self):
         self.sock = mock.Mock(spec_set=socket.socket)
         self.sock.fileno.return_value = 7
 
-    def datagram_transport(self, address=None):
+    def datagram_transport(self, address=None, batch_size=None):
         self.sock.getpeername.side_effect = None if address else OSError
         transport = _SelectorDatagramTransport(self.loop, self.sock,
                                                self.protocol,
-                                               address=address)
+                                               address=address,
+                                               batch_size=batch_size)
         self.addCleanup(close_transport, transport)
         return transport
 
+    def recvfrom_into(self, *results):
+        # Mock socket.recvfrom_into() returning the given datagrams and
+        # raising the given exceptions.
+        results = list(results)
+        def recvfrom_into(buf):
+            result = results.pop(0)
+            if isinstance(result, BaseException):
+                raise result
+            data, addr = result
+            buf[:len(data)] = data
+            return len(data), addr
+        self.sock.recvfrom_into.side_effect = recvfrom_into
+
+    def test_read_ready_batch(self):
+        transport = self.datagram_transport(batch_size=2)
+
+        self.recvfrom_into((b'data1', ('0.0.0.0', 1)),
+                           (b'data2', ('0.0.0.0', 2)),
+                           (b'data3', ('0.0.0.0', 3)),
+                           BlockingIOError())
+        transport._read_ready()
+        self.protocol.datagrams_received.assert_called_with(
+            [(b'data1', ('0.0.0.0', 1)), (b'data2', ('0.0.0.0', 2))])
+        transport._read_ready()
+        self.protocol.datagrams_received.assert_called_with(
+            [(b'data3', ('0.0.0.0', 3))])
+        self.protocol.datagrams_received.reset_mock()
+        transport._read_ready()
+        self.assertFalse(self.protocol.datagrams_received.called)
+        self.assertFalse(self.protocol.datagram_received.called)
+
+    def test_read_ready_batch_oserr(self):
+        transport = self.datagram_transport(batch_size=10)
+
+        err = OSError()
+        self.recvfrom_into((b'data', ('0.0.0.0', 1)), err)
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+
+        self.assertFalse(transport._fatal_error.called)
+        self.protocol.datagrams_received.assert_called_with(
+            [(b'data', ('0.0.0.0', 1))])
+        self.protocol.error_received.assert_called_with(err)
+
+    def test_read_ready_batch_err(self):
+        transport = self.datagram_transport(batch_size=10)
+
+        err = RuntimeError()
+        self.recvfrom_into((b'data', ('0.0.0.0', 1)), err)
+        transport._fatal_error = mock.Mock()
+        transport._read_ready()
+
+        self.protocol.datagrams_received.assert_called_with(
+            [(b'data', ('0.0.0.0', 1))])
+        transport._fatal_error.assert_called_with(
+                                   err,
+                                   'Fatal read error on datagram transport')
+
     def test_read_ready(self):
         transport = self.datagram_transport()
 
@@ -173,6 +173,15 @@ def test_write_after_closing(self):
         # should not raise
         self.assertIsNone(transp.write(b'data'))
 
+    def test_write_coalescing(self):
+        ssl_proto = self.ssl_protocol()
+        transport = self.connection_made(ssl_proto)
+        transp = ssl_proto._app_transport
+        transp.set_write_coalescing(True)
+        transport.set_write_coalescing.assert_called_once_with(True)
+        transport.get_write_coalescing.return_value = True
+        self.assertTrue(transp.get_write_coalescing())
+
 
 ##############################################################################
 # Start TLS Tests
@@ -6,6 +6,7 @@
 import pickle
 import socket
 import sys
+import tempfile
 import threading
 import unittest
 from unittest import mock
@@ -586,6 +587,264 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readexactly_large(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        data = bytes(range(256)) * 4096
+        stream.feed_data(data[:1000])
+        read_task = self.loop.create_task(stream.readexactly(len(data) - 10))
+        test_utils.run_briefly(self.loop)
+
+        # The transport reads directly into the buffers of readexactly().
+        pos = 1000
+        while not read_task.done():
+            buf = protocol.get_buffer(-1)
+            nbytes = min(len(buf), 100_000, len(data) - pos)
+            buf[:nbytes] = data[pos:pos + nbytes]
+            protocol.buffer_updated(nbytes)
+            pos += nbytes
+            test_utils.run_briefly(self.loop)
+        self.assertEqual(read_task.result(), data[:-10])
+        self.assertEqual(stream._buffer, data[len(data) - 10:pos])
+
+    def test_readexactly_large_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        n = 1024 * 1024
+        read_task = self.loop.create_task(stream.readexactly(n))
+        test_utils.run_briefly(self.loop)
+
+        protocol.data_received(b'x' * 300_000)
+        test_utils.run_briefly(self.loop)
+        buf = protocol.get_buffer(-1)
+        buf[:5] = b'yyyyy'
+        protocol.buffer_updated(5)
+        test_utils.run_briefly(self.loop)
+        protocol.eof_received()
+
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(cm.exception.partial, b'x' * 300_000 + b'yyyyy')
+        self.assertEqual(cm.exception.expected, n)
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readexactly_large_cancel(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        stream.feed_data(b'a' * 10)
+        read_task = self.loop.create_task(stream.readexactly(1024 * 1024))
+        test_utils.run_briefly(self.loop)
+
+        protocol.data_received(b'b' * 300_000)
+        test_utils.run_briefly(self.loop)
+        read_task.cancel()
+        # Data read before the task resumes is not lost either.
+        buf = protocol.get_buffer(-1)
+        buf[:3] = b'ccc'
+        protocol.buffer_updated(3)
+        protocol.data_received(b'ddd')
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(stream._buffer,
+                         b'a' * 10 + b'b' * 300_000 + b'cccddd')
+
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+
+        buf = bytearray(5)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 5)
+        self.assertEqual(buf, self.DATA[:5])
+
+        buf = bytearray(100)
+        n = self.loop.run_until_complete(stream.readinto(memoryview(buf)))
+        self.assertEqual(n, len(self.DATA) - 5)
+        self.assertEqual(buf[:n], self.DATA[5:])
+        self.assertEqual(b'', stream._buffer)
+
+        n = self.loop.run_until_complete(stream.readinto(bytearray()))
+        self.assertEqual(n, 0)
+
+        stream.feed_eof()
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 0)
+
+    def test_readinto_invalid_buffer(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        with self.assertRaises(TypeError):
+            self.loop.run_until_complete(stream.readinto(b'12345'))
+        with self.assertRaises(TypeError):
+            self.loop.run_until_complete(stream.readinto(
+                memoryview(bytearray(10))[::2]))
+        self.assertEqual(self.DATA, stream._buffer)
+
+    def test_readinto_buffered_protocol(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        self.assertIsInstance(protocol, asyncio.BufferedProtocol)
+
+        buf = bytearray(100_000)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+
+        # The transport reads directly into buf.
+        view = protocol.get_buffer(-1)
+        self.assertEqual(len(view), len(buf))
+        view[:4] = b'abcd'
+        protocol.buffer_updated(4)
+        # The next reads go to the internal buffer.
+        view = protocol.get_buffer(-1)
+        view[:3] = b'efg'
+        protocol.buffer_updated(3)
+        del view
+
+        self.assertEqual(self.loop.run_until_complete(read_task), 4)
+        self.assertEqual(buf[:5], b'abcd\0')
+        self.assertEqual(stream._buffer, b'efg')
+
+    def test_readinto_small_buffer(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        buf = bytearray(10)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+
+        # Small reads go through the internal buffer.
+        view = protocol.get_buffer(-1)
+        self.assertGreater(len(view), len(buf))
+        view[:len(self.DATA)] = self.DATA
+        protocol.buffer_updated(len(self.DATA))
+        del view
+
+        self.assertEqual(self.loop.run_until_complete(read_task), 10)
+        self.assertEqual(buf, self.DATA[:10])
+        self.assertEqual(stream._buffer, self.DATA[10:])
+
+    def test_readinto_data_received(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        buf = bytearray(10)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+
+        protocol.data_received(self.DATA)
+        self.assertEqual(self.loop.run_until_complete(read_task), 10)
+        self.assertEqual(buf, self.DATA[:10])
+        self.assertEqual(stream._buffer, self.DATA[10:])
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.readinto(bytearray(10)))
+        test_utils.run_briefly(self.loop)
+        stream.set_exception(ValueError())
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete, read_task)
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete,
+            stream.readinto(bytearray(10)))
+
+    def test_readinto_cancel(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        read_task = self.loop.create_task(stream.readinto(bytearray(100_000)))
+        test_utils.run_briefly(self.loop)
+
+        read_task.cancel()
+        buf = protocol.get_buffer(-1)
+        buf[:4] = b'abcd'
+        protocol.buffer_updated(4)
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(stream._buffer, b'abcd')
+
+    def test_readinto_socket(self):
+        data = bytes(range(256)) * 8192
+
+        async def main():
+            rsock, wsock = socket.socketpair()
+            reader, rwriter = await asyncio.open_connection(sock=rsock)
+            _, writer = await asyncio.open_connection(sock=wsock)
+            writer.write(data)
+            writer.write_eof()
+
+            buf = bytearray(100_000)
+            chunks = []
+            while n := await reader.readinto(buf):
+                chunks.append(buf[:n])
+            writer.close()
+            rwriter.close()
+            await writer.wait_closed()
+            await rwriter.wait_closed()
+            return b''.join(chunks)
+
+        self.assertEqual(self.loop.run_until_complete(main()), data)
+
+    def test_readexactly_socket(self):
+        data = bytes(range(256)) * 8192
+
+        async def main():
+            rsock, wsock = socket.socketpair()
+            reader, rwriter = await asyncio.open_connection(sock=rsock)
+            _, writer = await asyncio.open_connection(sock=wsock)
+            writer.write(data * 3)
+
+            chunks = [await reader.readexactly(1000),
+                      await reader.readexactly(len(data) - 1000),
+                      await reader.readexactly(len(data) * 2)]
+            writer.close()
+            rwriter.close()
+            await writer.wait_closed()
+            await rwriter.wait_closed()
+            return chunks
+
+        chunks = self.loop.run_until_complete(main())
+        self.assertEqual(chunks, [data[:1000], data[1000:], data * 2])
+
+    def test_writelines_write_coalescing(self):
+        data = bytes(range(256)) * 4096
+        parts = [memoryview(data)[i:i+100_000]
+                 for i in range(0, len(data), 100_000)]
+
+        async def main():
+            rsock, wsock = socket.socketpair()
+            reader, rwriter = await asyncio.open_connection(sock=rsock)
+            _, writer = await asyncio.open_connection(sock=wsock)
+            writer.transport.set_write_coalescing(True)
+            writer.write(b'header')
+            writer.writelines(parts)
+            writer.write(b'trailer')
+            received = await reader.readexactly(len(data) + 13)
+            writer.close()
+            rwriter.close()
+            await writer.wait_closed()
+            await rwriter.wait_closed()
+            return received
+
+        received = self.loop.run_until_complete(main())
+        self.assertEqual(received, b'header' + data + b'trailer')
+
+    def test_streamreaderprotocol_data_received_overridden(self):
+        received = []
+
+        class Protocol(asyncio.StreamReaderProtocol):
+            def data_received(self, data):
+                received.append(data)
+                super().data_received(data)
+
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = Protocol(stream, loop=self.loop)
+        read_task = self.loop.create_task(stream.readinto(bytearray(100_000)))
+        test_utils.run_briefly(self.loop)
+
+        buf = protocol.get_buffer(-1)
+        buf[:4] = b'abcd'
+        protocol.buffer_updated(4)
+        self.assertEqual(self.loop.run_until_complete(read_task), 4)
+        self.assertEqual(received, [b'abcd'])
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
@@ -822,6 +1081,49 @@ async def client(addr):
         self.assertEqual(msg1, b"hello world 1!\n")
         self.assertEqual(msg2, b"hello world 2!\n")
 
+    def check_sendfile(self, *, use_ssl):
+        data = os.urandom(1024 * 1024 + 1)
+        with tempfile.TemporaryFile() as file:
+            file.write(data)
+            file.seek(0)
+
+            async def handle_client(reader, writer):
+                writer.write(b'header')
+                sent = await writer.sendfile(file, 1000)
+                writer.write(str(sent).encode())
+                await writer.drain()
+                writer.close()
+                await writer.wait_closed()
+
+            async def main():
+                server_ssl = client_ssl = None
+                if use_ssl:
+                    server_ssl = test_utils.simple_server_sslcontext()
+                    client_ssl = test_utils.simple_client_sslcontext()
+                server = await asyncio.start_server(
+                    handle_client, '127.0.0.1', 0, ssl=server_ssl)
+                async with server:
+                    addr = server.sockets[0].getsockname()
+                    reader, writer = await asyncio.open_connection(
+                        *addr, ssl=client_ssl)
+                    received = await reader.read()
+                    writer.close()
+                    await writer.wait_closed()
+                return received
+
+            received = self.loop.run_until_complete(main())
+            self.assertEqual(file.tell(), len(data))
+        sent = len(data) - 1000
+        self.assertEqual(received,
+                         b'header' + data[1000:] + str(sent).encode())
+
+    def test_sendfile(self):
+        self.check_sendfile(use_ssl=False)
+
+    @unittest.skipIf(ssl is None, 'No ssl module')
+    def test_sendfile_ssl(self):
+        self.check_sendfile(use_ssl=True)
+
     def test_streamreader_constructor_without_loop(self):
         with self.assertRaisesRegex(RuntimeError, 'no current event loop'):
             asyncio.StreamReader()
@@ -1,5 +1,6 @@
 import os
 import signal
+import socket
 import sys
 import textwrap
 import unittest
@@ -898,6 +899,117 @@ def test_watcher_implementation(self):
             else:
                 self.assertIsInstance(watcher, unix_events._ThreadedChildWatcher)
 
+        def check_splice_stdout_file(self):
+            code = textwrap.dedent('''
+                import sys
+                sys.stdout.buffer.write(b'first line\\n')
+                sys.stdout.buffer.flush()
+                sys.stdin.read()
+                for i in range(256):
+                    sys.stdout.buffer.write(bytes([i]) * 8192)
+            ''')
+
+            async def run(f):
+                proc = await asyncio.create_subprocess_exec(
+                    sys.executable, '-c', code,
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+                # Part of the output is already buffered by the stream.
+                self.assertEqual(await proc.stdout.read(6), b'first ')
+                proc.stdin.close()
+                nbytes = await proc.splice_stdout(f)
+                self.assertEqual(await proc.stdout.read(), b'')
+                return nbytes, await proc.wait()
+
+            self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+            with open(os_helper.TESTFN, 'w+b') as f:
+                task = asyncio.wait_for(run(f), support.LONG_TIMEOUT)
+                nbytes, exitcode = self.loop.run_until_complete(task)
+                f.seek(0)
+                data = f.read()
+            expected = b'line\n' + b''.join(bytes([i]) * 8192
+                                             for i in range(256))
+            self.assertEqual(exitcode, 0)
+            self.assertEqual(nbytes, len(expected))
+            self.assertEqual(data, expected)
+
+        def test_splice_stdout_file(self):
+            self.check_splice_stdout_file()
+
+        def test_splice_stdout_file_no_splice(self):
+            with mock.patch.object(subprocess, '_HAS_SPLICE', False):
+                self.check_splice_stdout_file()
+
+        def check_splice_stdout_socket(self, blocking):
+            rsock, wsock = socket.socketpair()
+            self.addCleanup(rsock.close)
+            rsock.setblocking(False)
+            wsock.setblocking(blocking)
+            received = []
+
+            async def read_socket():
+                while chunk := await self.loop.sock_recv(rsock, 65536):
+                    received.append(chunk)
+
+            async def run():
+                proc = await asyncio.create_subprocess_exec(
+                    sys.executable, '-c',
+                    'import sys; sys.stdout.buffer.write(bytes(1000000))',
+                    stdout=subprocess.PIPE)
+                reader = asyncio.create_task(read_socket())
+                with wsock:
+                    nbytes = await proc.splice_stdout(wsock)
+                    self.assertEqual(wsock.getblocking(), blocking)
+                await reader
+                return nbytes, await proc.wait()
+
+            task = asyncio.wait_for(run(), support.LONG_TIMEOUT)
+            nbytes, exitcode = self.loop.run_until_complete(task)
+            self.assertEqual(exitcode, 0)
+            self.assertEqual(nbytes, 1000000)
+            self.assertEqual(b''.join(received), bytes(1000000))
+
+        def test_splice_stdout_socket(self):
+            self.check_splice_stdout_socket(blocking=False)
+
+        def test_splice_stdout_blocking_socket(self):
+            # The socket does not block the event loop when it is full.
+            self.check_splice_stdout_socket(blocking=True)
+
+        def test_splice_stderr_process(self):
+            async def run():
+                proc = await asyncio.create_subprocess_exec(
+                    sys.executable, '-c',
+                    'import sys; sys.stderr.buffer.write(b"x" * 300000)',
+                    stderr=subprocess.PIPE)
+                cat = await asyncio.create_subprocess_exec(
+                    *PROGRAM_CAT, stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE)
+                reader = asyncio.create_task(cat.stdout.read())
+                nbytes = await proc.splice_stderr(
+                    cat.stdin.get_extra_info('pipe'))
+                cat.stdin.close()
+                return (nbytes, await reader, await proc.wait(),
+                        await cat.wait())
+
+            task = asyncio.wait_for(run(), support.LONG_TIMEOUT)
+            nbytes, data, exitcode, cat_exitcode = (
+                self.loop.run_until_complete(task))
+            self.assertEqual((exitcode, cat_exitcode), (0, 0))
+            self.assertEqual(nbytes, 300000)
+            self.assertEqual(data, b'x' * 300000)
+
+        def test_splice_stdout_not_pipe(self):
+            async def run():
+                proc = await asyncio.create_subprocess_exec(
+                    sys.executable, '-c', 'pass', stdout=subprocess.DEVNULL)
+                with self.assertRaises(ValueError):
+                    await proc.splice_stdout(1)
+                with self.assertRaises(ValueError):
+                    await proc.splice_stderr(1)
+                return await proc.wait()
+
+            self.assertEqual(self.loop.run_until_complete(run()), 0)
+
 
     class SubprocessThreadedWatcherTests(SubprocessWatcherMixin,
                                          test_utils.TestCase):
@@ -899,6 +899,151 @@ async def outer():
 
         await outer()
 
+    async def test_map(self):
+        running = 0
+        max_running = 0
+
+        async def work(i):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            # Later items complete first.
+            await asyncio.sleep((10 - i) * 0.001)
+            running -= 1
+            return i * 2
+
+        async with taskgroups.TaskGroup() as tg:
+            results = [r async for r in tg.map(work, range(10), limit=3)]
+        self.assertEqual(results, [i * 2 for i in range(10)])
+        self.assertEqual(max_running, 3)
+
+    async def test_map_unordered(self):
+        loop = asyncio.get_running_loop()
+        futs = [loop.create_future() for i in range(3)]
+        async def work(i):
+            return await futs[i]
+
+        # The results come in the order in which the calls complete.
+        order = [1, 2, 0]
+        results = []
+        async with taskgroups.TaskGroup() as tg:
+            it = tg.map(work, range(3), limit=3, ordered=False)
+            for i in order:
+                futs[i].set_result(i)
+                results.append(await anext(it))
+            self.assertEqual([r async for r in it], [])
+        self.assertEqual(results, order)
+
+    async def test_map_lazy(self):
+        consumed = 0
+
+        def items():
+            nonlocal consumed
+            for i in range(1000):
+                consumed += 1
+                yield i
+
+        async def work(i):
+            await asyncio.sleep(0)
+            return i
+
+        for ordered in (True, False):
+            consumed = 0
+            async with taskgroups.TaskGroup() as tg:
+                async with contextlib.aclosing(
+                        tg.map(work, items(), limit=5, ordered=ordered)) as it:
+                    async for result in it:
+                        # The items are only taken when a task is done.
+                        self.assertLessEqual(consumed, 6)
+                        break
+            self.assertLessEqual(consumed, 6)
+
+    async def test_map_async_iterable(self):
+        async def items():
+            for i in range(5):
+                await asyncio.sleep(0)
+                yield i
+
+        async def work(i):
+            return i + 1
+
+        async with taskgroups.TaskGroup() as tg:
+            results = [r async for r in tg.map(work, items(), limit=2)]
+        self.assertEqual(results, [1, 2, 3, 4, 5])
+
+    async def test_map_empty(self):
+        async def work(i):
+            return i
+
+        async with taskgroups.TaskGroup() as tg:
+            self.assertEqual([r async for r in tg.map(work, [], limit=2)], [])
+
+    async def test_map_error(self):
+        cancelled = []
+        consumed = []
+
+        async def work(i):
+            try:
+                if i == 2:
+                    raise MyExc
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(i)
+                raise
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        for ordered in (True, False):
+            cancelled.clear()
+            consumed.clear()
+            results = []
+            with self.assertRaises(ExceptionGroup) as cm:
+                async with taskgroups.TaskGroup() as tg:
+                    async for result in tg.map(work, items(), limit=4,
+                                               ordered=ordered):
+                        results.append(result)
+            self.assertEqual(get_error_types(cm.exception), {MyExc})
+            self.assertEqual(results, [])
+            self.assertEqual(consumed, [0, 1, 2, 3])
+            self.assertEqual(sorted(cancelled), [0, 1, 3])
+
+    async def test_map_close(self):
+        cancelled = []
+        never = asyncio.Event()
+
+        async def work(i):
+            try:
+                if i:
+                    await never.wait()
+            except asyncio.CancelledError:
+                cancelled.append(i)
+                raise
+            return i
+
+        async with taskgroups.TaskGroup() as tg:
+            async with contextlib.aclosing(
+                    tg.map(work, range(10), limit=3)) as it:
+                async for result in it:
+                    self.assertEqual(result, 0)
+                    break
+        self.assertEqual(sorted(cancelled), [1, 2])
+
+    async def test_map_invalid(self):
+        async def work(i):
+            return i
+
+        tg = taskgroups.TaskGroup()
+        with self.assertRaises(RuntimeError):
+            async for _ in tg.map(work, [1], limit=1):
+                pass
+        async with tg:
+            for limit in (0, -1):
+                with self.assertRaises(ValueError):
+                    tg.map(work, [1], limit=limit)
+
 
 if __name__ == "__main__":
     unittest.main()
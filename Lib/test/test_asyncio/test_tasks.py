@@ -2688,6 +2688,58 @@ def test_get_context(self):
         finally:
             loop.close()
 
+    def test_get_stats_disabled(self):
+        self.assertFalse(asyncio.get_task_accounting())
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        task = self.new_task(loop, coroutine_function())
+        loop.run_until_complete(task)
+        self.assertIsNone(task.get_stats())
+
+    def test_get_stats(self):
+        async def coro():
+            for _ in range(3):
+                await asyncio.sleep(0.01)
+            sum(range(10_000))
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        asyncio.set_task_accounting(True)
+        try:
+            self.assertTrue(asyncio.get_task_accounting())
+            task = self.new_task(loop, coro())
+        finally:
+            asyncio.set_task_accounting(False)
+        self.assertEqual(task.get_stats(), {'steps': 0, 'cpu_time': 0.0,
+                                            'run_time': 0.0, 'wait_time': 0.0})
+        loop.run_until_complete(task)
+        stats = task.get_stats()
+        self.assertEqual(stats['steps'], 4)
+        self.assertGreater(stats['run_time'], 0)
+        self.assertGreaterEqual(stats['cpu_time'], 0)
+        self.assertLess(stats['run_time'], stats['wait_time'])
+        self.assertGreaterEqual(stats['wait_time'], 0.025)
+
+    def test_get_stats_eager_start(self):
+        async def coro():
+            await asyncio.sleep(0)
+
+        async def main():
+            asyncio.set_task_accounting(True)
+            try:
+                task = self.__class__.Task(coro(), loop=loop,
+                                          eager_start=True)
+            finally:
+                asyncio.set_task_accounting(False)
+            self.assertEqual(task.get_stats()['steps'], 1)
+            await task
+            return task
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        task = loop.run_until_complete(main())
+        self.assertEqual(task.get_stats()['steps'], 2)
+
 
 def add_subclass_tests(cls):
     BaseTask = cls.Task
@@ -365,6 +365,21 @@ async def test_timeout_without_task(self):
         with self.assertRaisesRegex(RuntimeError, "has not been entered"):
             cm.reschedule(0.02)
 
+    async def test_reschedule_timer_wheel(self):
+        loop = asyncio.get_running_loop()
+        loop.set_timer_resolution(0.01)
+        self.addCleanup(loop.set_timer_resolution, None)
+        with self.assertRaises(TimeoutError):
+            async with asyncio.timeout(10) as cm:
+                handler = cm._timeout_handler
+                cm.reschedule(loop.time() + 20)
+                # The timer is moved rather than replaced.
+                self.assertIs(cm._timeout_handler, handler)
+                cm.reschedule(loop.time() + 0.02)
+                self.assertIs(cm._timeout_handler, handler)
+                await asyncio.sleep(10)
+        self.assertTrue(cm.expired())
+
     async def test_timeout_taskgroup(self):
         async def task():
             try:
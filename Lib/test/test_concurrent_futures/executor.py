@@ -1,3 +1,4 @@
+import itertools
 import threading
 import time
 import weakref
@@ -12,6 +13,10 @@ def mul(x, y):
 def capture(*args, **kwargs):
     return args, kwargs
 
+def sleep_and_return(delay, value):
+    time.sleep(delay)
+    return value
+
 
 class MyObject(object):
     def my_method(self):
@@ -54,6 +59,106 @@ def test_map_exception(self):
         self.assertEqual(i.__next__(), (0, 1))
         self.assertRaises(ZeroDivisionError, i.__next__)
 
+    def test_map_buffersize_type_validation(self):
+        for buffersize in ("foo", 2.0):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    TypeError,
+                    "buffersize must be an integer or None",
+                ):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+    def test_map_buffersize_value_validation(self):
+        for buffersize in (0, -1):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    ValueError,
+                    "buffersize must be None or > 0",
+                ):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+    def test_map_buffersize(self):
+        ints = range(4)
+        for buffersize in (1, 2, len(ints), len(ints) * 2):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(str, ints, buffersize=buffersize)
+                self.assertListEqual(list(res), ["0", "1", "2", "3"])
+
+    def test_map_buffersize_on_multiple_iterables(self):
+        ints = range(4)
+        for buffersize in (1, 2, len(ints), len(ints) * 2):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(mul, ints, ints, buffersize=buffersize)
+                self.assertListEqual(list(res), [0, 1, 4, 9])
+
+    def test_map_buffersize_with_chunksize(self):
+        res = self.executor.map(str, range(10), chunksize=3, buffersize=2)
+        self.assertListEqual(list(res), [str(i) for i in range(10)])
+
+    def test_map_buffersize_on_infinite_iterable(self):
+        res = self.executor.map(str, itertools.count(), buffersize=2)
+        self.assertEqual(next(res, None), "0")
+        self.assertEqual(next(res, None), "1")
+        self.assertEqual(next(res, None), "2")
+
+    def test_map_buffersize_on_empty_iterable(self):
+        res = self.executor.map(str, [], buffersize=2)
+        self.assertIsNone(next(res, None))
+
+    def test_map_buffersize_without_iterable(self):
+        res = self.executor.map(str, buffersize=2)
+        self.assertIsNone(next(res, None))
+
+    def test_map_buffersize_when_buffer_is_full(self):
+        ints = iter(range(4))
+        buffersize = 2
+        self.executor.map(str, ints, buffersize=buffersize)
+        self.executor.shutdown(wait=True)  # wait for tasks to complete
+        self.assertEqual(
+            next(ints),
+            buffersize,
+            msg="should have fetched only `buffersize` elements from `ints`.",
+        )
+
+    def test_map_unordered(self):
+        res = self.executor.map(pow, range(10), range(10), ordered=False)
+        self.assertCountEqual(list(res), list(map(pow, range(10), range(10))))
+
+        res = self.executor.map(pow, range(10), range(10), chunksize=3,
+                                ordered=False)
+        self.assertCountEqual(list(res), list(map(pow, range(10), range(10))))
+
+    def test_map_unordered_yields_completed_first(self):
+        res = self.executor.map(sleep_and_return, [1.0, 0], ["slow", "fast"],
+                                ordered=False)
+        self.assertEqual(next(res), "fast")
+        self.assertEqual(next(res), "slow")
+        self.assertIsNone(next(res, None))
+
+    def test_map_unordered_exception(self):
+        res = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5],
+                                ordered=False)
+        with self.assertRaises(ZeroDivisionError):
+            list(res)
+
+    def test_map_unordered_buffersize(self):
+        res = self.executor.map(str, range(10), buffersize=2, ordered=False)
+        self.assertCountEqual(list(res), [str(i) for i in range(10)])
+
+        res = self.executor.map(str, itertools.count(), buffersize=2,
+                                ordered=False)
+        self.assertIn(next(res), ["0", "1", "2"])
+
+    def test_map_unordered_buffersize_when_buffer_is_full(self):
+        ints = iter(range(4))
+        self.executor.map(str, ints, buffersize=2, ordered=False)
+        self.executor.shutdown(wait=True)
+        self.assertEqual(next(ints), 2)
+
+    def test_map_unordered_on_empty_iterable(self):
+        res = self.executor.map(str, [], ordered=False)
+        self.assertIsNone(next(res, None))
+
     @support.requires_resource('walltime')
     def test_map_timeout(self):
         results = []
@@ -69,6 +174,25 @@ def test_map_timeout(self):
 
         self.assertEqual([None, None], results)
 
+    @support.requires_resource('walltime')
+    def test_map_unordered_timeout(self):
+        results = []
+        with self.assertRaises(futures.TimeoutError):
+            for i in self.executor.map(time.sleep, [0, 0, 6], timeout=5,
+                                       ordered=False):
+                results.append(i)
+        self.assertEqual([None, None], results)
+
+    @support.requires_resource('walltime')
+    def test_map_unordered_timeout_slow_consumer(self):
+        # The deadline passes while the consumer is not waiting.
+        res = self.executor.map(time.sleep, [0, 6, 6], timeout=2,
+                                ordered=False)
+        self.assertIsNone(next(res))
+        time.sleep(2.5)
+        with self.assertRaises(futures.TimeoutError):
+            next(res)
+
     def test_shutdown_race_issue12456(self):
         # Issue #12456: race condition at shutdown where trying to post a
         # sentinel in the call queue blocks (the queue is full while processes
@@ -0,0 +1,128 @@
+import operator
+import pickle
+import sys
+import unittest
+from concurrent import futures
+from test.support import import_helper
+
+from .executor import ExecutorTest, mul
+from .util import BaseTestCase, InterpreterPoolMixin, setup_module
+
+_interpreters = import_helper.import_module('_interpreters')
+from concurrent.futures.interpreter import (
+    BrokenInterpreterPool, ExecutionFailed)
+
+
+def get_interpreter_id():
+    return _interpreters.get_current()[0]
+
+
+def get_main_attr(name):
+    return getattr(sys.modules['__main__'], name)
+
+
+def make_generator():
+    yield 1
+
+
+def set_module_attr(value):
+    sys.modules[__name__].state = value
+
+
+def get_module_attr():
+    return getattr(sys.modules[__name__], 'state', None)
+
+
+class InterpreterPoolExecutorTest(InterpreterPoolMixin, ExecutorTest,
+                                  BaseTestCase):
+    worker_count = 2
+
+    def test_runs_in_subinterpreter(self):
+        main_id = get_interpreter_id()
+        ids = {self.executor.submit(get_interpreter_id).result()
+               for _ in range(5)}
+        self.assertNotIn(main_id, ids)
+        self.assertLessEqual(len(ids), self.worker_count)
+
+    def test_isolated_module_state(self):
+        executor = self.executor_type(1)
+        with executor:
+            executor.submit(set_module_attr, 42).result()
+            self.assertEqual(executor.submit(get_module_attr).result(), 42)
+        self.assertIsNone(get_module_attr())
+
+    def test_interpreters_destroyed(self):
+        # The worker interpreters are destroyed by the worker threads
+        # before they exit.
+        before = {info[0] for info in _interpreters.list_all()}
+        with self.executor_type(2) as executor:
+            ids = {executor.submit(get_interpreter_id).result()
+                   for _ in range(4)}
+        self.assertTrue(ids)
+        after = {info[0] for info in _interpreters.list_all()}
+        self.assertEqual(after, before)
+
+    def test_exception(self):
+        future = self.executor.submit(operator.truediv, 1, 0)
+        with self.assertRaises(ZeroDivisionError):
+            future.result()
+
+    def test_unpicklable_result(self):
+        future = self.executor.submit(make_generator)
+        with self.assertRaises(ExecutionFailed):
+            future.result()
+
+    def test_unpicklable_callable(self):
+        with self.assertRaises((pickle.PicklingError, AttributeError)):
+            self.executor.submit(lambda: None)
+
+    def test_shareable_and_pickled_results(self):
+        self.assertEqual(self.executor.submit(mul, 6, 7).result(), 42)
+        self.assertEqual(self.executor.submit(dict, a=[1]).result(),
+                         {'a': [1]})
+        self.assertEqual(self.executor.submit(tuple, 'ab').result(),
+                         ('a', 'b'))
+
+    def test_shared(self):
+        executor = self.executor_type(1, shared={'spam': b'eggs'})
+        with executor:
+            self.assertEqual(executor.submit(get_main_attr, 'spam').result(),
+                             b'eggs')
+
+    def test_shared_not_shareable(self):
+        with self.assertRaises(ValueError):
+            self.executor_type(1, shared={'spam': object()})
+
+    def test_initializer(self):
+        executor = self.executor_type(1, initializer=set_module_attr,
+                                      initargs=('init',))
+        with executor:
+            self.assertEqual(executor.submit(get_module_attr).result(),
+                             'init')
+
+    def test_initializer_failed(self):
+        executor = self.executor_type(1, initializer=operator.truediv,
+                                      initargs=(1, 0))
+        with self.assertLogs('concurrent.futures', 'CRITICAL'):
+            future = executor.submit(mul, 1, 2)
+            with self.assertRaises(BrokenInterpreterPool):
+                future.result()
+        with self.assertRaises(futures.thread.BrokenThreadPool):
+            executor.submit(mul, 1, 2)
+        executor.shutdown()
+
+    def test_interpreters_destroyed(self):
+        before = len(_interpreters.list_all())
+        executor = self.executor_type(2)
+        list(executor.map(mul, range(10), range(10)))
+        self.assertGreater(len(_interpreters.list_all()), before)
+        executor.shutdown(wait=True)
+        self.assertEqual(len(_interpreters.list_all()), before)
+
+
+def setUpModule():
+    setup_module()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@
 import unittest
 from concurrent import futures
 from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.pool import AutoChunksize
 
 from test import support
 from test.support import hashlib_helper
@@ -59,6 +60,49 @@ def bad_map():
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_chunksize_auto(self):
+        ref = list(map(pow, range(200), range(200)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(200), range(200),
+                                   chunksize="auto")),
+            ref)
+        self.assertCountEqual(
+            list(self.executor.map(pow, range(200), range(200),
+                                   chunksize="auto", ordered=False)),
+            ref)
+
+        tuner = AutoChunksize()
+        self.assertEqual(
+            list(self.executor.map(pow, range(200), range(200),
+                                   chunksize=tuner)),
+            ref)
+        stats = tuner.stats()
+        self.assertEqual(stats[0].size, 1)
+        self.assertEqual(sum(s.size for s in stats), 200)
+        self.assertGreater(max(s.size for s in stats), 1)
+        for s in stats:
+            self.assertGreaterEqual(s.exec_time, 0)
+            self.assertGreaterEqual(s.latency, 0)
+
+    def test_map_chunksize_auto_capped(self):
+        # With iterables of known length, chunks are not larger than the
+        # default chunksize of Pool.map().
+        tuner = AutoChunksize()
+        tuner._chunksize = 1000
+        self.assertEqual(list(self.executor.map(str, range(80),
+                                                chunksize=tuner)),
+                         [str(i) for i in range(80)])
+        limit = -(-80 // (4 * self.worker_count))
+        for s in tuner.stats():
+            self.assertLessEqual(s.size, limit)
+
+    def test_map_chunksize_auto_is_lazy(self):
+        ints = iter(range(100))
+        res = self.executor.map(str, ints, chunksize="auto", buffersize=2)
+        self.assertEqual(next(res), "0")
+        # The first chunks only hold one item until timings are known.
+        self.assertLessEqual(next(ints), 3)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
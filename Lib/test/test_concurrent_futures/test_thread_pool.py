@@ -94,6 +94,173 @@ def log_n_wait(ident):
         self.assertListEqual(log, ["ident='first' started", "ident='first' stopped"])
 
 
+class ElasticThreadPoolExecutorTest(ThreadPoolMixin, ExecutorTest,
+                                    BaseTestCase):
+    executor_kwargs = {'idle_timeout': 0.05, 'min_workers': 1}
+
+    def wait_for_live_threads(self, executor, count):
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+            if executor.thread_counts().live == count:
+                break
+
+    def saturate(self, executor):
+        release = threading.Event()
+        started = threading.Barrier(executor._max_workers + 1)
+        def block():
+            started.wait()
+            release.wait()
+        fs = [executor.submit(block) for _ in range(executor._max_workers)]
+        started.wait()
+        return release, fs
+
+    def test_idle_threads_exit(self):
+        release, fs = self.saturate(self.executor)
+        self.assertEqual(self.executor.thread_counts(),
+                         (self.worker_count, 0, self.worker_count))
+        release.set()
+        futures.wait(fs)
+        # The pool shrinks back to min_workers.
+        self.wait_for_live_threads(self.executor, 1)
+        self.assertEqual(self.executor.thread_counts(), (1, 1, 0))
+
+        # and grows again when needed.
+        release, fs = self.saturate(self.executor)
+        self.assertEqual(self.executor.thread_counts().live,
+                         self.worker_count)
+        release.set()
+        futures.wait(fs)
+        self.wait_for_live_threads(self.executor, 1)
+
+    def test_shutdown_joins_retired_threads(self):
+        threads = []
+        def record():
+            threads.append(threading.current_thread())
+
+        with self.executor_type(2, idle_timeout=0.05) as executor:
+            release, fs = self.saturate(executor)
+            fs += [executor.submit(record) for _ in range(10)]
+            release.set()
+            futures.wait(fs)
+            self.wait_for_live_threads(executor, 0)
+        for t in threads:
+            self.assertFalse(t.is_alive())
+
+    def test_min_workers_zero(self):
+        with self.executor_type(2, idle_timeout=0.05) as executor:
+            self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+            self.wait_for_live_threads(executor, 0)
+            self.assertEqual(executor.thread_counts(), (0, 0, 0))
+            self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+
+    def test_work_stealing(self):
+        with self.executor_type(2, idle_timeout=0.05,
+                                work_stealing=True) as executor:
+            release, fs = self.saturate(executor)
+            release.set()
+            futures.wait(fs)
+            self.wait_for_live_threads(executor, 0)
+            self.assertEqual(executor._work_queue._owners, {})
+            self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+
+    def test_no_idle_timeout(self):
+        with self.executor_type(2) as executor:
+            release, fs = self.saturate(executor)
+            release.set()
+            futures.wait(fs)
+            for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+                if executor.thread_counts().idle == 2:
+                    break
+            self.assertEqual(executor.thread_counts(), (2, 2, 0))
+
+    def test_invalid_arguments(self):
+        with self.assertRaisesRegex(ValueError, "idle_timeout"):
+            self.executor_type(2, idle_timeout=0)
+        with self.assertRaisesRegex(ValueError, "min_workers"):
+            self.executor_type(2, idle_timeout=1, min_workers=3)
+        with self.assertRaisesRegex(ValueError, "min_workers"):
+            self.executor_type(2, min_workers=-1)
+
+
+class WorkStealingThreadPoolExecutorTest(ThreadPoolMixin, ExecutorTest,
+                                         BaseTestCase):
+    executor_kwargs = {'work_stealing': True}
+
+    def test_submit_from_worker_runs_on_same_thread(self):
+        # Calls submitted from a worker are queued to that worker, so with
+        # the other workers busy they run on the submitting thread.
+        release = threading.Event()
+        blockers = [self.executor.submit(release.wait)
+                    for _ in range(self.worker_count - 1)]
+
+        def parent():
+            child = self.executor.submit(threading.get_ident)
+            return threading.get_ident(), child
+
+        try:
+            ident, child = self.executor.submit(parent).result()
+            self.assertEqual(child.result(), ident)
+        finally:
+            release.set()
+        for f in blockers:
+            f.result()
+
+    def test_worker_registered_before_initializer(self):
+        registered = []
+        def initializer():
+            ident = threading.get_ident()
+            registered.append(ident in executor._work_queue._owners)
+
+        executor = self.executor_type(1, work_stealing=True,
+                                      initializer=initializer)
+        try:
+            self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+        finally:
+            executor.shutdown(wait=True)
+        self.assertEqual(registered, [True])
+
+    def test_idle_workers_steal_work(self):
+        # Calls queued to a blocked worker are run by the other workers.
+        def parent():
+            children = [self.executor.submit(threading.get_ident)
+                        for _ in range(10)]
+            futures.wait(children, timeout=support.SHORT_TIMEOUT)
+            return threading.get_ident(), children
+
+        ident, children = self.executor.submit(parent).result()
+        for child in children:
+            self.assertTrue(child.done())
+            self.assertNotEqual(child.result(), ident)
+
+    def test_shutdown_runs_pending_calls(self):
+        results = []
+        for i in range(100):
+            self.executor.submit(results.append, i)
+        self.executor.shutdown(wait=True)
+        self.assertCountEqual(results, range(100))
+
+    def test_shutdown_cancel_futures(self):
+        release = threading.Event()
+        blockers = [self.executor.submit(release.wait)
+                    for _ in range(self.worker_count)]
+        pending = [self.executor.submit(pow, 2, i) for i in range(20)]
+        release.set()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        for f in blockers:
+            self.assertTrue(f.result())
+        for f in pending:
+            self.assertTrue(f.done())
+
+    def test_recursive_submissions(self):
+        def fib(n):
+            if n < 2:
+                return n
+            a = self.executor.submit(fib, n - 1)
+            return fib(n - 2) + a.result()
+
+        # Each level blocks one worker while the next one is stolen.
+        self.assertEqual(self.executor.submit(fib, 4).result(), 3)
+
+
 def setUpModule():
     setup_module()
 
@@ -402,6 +402,229 @@ def test_empty_filter(self):
         r = logging.makeLogRecord({'name': 'spam.eggs'})
         self.assertTrue(f.filter(r))
 
+
+class MessageFilterTest(BaseTest):
+
+    """Test the sampling and rate limiting filters."""
+
+    expected_log_pat = r"^([\w.]+) -> (\w+): (.+)$"
+
+    def setUp(self):
+        super().setUp()
+        self.now = 0.0
+        self.enterContext(support.swap_attr(time, 'monotonic',
+                                            lambda: self.now))
+
+    def test_sampling(self):
+        spam = logging.getLogger("spam")
+        f = logging.SamplingFilter(0.5)
+        spam.addFilter(f)
+        self.addCleanup(spam.removeFilter, f)
+        with patch.object(f, '_random', side_effect=[0.2, 0.7, 0.49, 0.5]):
+            for i in range(4):
+                spam.info(self.next_message())
+        self.assert_log_lines([
+            ('spam', 'INFO', '1'),
+            ('spam', 'INFO', '3'),
+        ])
+
+        r = logging.makeLogRecord({})
+        self.assertFalse(logging.SamplingFilter(0.0).filter(r))
+        self.assertTrue(logging.SamplingFilter(1.0).filter(r))
+        self.assertRaises(ValueError, logging.SamplingFilter, -0.1)
+        self.assertRaises(ValueError, logging.SamplingFilter, 1.1)
+
+    def test_rate_limiting(self):
+        spam = logging.getLogger("spam")
+        eggs = logging.getLogger("eggs")
+        f = logging.RateLimitingFilter(1.0, burst=2)
+        for logger in (spam, eggs):
+            logger.addFilter(f)
+            self.addCleanup(logger.removeFilter, f)
+        for i in range(3):
+            spam.warning('down: %s', i)
+        eggs.warning('down: %s', 3)
+        spam.warning('up')
+        self.now = 0.5
+        spam.warning('down: %s', 4)
+        self.now = 1.5
+        spam.warning('down: %s', 5)
+        spam.warning('down: %s', 6)
+        self.assert_log_lines([
+            ('spam', 'WARNING', 'down: 0'),
+            ('spam', 'WARNING', 'down: 1'),
+            ('eggs', 'WARNING', 'down: 3'),
+            ('spam', 'WARNING', 'up'),
+            ('spam', 'WARNING', 'down: 5 (2 similar messages suppressed)'),
+        ])
+
+        self.assertRaises(ValueError, logging.RateLimitingFilter, 0)
+        self.assertRaises(ValueError, logging.RateLimitingFilter, 1, 0)
+
+    def test_rate_limiting_max_keys(self):
+        f = logging.RateLimitingFilter(1.0, maxKeys=2)
+        a, b, c = [logging.makeLogRecord({'msg': msg}) for msg in 'abc']
+        # The state of the oldest message is dropped to add a new one.
+        self.assertEqual([bool(f.filter(r)) for r in (a, b, a, c, a, c)],
+                         [True, True, False, True, True, False])
+        # Unhashable messages are keyed by their string.
+        r = logging.makeLogRecord({'msg': ['spam']})
+        self.assertTrue(f.filter(r))
+        self.assertFalse(f.filter(r))
+
+    def test_duplicate(self):
+        handler = self.root_logger.handlers[0]
+        f = logging.DuplicateFilter(10.0)
+        self.assertEqual(f.interval, 10.0)
+        handler.addFilter(f)
+        self.addCleanup(handler.removeFilter, f)
+        spam = logging.getLogger("spam")
+        for i in range(3):
+            spam.error('%s failed', 'spam')
+            spam.error('%s failed', 'eggs')
+        spam.error('%(name)s failed', {'name': 'ham'})
+        self.now = 9.0
+        spam.error('%s failed', 'spam')
+        self.now = 10.0
+        spam.error('%s failed', 'spam')
+        spam.error('%(name)s failed', {'name': 'ham'})
+        self.assert_log_lines([
+            ('spam', 'ERROR', 'spam failed'),
+            ('spam', 'ERROR', 'eggs failed'),
+            ('spam', 'ERROR', 'ham failed'),
+            # The duplicates of "eggs failed" are reported on their own.
+            ('spam', 'ERROR', 'eggs failed (2 similar messages suppressed)'),
+            ('spam', 'ERROR', 'spam failed (3 similar messages suppressed)'),
+            ('spam', 'ERROR', 'ham failed'),
+        ])
+        self.assertRaises(ValueError, logging.DuplicateFilter, 0)
+
+    def test_suppressed_reported(self):
+        # The suppressed messages are reported once the flood stops, when
+        # the filter is called for any message.
+        spam = logging.getLogger("spam")
+        eggs = logging.getLogger("eggs")
+        f = logging.RateLimitingFilter(1.0)
+        for logger in (spam, eggs):
+            logger.addFilter(f)
+            self.addCleanup(logger.removeFilter, f)
+        for i in range(3):
+            spam.warning('down: %s', i)
+        eggs.info('down: %s', 3)
+        eggs.info('down: %s', 4)
+        self.now = 0.9
+        eggs.warning('up')
+        self.now = 1.0
+        eggs.warning('up')
+        self.now = 3.0
+        eggs.warning('up')
+        self.assert_log_lines([
+            ('spam', 'WARNING', 'down: 0'),
+            ('eggs', 'INFO', 'down: 3'),
+            ('eggs', 'WARNING', 'up'),
+            ('spam', 'WARNING', 'down: 2 (2 similar messages suppressed)'),
+            ('eggs', 'INFO', 'down: 4 (1 similar messages suppressed)'),
+            ('eggs', 'WARNING', 'up (1 similar messages suppressed)'),
+        ])
+        # Nothing is left to report.
+        f.flush()
+        self.assert_log_lines([
+            ('spam', 'WARNING', 'down: 0'),
+            ('eggs', 'INFO', 'down: 3'),
+            ('eggs', 'WARNING', 'up'),
+            ('spam', 'WARNING', 'down: 2 (2 similar messages suppressed)'),
+            ('eggs', 'INFO', 'down: 4 (1 similar messages suppressed)'),
+            ('eggs', 'WARNING', 'up (1 similar messages suppressed)'),
+        ])
+
+    def test_flush(self):
+        # The suppressed messages are reported by flush() and shutdown().
+        handler = self.root_logger.handlers[0]
+        f = logging.DuplicateFilter()
+        handler.addFilter(f)
+        self.addCleanup(handler.removeFilter, f)
+        spam = logging.getLogger("spam")
+        for i in range(3):
+            spam.error('down')
+        f.flush()
+        spam.error('up')
+        spam.error('up')
+        logging.shutdown(handlerList=[])
+        self.assert_log_lines([
+            ('spam', 'ERROR', 'down'),
+            ('spam', 'ERROR', 'down (2 similar messages suppressed)'),
+            ('spam', 'ERROR', 'up'),
+            ('spam', 'ERROR', 'up (1 similar messages suppressed)'),
+        ])
+        # Only the handlers the filter is attached to are passed the reports.
+        handler.removeFilter(f)
+        spam.addFilter(f)
+        self.addCleanup(spam.removeFilter, f)
+        other = logging.getLogger("other")
+        other.addFilter(f)
+        self.addCleanup(other.removeFilter, f)
+        spam.error('again')
+        spam.error('again')
+        f.flush()
+        self.assert_log_lines([
+            ('spam', 'ERROR', 'down'),
+            ('spam', 'ERROR', 'down (2 similar messages suppressed)'),
+            ('spam', 'ERROR', 'up'),
+            ('spam', 'ERROR', 'up (1 similar messages suppressed)'),
+            ('spam', 'ERROR', 'again'),
+            ('spam', 'ERROR', 'again (1 similar messages suppressed)'),
+        ])
+
+    def test_duplicate_unhashable_args(self):
+        spam = logging.getLogger("spam")
+        f = logging.DuplicateFilter()
+        spam.addFilter(f)
+        self.addCleanup(spam.removeFilter, f)
+        for args in ([1], [2], [1], {'a': [3]}, {'a': [3]}):
+            spam.error('%s', args)
+        self.assert_log_lines([
+            ('spam', 'ERROR', '[1]'),
+            ('spam', 'ERROR', '[2]'),
+            ('spam', 'ERROR', "{'a': [3]}"),
+        ])
+
+    def test_admission_not_reused(self):
+        # An event admitted before the record is created, whose record is
+        # not passed to the filter, does not let another record pass.
+        spam = logging.getLogger("spam")
+        reject = lambda record: False
+        f = logging.DuplicateFilter()
+        for filt in (reject, f):
+            spam.addFilter(filt)
+            self.addCleanup(spam.removeFilter, filt)
+        spam.warning('up')
+        r = logging.makeLogRecord({'name': 'spam', 'msg': 'up'})
+        self.assertFalse(f.filter(r))
+        self.assert_log_lines([])
+
+    def test_before_record_creation(self):
+        # The events suppressed by a filter of the logger are not recorded.
+        records = []
+        old_factory = logging.getLogRecordFactory()
+        def factory(*args, **kwargs):
+            record = old_factory(*args, **kwargs)
+            records.append(record)
+            return record
+
+        logging.setLogRecordFactory(factory)
+        self.addCleanup(logging.setLogRecordFactory, old_factory)
+        spam = logging.getLogger("spam")
+        f = logging.DuplicateFilter()
+        spam.addFilter(f)
+        self.addCleanup(spam.removeFilter, f)
+        for i in range(5):
+            spam.warning('down')
+        self.assertEqual(len(records), 1)
+        self.assert_log_lines([('spam', 'WARNING', 'down')])
+        # A record passed to the logger directly is filtered too.
+        spam.handle(logging.makeLogRecord({'name': 'spam', 'msg': 'down'}))
+        self.assert_log_lines([('spam', 'WARNING', 'down')])
+
 #
 #   First, we define our levels. There can be as many as you want - the only
 #     limitations are that they should be integers, the lowest should be > 0 and
@@ -836,6 +1059,38 @@ def test_error_handling(self):
         finally:
             logging.raiseExceptions = old_raise
 
+    def test_emit_batch(self):
+        writes = []
+        class Stream(io.StringIO):
+            def write(self, s):
+                writes.append(s)
+                return super().write(s)
+
+        stream = Stream()
+        h = logging.StreamHandler(stream)
+        h.setFormatter(logging.Formatter('%(message)s'))
+        h.addFilter(lambda record: record.msg != 'filtered')
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('spam', 'filtered', 'eggs')]
+        h.handleBatch(records)
+        self.assertEqual(writes, ['spam\neggs\n'])
+
+        # A subclass overriding emit() gets each record.
+        class CustomStreamHandler(logging.StreamHandler):
+            def emit(self, record):
+                self.stream.write(record.msg.upper() + self.terminator)
+
+        writes.clear()
+        h = CustomStreamHandler(stream)
+        h.handleBatch(records)
+        self.assertEqual(writes, ['SPAM\n', 'FILTERED\n', 'EGGS\n'])
+
+    def test_emit_batch_error_handling(self):
+        h = TestStreamHandler(BadStream())
+        records = [logging.makeLogRecord({}), logging.makeLogRecord({})]
+        h.handleBatch(records)
+        self.assertIs(h.error_record, records[-1])
+
     def test_stream_setting(self):
         """
         Test setting the handler's stream
@@ -1907,6 +2162,19 @@ def test_output(self):
         self.handled.acquire()
         self.assertEqual(self.log_output, "spam\neggs\n")
 
+    def test_emit_batch(self):
+        if self.server_exception:
+            self.skipTest(self.server_exception)
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('spam', 'ham', 'eggs')]
+        with patch.object(self.sock_hdlr, 'send',
+                          wraps=self.sock_hdlr.send) as send:
+            self.sock_hdlr.handleBatch(records)
+        self.assertEqual(send.call_count, 1)
+        for _ in records:
+            self.handled.acquire()
+        self.assertEqual(self.log_output, "spam\nham\neggs\n")
+
     def test_noserver(self):
         if self.server_exception:
             self.skipTest(self.server_exception)
@@ -2007,6 +2275,17 @@ def test_output(self):
         self.handled.wait()
         self.assertEqual(self.log_output, "spam\neggs\n")
 
+    def test_emit_batch(self):
+        # Each record is sent in its own datagram.
+        if self.server_exception:
+            self.skipTest(self.server_exception)
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('spam', 'eggs')]
+        with patch.object(self.sock_hdlr, 'send',
+                          wraps=self.sock_hdlr.send) as send:
+            self.sock_hdlr.handleBatch(records)
+        self.assertEqual(send.call_count, 2)
+
 @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets required")
 class UnixDatagramHandlerTest(DatagramHandlerTest):
 
@@ -2209,6 +2488,30 @@ def test_output(self):
             self.root_logger.removeHandler(self.h_hdlr)
             self.h_hdlr.close()
 
+    def test_emit_batch(self):
+        messages = []
+        def handle_request(request):
+            messages.extend(parse_qs(urlparse(request.path).query)['msg'])
+            request.send_response(200)
+            request.end_headers()
+
+        self.server = server = TestHTTPServer(('localhost', 0), handle_request,
+                                              0.01)
+        server.start()
+        self.addCleanup(server.stop)
+        server.ready.wait()
+        h = logging.handlers.HTTPHandler('localhost:%d' % server.server_port,
+                                         '/frob')
+        self.addCleanup(h.close)
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('spam', 'ham', 'eggs')]
+        with patch.object(h, 'getConnection',
+                          wraps=h.getConnection) as get_connection:
+            h.handleBatch(records)
+        # The responses were read, so the requests were all handled.
+        self.assertEqual(messages, ['spam', 'ham', 'eggs'])
+        self.assertEqual(get_connection.call_count, 1)
+
 class MemoryTest(BaseTest):
 
     """Test memory persistence of logger objects."""
@@ -3742,6 +4045,44 @@ def test_custom_formatter_function_with_validate(self):
     def test_custom_formatter_function_with_defaults(self):
         self.assertRaises(ValueError, self.apply_config, self.custom_formatter_with_defaults)
 
+    def test_json_formatter(self):
+        config = {
+            'version': 1,
+            'formatters': {
+                'json': {
+                    'class': 'logging.JSONFormatter',
+                    'fields': {'level': 'levelname', 'msg': 'message',
+                               'host': 'hostname'},
+                    'defaults': {'hostname': 'spam'},
+                    'extra': False,
+                    'ensure_ascii': False,
+                },
+                'json2': {
+                    '()': 'logging.JSONFormatter',
+                    'fields': ['message'],
+                    'datefmt': '%Y',
+                },
+            },
+        }
+        formatters = {}
+        for name in ('json', 'json2'):
+            self.apply_config(config | {
+                'handlers': {name: {'class': 'logging.StreamHandler',
+                                    'formatter': name}}})
+            formatters[name] = logging.getHandlerByName(name).formatter
+        f = formatters['json']
+        self.assertIsInstance(f, logging.JSONFormatter)
+        self.assertEqual(f.fields, {'level': 'levelname', 'msg': 'message',
+                                    'host': 'hostname'})
+        self.assertEqual(f.defaults, {'hostname': 'spam'})
+        self.assertFalse(f.extra)
+        self.assertFalse(f.ensure_ascii)
+        f = formatters['json2']
+        self.assertIsInstance(f, logging.JSONFormatter)
+        self.assertEqual(f.fields, {'message': 'message'})
+        self.assertEqual(f.datefmt, '%Y')
+        self.assertTrue(f.extra)
+
     def test_baseconfig(self):
         d = {
             'atuple': (1, 2, 3),
@@ -3946,6 +4287,28 @@ def test_config_queue_handler(self):
             msg = str(ctx.exception)
             self.assertEqual(msg, "Unable to configure handler 'ah'")
 
+    @threading_helper.requires_working_threading()
+    def test_config_queue_handler_batch(self):
+        cd = copy.deepcopy(self.config_queue_handler)
+        fn = make_temp_file('.log', 'test_logging-cqh-')
+        cd['handlers']['h1']['filename'] = fn
+        cd['handlers']['ah']['batch_size'] = 10
+        cd['handlers']['ah']['batch_timeout'] = 0.5
+        self.apply_config(cd)
+        h = logging.getHandlerByName('h1')
+        self.addCleanup(closeFileHandler, h, fn)
+        qh = logging.getHandlerByName('ah')
+        self.assertEqual(qh.listener.batch_size, 10)
+        self.assertEqual(qh.listener.batch_timeout, 0.5)
+        qh.listener.start()
+        try:
+            logging.debug('foo')
+            logging.info('bar')
+        finally:
+            qh.listener.stop()
+        with open(fn, encoding='utf-8') as f:
+            self.assertEqual(f.read().splitlines(), ['foo', 'bar'])
+
     @threading_helper.requires_working_threading()
     @support.requires_subprocess()
     @patch("multiprocessing.Manager")
@@ -4346,6 +4709,89 @@ def test_queue_listener_with_multiple_handlers(self):
         listener.stop()
         self.assertEqual(self.stream.getvalue().strip(), "que -> ERROR: error")
 
+    @threading_helper.requires_working_threading()
+    def test_queue_listener_batch(self):
+        class BatchHandler(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def emit(self, record):
+                self.batches.append([record.msg])
+
+            def emitBatch(self, records):
+                self.batches.append([record.msg for record in records])
+
+        class RecordHandler:
+            # A handler without handleBatch().
+            level = logging.CRITICAL
+
+            def __init__(self):
+                self.records = []
+
+            def handle(self, record):
+                self.records.append(record.msg)
+
+        handler = BatchHandler()
+        handler.setLevel(logging.ERROR)
+        other = RecordHandler()
+        for i in range(5):
+            self.que_logger.critical(str(i))
+        self.que_logger.warning('5')
+        listener = logging.handlers.QueueListener(self.queue, handler, other,
+                                                  batch_size=3)
+        listener.start()
+        listener.stop()
+        self.assertEqual(handler.batches, [['0', '1', '2'], ['3', '4', '5']])
+        self.assertEqual(other.records, ['0', '1', '2', '3', '4', '5'])
+        self.assertEqual(self.queue.unfinished_tasks, 0)
+
+        # Now test with respect_handler_level set
+        handler.batches.clear()
+        other.records.clear()
+        for i in range(5):
+            self.que_logger.warning(str(i))
+        self.que_logger.critical('5')
+        listener = logging.handlers.QueueListener(
+            self.queue, handler, other, respect_handler_level=True,
+            batch_size=3)
+        listener.start()
+        listener.stop()
+        self.assertEqual(handler.batches, [['5']])
+        self.assertEqual(other.records, ['5'])
+
+    @threading_helper.requires_working_threading()
+    def test_queue_listener_batch_timeout(self):
+        calls = []
+        class Listener(logging.handlers.QueueListener):
+            def dequeue(self, block, timeout=None):
+                calls.append((block, timeout is not None))
+                return super().dequeue(block, timeout)
+
+        handler = TestHandler(support.Matcher())
+        listener = Listener(
+            self.queue, handler, batch_size=10,
+            batch_timeout=support.SHORT_TIMEOUT)
+        listener.start()
+        try:
+            # The records are waited for after the first one.
+            for i in range(3):
+                self.que_logger.warning(str(i))
+        finally:
+            listener.stop()
+        self.assertEqual([record['msg'] for record in handler.buffer],
+                         ['0', '1', '2'])
+        # All the records were dequeued through dequeue().
+        self.assertEqual(calls[0], (True, False))
+        self.assertEqual(set(calls[1:]), {(True, True)})
+        self.assertGreaterEqual(len(calls), 4)
+
+    def test_queue_listener_batch_invalid(self):
+        with self.assertRaises(ValueError):
+            logging.handlers.QueueListener(self.queue, batch_size=0)
+        with self.assertRaises(ValueError):
+            logging.handlers.QueueListener(self.queue, batch_timeout=-1)
+
 if hasattr(logging.handlers, 'QueueListener'):
     import multiprocessing
     from unittest.mock import patch
@@ -4732,6 +5178,50 @@ def test_time(self):
         f.format(r)
         self.assertEqual(r.asctime, '1993-04-21 08:03:00,123')
 
+    def test_time_cache(self):
+        r = self.get_record()
+        r.created = 1_000_000_000.25
+        r.msecs = 250
+        calls = []
+        def converter(t):
+            calls.append(t)
+            return time.gmtime(t)
+        f = logging.Formatter('%(asctime)s %(message)s')
+        f.converter = converter
+        self.assertEqual(f.formatTime(r), '2001-09-09 01:46:40,250')
+        # The formatted time is cached until the next second.
+        r.created = 1_000_000_000.75
+        r.msecs = 750
+        self.assertEqual(f.formatTime(r), '2001-09-09 01:46:40,750')
+        self.assertEqual(calls, [1_000_000_000.25])
+        self.assertEqual(f.formatTime(r, '%H:%M:%S'), '01:46:40')
+        self.assertEqual(len(calls), 2)
+        r.created = 1_000_000_001.0
+        self.assertEqual(f.formatTime(r, '%H:%M:%S'), '01:46:41')
+        self.assertEqual(len(calls), 3)
+        f.converter = time.localtime
+        self.assertEqual(f.formatTime(r, '%H:%M:%S'),
+                         time.strftime('%H:%M:%S', time.localtime(r.created)))
+        self.assertEqual(len(calls), 3)
+
+    def test_used_fields(self):
+        f = logging.Formatter('%(asctime)s %(levelname)-8s %(message)s')
+        self.assertEqual(f.usedFields(), {'asctime', 'levelname', 'message'})
+        f = logging.Formatter('{asctime} {name.upper} {lineno:{width}} '
+                              '{threadName[0]}', style='{')
+        self.assertEqual(f.usedFields(),
+                         {'asctime', 'name', 'lineno', 'width', 'threadName'})
+        f = logging.Formatter('$asctime ${funcName} $$process', style='$')
+        self.assertEqual(f.usedFields(), {'asctime', 'funcName'})
+        f = logging.Formatter('{message', style='{', validate=False)
+        self.assertIsNone(f.usedFields())
+
+        class CustomFormatter(logging.Formatter):
+            def format(self, record):
+                return f'{record.lineno}: {super().format(record)}'
+
+        self.assertIsNone(CustomFormatter().usedFields())
+
     def test_default_msec_format_none(self):
         class NoMsecFormatter(logging.Formatter):
             default_msec_format = None
@@ -4824,6 +5314,136 @@ def test_relativeCreated_has_higher_precision(self):
                 self.assertAlmostEqual(relativeCreated, offset_ns / 1e6, places=7)
 
 
+class JSONFormatterTest(unittest.TestCase):
+    def get_record(self, **kwargs):
+        d = {
+            'name': 'formatter.test',
+            'levelno': logging.WARNING,
+            'levelname': 'WARNING',
+            'msg': 'Message with %d %s',
+            'args': (2, 'placeholders'),
+            'created': 1700000000.5,
+        }
+        d.update(kwargs)
+        return logging.makeLogRecord(d)
+
+    def test_default(self):
+        f = logging.JSONFormatter()
+        r = self.get_record()
+        s = f.format(r)
+        self.assertNotIn('\n', s)
+        self.assertEqual(json.loads(s), {
+            'asctime': f.formatTime(r),
+            'levelname': 'WARNING',
+            'name': 'formatter.test',
+            'message': 'Message with 2 placeholders',
+        })
+        self.assertTrue(f.usesTime())
+        self.assertEqual(f.usedFields(),
+                         {'asctime', 'levelname', 'name', 'message'})
+
+    def test_fields(self):
+        f = logging.JSONFormatter(['levelno', 'message', 'created', 'funcName',
+                                   'missing'])
+        self.assertFalse(f.usesTime())
+        r = self.get_record()
+        self.assertEqual(
+            f.format(r),
+            '{"levelno":30,"message":"Message with 2 placeholders",'
+            '"created":1700000000.5,"funcName":null}')
+        self.assertFalse(hasattr(r, 'asctime'))
+
+        f = logging.JSONFormatter({'level': 'levelname', 'msg': 'message',
+                                   'host': 'hostname'},
+                                  defaults={'hostname': 'spam'})
+        self.assertEqual(json.loads(f.format(r)),
+                         {'level': 'WARNING',
+                          'msg': 'Message with 2 placeholders',
+                          'host': 'spam'})
+        r.hostname = 'eggs'
+        self.assertEqual(json.loads(f.format(r))['host'], 'eggs')
+
+        self.assertRaises(TypeError, logging.JSONFormatter, [1])
+        self.assertRaises(TypeError, logging.JSONFormatter, {'a': None})
+
+    def test_extra(self):
+        obj = object()
+        r = self.get_record(user='bob', ids=[1, 2], ratio=0.25, ok=True,
+                            obj=obj, nan=float('nan'))
+        f = logging.JSONFormatter(['message'])
+        self.assertEqual(
+            f.format(r),
+            '{"message":"Message with 2 placeholders","user":"bob",'
+            '"ids":[1,2],"ratio":0.25,"ok":true,"obj":%s,"nan":"nan"}'
+            % json.dumps(str(obj)))
+        # An extra which is also a selected field is only output once.
+        f = logging.JSONFormatter({'who': 'user'})
+        self.assertEqual(json.loads(f.format(r))['who'], 'bob')
+        self.assertNotIn('"user"', f.format(r))
+
+        f = logging.JSONFormatter(['message'], extra=False)
+        self.assertEqual(f.format(r), '{"message":"Message with 2 placeholders"}')
+
+    def test_not_serializable(self):
+        # The output is always valid JSON.
+        values = {'inf': float('-inf'), 'floats': [1.5, float('inf')],
+                  'keys': {(1, 2): 'spam'}}
+        r = self.get_record(**values)
+        f = logging.JSONFormatter([])
+        self.assertEqual(json.loads(f.format(r)),
+                         {name: str(value) for name, value in values.items()})
+
+    def test_record_factory(self):
+        # The attributes set by a record factory are extras.
+        old_factory = logging.getLogRecordFactory()
+        def factory(*args, **kwargs):
+            record = old_factory(*args, **kwargs)
+            record.custom = 'spam'
+            return record
+
+        logging.setLogRecordFactory(factory)
+        self.addCleanup(logging.setLogRecordFactory, old_factory)
+        f = logging.JSONFormatter(['message'])
+        r = logging.getLogger('json.factory').makeRecord(
+            'json.factory', logging.INFO, 'spam.py', 1, 'msg', (), None)
+        self.assertEqual(f.format(r), '{"message":"msg","custom":"spam"}')
+
+    def test_ensure_ascii(self):
+        r = self.get_record(msg='caf\xe9 \u20ac "%s"', args=('\n',))
+        f = logging.JSONFormatter(['message'])
+        s = f.format(r)
+        self.assertEqual(s, '{"message":"caf\\u00e9 \\u20ac \\"\\n\\""}')
+        f = logging.JSONFormatter(['message'], ensure_ascii=False)
+        self.assertEqual(f.format(r), '{"message":"caf\xe9 \u20ac \\"\\n\\""}')
+        self.assertEqual(json.loads(f.format(r)), json.loads(s))
+
+    def test_exc_info(self):
+        try:
+            1/0
+        except ZeroDivisionError:
+            r = self.get_record(exc_info=sys.exc_info(), stack_info='Stack')
+        f = logging.JSONFormatter(['message'])
+        d = json.loads(f.format(r))
+        self.assertEqual(d['stack_info'], 'Stack')
+        self.assertEqual(d['exc_info'], r.exc_text)
+        self.assertTrue(d['exc_info'].startswith('Traceback'))
+        self.assertIn('ZeroDivisionError', d['exc_info'])
+
+    def test_lean_records(self):
+        stream = io.StringIO()
+        h = logging.StreamHandler(stream)
+        h.setFormatter(logging.JSONFormatter(['message', 'lineno']))
+        logger = logging.getLogger('json.lean')
+        logger.propagate = False
+        logger.addHandler(h)
+        self.addCleanup(logger.removeHandler, h)
+        with support.swap_attr(logging, 'leanRecords', True):
+            logger.warning('spam')
+        d = json.loads(stream.getvalue())
+        self.assertEqual(d['message'], 'spam')
+        self.assertGreater(d['lineno'], 0)
+
+
 class TestBufferingFormatter(logging.BufferingFormatter):
     def formatHeader(self, records):
         return '[(%d)' % len(records)
@@ -5321,6 +5941,25 @@ def test_optional(self):
             logging.logMultiprocessing = log_multiprocessing
             logging.logAsyncioTasks = log_asyncio_tasks
 
+    def test_fields(self):
+        r = logging.LogRecord('name', logging.INFO, '/path/mod.py', 1, 'msg',
+                              (), None, fields={'threadName', 'message'})
+        self.assertIsNotNone(r.thread)
+        self.assertEqual(r.threadName, threading.current_thread().name)
+        self.assertIsNone(r.filename)
+        self.assertIsNone(r.module)
+        self.assertIsNone(r.process)
+        self.assertIsNone(r.processName)
+        self.assertIsNone(r.taskName)
+        r = logging.LogRecord('name', logging.INFO, '/path/mod.py', 1, 'msg',
+                              (), None, fields={'module', 'process',
+                                                'processName'})
+        self.assertEqual(r.filename, 'mod.py')
+        self.assertEqual(r.module, 'mod')
+        self.assertIsNone(r.threadName)
+        self.assertEqual(r.process, os.getpid())
+        self.assertEqual(r.processName, 'MainProcess')
+
     async def _make_record_async(self, assertion):
         r = logging.makeLogRecord({})
         assertion(r.taskName)
@@ -5965,6 +6604,95 @@ def test_log_invalid_level_no_raise(self):
         with support.swap_attr(logging, 'raiseExceptions', False):
             self.logger.log('10', 'test message')  # no exception happens
 
+    def test_lean_records(self):
+        self.recording.setFormatter(logging.Formatter('%(message)s'))
+        with support.swap_attr(logging, 'leanRecords', True):
+            self.logger.warning('test')
+            self.assertEqual(self.logger._usedFields(), {'message'})
+            self.recording.setFormatter(
+                logging.Formatter('%(lineno)d %(threadName)s %(message)s'))
+            self.logger.warning('test')
+            # A filter can use any field.
+            self.logger.addFilter(lambda record: True)
+            self.logger.warning('test')
+        self.logger.filters.clear()
+        self.recording.setFormatter(logging.Formatter('%(message)s'))
+        self.logger.warning('test')
+
+        lean, lineno, filtered, full = self.recording.records
+        self.assertEqual(lean.pathname, '(unknown file)')
+        self.assertEqual(lean.lineno, 0)
+        self.assertEqual(lean.funcName, '(unknown function)')
+        self.assertIsNone(lean.threadName)
+        self.assertIsNone(lean.process)
+        self.assertEqual(lean.getMessage(), 'test')
+        self.assertEqual(lineno.pathname, __file__)
+        self.assertEqual(lineno.funcName, 'test_lean_records')
+        self.assertGreater(lineno.lineno, 0)
+        self.assertIsNotNone(lineno.threadName)
+        self.assertIsNone(lineno.process)
+        self.assertIsNone(lineno.filename)
+        for record in filtered, full:
+            self.assertEqual(record.funcName, 'test_lean_records')
+            self.assertEqual(record.filename, os.path.basename(__file__))
+            self.assertIsNotNone(record.threadName)
+            self.assertIsNotNone(record.process)
+
+    def test_lean_records_custom_factory(self):
+        # Custom factories and makeRecord() overrides which do not accept
+        # fields are given complete records.
+        self.recording.setFormatter(logging.Formatter('%(message)s'))
+        old_factory = logging.getLogRecordFactory()
+        def factory(name, level, fn, lno, msg, args, exc_info, func=None,
+                    sinfo=None):
+            return old_factory(name, level, fn, lno, msg, args, exc_info,
+                               func, sinfo)
+
+        class MyLogger(logging.Logger):
+            def makeRecord(self, name, level, fn, lno, msg, args, exc_info,
+                           func=None, extra=None, sinfo=None):
+                return super().makeRecord(name, level, fn, lno, msg, args,
+                                          exc_info, func, extra, sinfo)
+
+        logger = MyLogger('custom')
+        logger.addHandler(self.recording)
+        with support.swap_attr(logging, 'leanRecords', True):
+            logger.warning('test')
+            logging.setLogRecordFactory(factory)
+            try:
+                self.logger.warning('test')
+            finally:
+                logging.setLogRecordFactory(old_factory)
+
+        for record in self.recording.records:
+            self.assertEqual(record.funcName,
+                             'test_lean_records_custom_factory')
+            self.assertIsNotNone(record.threadName)
+            self.assertIsNotNone(record.process)
+
+    def test_lean_records_used_fields(self):
+        root = logging.getLogger()
+        logger = logging.getLogger('blah.child')
+        formatter = logging.Formatter('%(funcName)s %(message)s')
+        self.root_hdlr.setFormatter(formatter)
+        self.assertEqual(logger._usedFields(), {'funcName', 'message'})
+        logger.propagate = False
+        self.assertEqual(logger._usedFields(),
+                         logging.lastResort.usedFields())
+        logger.propagate = True
+        # Handlers which send the whole record.
+        for handler in (logging.handlers.SocketHandler('localhost', 0),
+                        logging.handlers.HTTPHandler('localhost', '/'),
+                        logging.handlers.MemoryHandler(10),
+                        logging.handlers.QueueHandler(queue.Queue())):
+            with self.subTest(handler=handler):
+                root.addHandler(handler)
+                self.assertIsNone(logger._usedFields())
+                root.removeHandler(handler)
+                handler.close()
+        self.root_hdlr.addFilter(lambda record: True)
+        self.assertIsNone(logger._usedFields())
+
     def test_find_caller_with_stack_info(self):
         called = []
         support.patch(self, logging.traceback, 'print_stack',
@@ -6184,6 +6912,15 @@ def test_delay(self):
         self.assertTrue(os.path.exists(self.fn))
         fh.close()
 
+    def test_emit_batch(self):
+        os.unlink(self.fn)
+        fh = logging.FileHandler(self.fn, encoding='utf-8', delay=True)
+        fh.setFormatter(logging.Formatter('%(message)s'))
+        fh.handleBatch([self.next_rec(), self.next_rec()])
+        fh.close()
+        with open(self.fn, encoding='utf-8') as fp:
+            self.assertEqual(fp.read(), '1\n2\n')
+
     def test_emit_after_closing_in_write_mode(self):
         # Issue #42378
         os.unlink(self.fn)
@@ -6242,6 +6979,20 @@ def test_file_created(self):
         self.assertLogFile(self.fn)
         rh.close()
 
+    def test_emit_batch(self):
+        # The file can be rolled over between the records of a batch.
+        os.unlink(self.fn)
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, encoding="utf-8", backupCount=2, maxBytes=1)
+        rh.setFormatter(logging.Formatter('%(message)s'))
+        rh.handleBatch([self.next_rec(), self.next_rec(), self.next_rec()])
+        rh.close()
+        for fn, msg in ((self.fn + ".2", '1'), (self.fn + ".1", '2'),
+                        (self.fn, '3')):
+            self.assertLogFile(fn)
+            with open(fn, encoding="utf-8") as fp:
+                self.assertEqual(fp.read(), msg + '\n')
+
     def test_max_bytes(self, delay=False):
         kwargs = {'delay': delay} if delay else {}
         os.unlink(self.fn)
@@ -6268,6 +7019,110 @@ def test_max_bytes(self, delay=False):
     def test_max_bytes_delay(self):
         self.test_max_bytes(delay=True)
 
+    def test_max_bytes_encoded(self):
+        # The size of the file is counted in bytes.
+        os.unlink(self.fn)
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, encoding="utf-8", backupCount=1, maxBytes=12)
+        record = logging.makeLogRecord({'msg': '\xe9' * 4})
+        rh.emit(record)
+        self.assertFalse(rh.shouldRollover(logging.makeLogRecord({'msg': 'a'})))
+        self.assertTrue(rh.shouldRollover(record))
+        rh.close()
+
+    def test_size_tracking(self):
+        # The position in the file is only looked up when it is opened.
+        tells = []
+        class Stream(io.TextIOWrapper):
+            def tell(self):
+                tells.append(self)
+                return super().tell()
+
+        class Handler(logging.handlers.RotatingFileHandler):
+            def _open(self):
+                return Stream(open(self.baseFilename, 'ab'), encoding='utf-8')
+
+        rh = Handler(self.fn, encoding="utf-8", backupCount=1, maxBytes=20)
+        for i in range(10):
+            rh.emit(self.next_rec())
+        rh.close()
+        self.assertLogFile(self.fn + ".1")
+        self.assertEqual(len(tells), len(set(tells)))
+        with open(self.fn + ".1", encoding="utf-8") as fp:
+            self.assertLess(len(fp.read()), 20)
+
+    def test_size_tracking_newlines(self):
+        # The tracked size is the size of the file, including the newlines
+        # written as "\r\n" on Windows.
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, encoding="utf-8", backupCount=1, maxBytes=1000)
+        for msg in ('spam', 'multi\nline', '\xe9\n\xe9'):
+            rh.emit(logging.makeLogRecord({'msg': msg}))
+            self.assertEqual(rh._size, os.path.getsize(self.fn))
+        rh.close()
+
+    @threading_helper.requires_working_threading()
+    def test_background(self):
+        rotated = threading.Event()
+        release = threading.Event()
+        threads = []
+        def rotator(source, dest):
+            threads.append(threading.current_thread())
+            release.wait(support.SHORT_TIMEOUT)
+            os.rename(source, dest)
+            rotated.set()
+
+        os.unlink(self.fn)
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, encoding="utf-8", backupCount=2, maxBytes=1,
+            background=True)
+        rh.rotator = rotator
+        try:
+            rh.emit(self.next_rec())
+            # The rotations wait for release, but the records are written to
+            # a new file.
+            rh.emit(self.next_rec())
+            rh.emit(self.next_rec())
+            self.assertFalse(rotated.is_set())
+            with open(self.fn, encoding="utf-8") as fp:
+                self.assertEqual(fp.read(), '3\n')
+        finally:
+            release.set()
+            rh.close()
+        self.assertEqual(len(threads), 2)
+        self.assertIsNot(threads[0], threading.current_thread())
+        for fn, msg in ((self.fn + ".2", '1'), (self.fn + ".1", '2'),
+                        (self.fn, '3')):
+            self.assertLogFile(fn)
+            with open(fn, encoding="utf-8") as fp:
+                self.assertEqual(fp.read(), msg + '\n')
+
+    def test_background_leftover(self):
+        # The files left behind by a rotation are not replaced.
+        leftovers = ['%s.rotating.1' % self.fn,
+                     '%s.rotating.%d.1' % (self.fn, os.getpid())]
+        for leftover in leftovers:
+            with open(leftover, 'w', encoding="utf-8") as fp:
+                fp.write('leftover')
+            self.addCleanup(os_helper.unlink, leftover)
+        os.unlink(self.fn)
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, encoding="utf-8", backupCount=1, maxBytes=1,
+            background=True)
+        rh.emit(self.next_rec())
+        rh.emit(self.next_rec())
+        rh.close()
+        for leftover in leftovers:
+            with open(leftover, encoding="utf-8") as fp:
+                self.assertEqual(fp.read(), 'leftover')
+            os.unlink(leftover)
+        self.assertLogFile(self.fn + ".1")
+        with open(self.fn + ".1", encoding="utf-8") as fp:
+            self.assertEqual(fp.read(), '1\n')
+        dirname, basename = os.path.split(self.fn)
+        self.assertEqual([name for name in os.listdir(dirname)
+                          if name.startswith(basename + '.rotating')], [])
+
     def test_rollover_filenames(self):
         def namer(name):
             return name + ".test"
@@ -6405,6 +7260,37 @@ def test_rollover(self):
                     print(tf.read())
         self.assertTrue(found, msg=msg)
 
+    @threading_helper.requires_working_threading()
+    def test_background(self):
+        old = [self.fn + '.2000-01-01_00-00-0%d' % i for i in range(2)]
+        for fn in old:
+            with open(fn, 'w', encoding='utf-8'):
+                pass
+            self.addCleanup(os_helper.unlink, fn)
+        threads = []
+        def rotator(source, dest):
+            threads.append(threading.current_thread())
+            os.rename(source, dest)
+
+        fh = logging.handlers.TimedRotatingFileHandler(
+            self.fn, 'S', encoding="utf-8", backupCount=1, background=True)
+        fh.rotator = rotator
+        fh.emit(self.next_rec())
+        rolloverAt = fh.rolloverAt = int(time.time())
+        fh.emit(self.next_rec())
+        fh.close()
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        dfn = self.fn + time.strftime('.%Y-%m-%d_%H-%M-%S',
+                                      time.localtime(rolloverAt - 1))
+        self.assertLogFile(dfn)
+        with open(dfn, encoding="utf-8") as fp:
+            self.assertEqual(fp.read(), '1\n')
+        with open(self.fn, encoding="utf-8") as fp:
+            self.assertEqual(fp.read(), '2\n')
+        for fn in old:
+            self.assertFalse(os.path.exists(fn))
+
     def test_rollover_at_midnight(self, weekly=False):
         os_helper.unlink(self.fn)
         now = datetime.datetime.now()
@@ -7119,7 +8005,7 @@ def test__all__(self):
             'logThreads', 'logMultiprocessing', 'logProcesses', 'currentframe',
             'PercentStyle', 'StrFormatStyle', 'StringTemplateStyle',
             'Filterer', 'PlaceHolder', 'Manager', 'RootLogger', 'root',
-            'threading', 'logAsyncioTasks'}
+            'threading', 'logAsyncioTasks', 'leanRecords'}
         support.check__all__(self, logging, not_exported=not_exported)
 
 
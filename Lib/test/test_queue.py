@@ -228,6 +228,68 @@ def test_nowait(self):
         with self.assertRaises(self.queue.Empty):
             q.get_nowait()
 
+    def test_put_many_get_many(self):
+        q = self.type2test(QUEUE_SIZE)
+        q.put_many(iter([3, 1, 2]))
+        self.assertEqual(q.qsize(), 3)
+        self.assertEqual(q.unfinished_tasks, 3)
+        # Not enough free slots: nothing is put.
+        with self.assertRaises(self.queue.Full):
+            q.put_many([4, 5, 6], block=False)
+        with self.assertRaises(self.queue.Full):
+            q.put_many([4, 5, 6], timeout=0.01)
+        # The items which fit were put before the timeout.
+        self.assertEqual(q.qsize(), QUEUE_SIZE)
+        items = q.get_many(2)
+        self.assertEqual(len(items), 2)
+        items += q.get_many(10, block=False)
+        self.assertEqual(sorted(items), [1, 2, 3, 4, 5])
+        with self.assertRaises(self.queue.Empty):
+            q.get_many(10, block=False)
+        with self.assertRaises(self.queue.Empty):
+            q.get_many(10, timeout=0.01)
+        with self.assertRaises(ValueError):
+            q.get_many(0)
+        with self.assertRaises(ValueError):
+            q.get_many(1, timeout=-1)
+        q.put_many([])
+        self.assertTrue(q.empty())
+
+    def test_put_many_blocking(self):
+        q = self.type2test(QUEUE_SIZE)
+        self.do_blocking_test(q.put_many, (range(QUEUE_SIZE + 2),),
+                              q.get_many, (2,))
+        self.assertEqual(q.qsize(), QUEUE_SIZE)
+        self.assertEqual(q.unfinished_tasks, QUEUE_SIZE + 2)
+
+    def test_get_many_blocking(self):
+        q = self.type2test(QUEUE_SIZE)
+        items = self.do_blocking_test(q.get_many, (QUEUE_SIZE,),
+                                      q.put_many, ([2, 1],))
+        self.assertEqual(sorted(items), [1, 2])
+
+    def test_shutdown_put_many_get_many(self):
+        q = self.type2test(QUEUE_SIZE)
+        q.put_many([1, 2])
+        q.shutdown()
+        with self.assertRaises(self.queue.ShutDown):
+            q.put_many([3])
+        self.assertEqual(sorted(q.get_many(QUEUE_SIZE)), [1, 2])
+        with self.assertRaises(self.queue.ShutDown):
+            q.get_many(QUEUE_SIZE)
+
+        q = self.type2test(QUEUE_SIZE)
+        with self.assertRaises(self.queue.ShutDown):
+            self.do_exceptional_blocking_test(
+                q.put_many, (range(QUEUE_SIZE + 1),), q.shutdown, (),
+                self.queue.ShutDown)
+        self.assertEqual(q.qsize(), QUEUE_SIZE)
+        q = self.type2test(QUEUE_SIZE)
+        with self.assertRaises(self.queue.ShutDown):
+            self.do_exceptional_blocking_test(
+                q.get_many, (QUEUE_SIZE,), q.shutdown, (True,),
+                self.queue.ShutDown)
+
     def test_shrinking_queue(self):
         # issue 10110
         q = self.type2test(3)
@@ -994,6 +1056,59 @@ def test_many_threads_timeout(self):
 
         self.assertEqual(sorted(results), inputs)
 
+    def test_put_many_get_many(self):
+        q = self.q
+        q.put_many(iter(range(10)))
+        q.put_many([])
+        self.assertEqual(q.qsize(), 10)
+        self.assertEqual(q.get_many(3), [0, 1, 2])
+        self.assertEqual(q.get_many(100, block=False), list(range(3, 10)))
+        self.assertTrue(q.empty())
+        with self.assertRaises(self.queue.Empty):
+            q.get_many(3, block=False)
+        with self.assertRaises(self.queue.Empty):
+            q.get_many(3, timeout=1e-3)
+        with self.assertRaises(ValueError):
+            q.get_many(0)
+        with self.assertRaises(TypeError):
+            q.put_many(None)
+
+        # Grow the buffer while it wraps around.
+        q.put_many(range(6))
+        q.get_many(5)
+        q.put_many(range(6, 100))
+        self.assertEqual(q.get_many(200), list(range(5, 100)))
+
+    def test_many_threads_get_many(self):
+        # Test multiple concurrent put_many() and get_many()
+        N = 10
+        q = self.q
+        inputs = list(range(10000))
+
+        def feed(q, seq, rnd, sentinel):
+            while True:
+                vals = []
+                try:
+                    for _ in range(7):
+                        vals.append(seq.pop())
+                except IndexError:
+                    q.put_many(vals + [sentinel])
+                    return
+                q.put_many(vals)
+
+        def consume(q, results, sentinel):
+            while True:
+                vals = q.get_many(5)
+                results.extend(val for val in vals if val != sentinel)
+                sentinels = vals.count(sentinel)
+                if sentinels:
+                    # Leave the other sentinels to the other consumers.
+                    q.put_many([sentinel] * (sentinels - 1))
+                    return
+
+        results = self.run_threads(N, q, inputs, feed, consume)
+        self.assertEqual(sorted(results), inputs)
+
     def test_references(self):
         # The queue should lose references to each item as soon as
         # it leaves the queue.
@@ -9,6 +9,7 @@
 #include "pycore_modsupport.h"    // _PyArg_CheckPositional()
 #include "pycore_moduleobject.h"  // _PyModule_GetState()
 #include "pycore_object.h"        // _Py_SetImmortalUntracked
+#include "pycore_pyatomic_ft_wrappers.h" // FT_ATOMIC_LOAD_UINT8_RELAXED()
 #include "pycore_pyerrors.h"      // _PyErr_ClearExcState()
 #include "pycore_pylifecycle.h"   // _Py_IsInterpreterFinalizing()
 #include "pycore_pystate.h"       // _PyThreadState_GET()
@@ -55,11 +56,18 @@ typedef struct TaskObj {
     FutureObj_HEAD(task)
     unsigned task_must_cancel: 1;
     unsigned task_log_destroy_pending: 1;
+    unsigned task_accounting: 1;
     int task_num_cancels_requested;
     PyObject *task_fut_waiter;
     PyObject *task_coro;
     PyObject *task_name;
     PyObject *task_context;
+    /* Accounting of the steps, only updated if task_accounting is set. */
+    Py_ssize_t task_steps;
+    PyTime_t task_cpu_time;
+    PyTime_t task_run_time;
+    PyTime_t task_wait_time;
+    PyTime_t task_suspended_at;
     struct TaskObj *next;
     struct TaskObj *prev;
 } TaskObj;
@@ -135,6 +143,12 @@ typedef struct {
     /* Imports from traceback. */
     PyObject *traceback_extract_stack;
 
+    /* Imports from time, NULL if thread_time_ns() is not available. */
+    PyObject *time_thread_time_ns;
+
+    /* Whether the tasks account for their steps when created. */
+    uint8_t task_accounting;
+
     /* Counter for autogenerated Task names */
     uint64_t task_name_counter;
 
@@ -2123,6 +2137,14 @@ _asyncio_Task___init___impl(TaskObj *self, PyObject *coro, PyObject *loop,
     self->task_must_cancel = 0;
     self->task_log_destroy_pending = 1;
     self->task_num_cancels_requested = 0;
+    self->task_accounting = FT_ATOMIC_LOAD_UINT8_RELAXED(state->task_accounting);
+    if (self->task_accounting) {
+        self->task_steps = 0;
+        self->task_cpu_time = 0;
+        self->task_run_time = 0;
+        self->task_wait_time = 0;
+        (void)PyTime_PerfCounterRaw(&self->task_suspended_at);
+    }
     Py_INCREF(coro);
     Py_XSETREF(self->task_coro, coro);
 
@@ -2517,6 +2539,29 @@ _asyncio_Task_get_coro_impl(TaskObj *self)
     Py_RETURN_NONE;
 }
 
+/*[clinic input]
+_asyncio.Task.get_stats
+
+Return the accounting of the steps of the task, or None.
+
+The dict has the number of steps, the cpu_time and run_time spent
+running them, and the wait_time spent between them, in seconds.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_Task_get_stats_impl(TaskObj *self)
+/*[clinic end generated code: output=a1dc6cbdc54f9073 input=42647b0713543a3b]*/
+{
+    if (!self->task_accounting) {
+        Py_RETURN_NONE;
+    }
+    return Py_BuildValue("{s:n,s:d,s:d,s:d}",
+                         "steps", self->task_steps,
+                         "cpu_time", PyTime_AsSecondsDouble(self->task_cpu_time),
+                         "run_time", PyTime_AsSecondsDouble(self->task_run_time),
+                         "wait_time", PyTime_AsSecondsDouble(self->task_wait_time));
+}
+
 /*[clinic input]
 _asyncio.Task.get_context
 [clinic start generated code]*/
@@ -2665,6 +2710,7 @@ static PyMethodDef TaskType_methods[] = {
     _ASYNCIO_TASK_SET_NAME_METHODDEF
     _ASYNCIO_TASK_GET_CORO_METHODDEF
     _ASYNCIO_TASK_GET_CONTEXT_METHODDEF
+    _ASYNCIO_TASK_GET_STATS_METHODDEF
     {"__class_getitem__", Py_GenericAlias, METH_O|METH_CLASS, PyDoc_STR("See PEP 585")},
     {NULL, NULL}        /* Sentinel */
 };
@@ -3121,6 +3167,51 @@ task_step_handle_result_impl(asyncio_state *state, TaskObj *task, PyObject *resu
     return NULL;
 }
 
+static PyTime_t
+thread_time(asyncio_state *state)
+{
+    /* Return the CPU time of the current thread, or 0 if unavailable. */
+    if (state->time_thread_time_ns == NULL) {
+        return 0;
+    }
+    PyObject *exc = PyErr_GetRaisedException();
+    PyTime_t t = 0;
+    PyObject *res = PyObject_CallNoArgs(state->time_thread_time_ns);
+    if (res != NULL) {
+        t = PyLong_AsLongLong(res);
+        Py_DECREF(res);
+    }
+    if (PyErr_Occurred()) {
+        PyErr_Clear();
+        t = 0;
+    }
+    PyErr_SetRaisedException(exc);
+    return t;
+}
+
+static PyObject *
+task_step_run(asyncio_state *state, TaskObj *task, PyObject *exc)
+{
+    if (!task->task_accounting) {
+        return task_step_impl(state, task, exc);
+    }
+
+    PyTime_t start, end;
+    (void)PyTime_PerfCounterRaw(&start);
+    PyTime_t cpu_start = thread_time(state);
+    task->task_wait_time += start - task->task_suspended_at;
+
+    PyObject *res = task_step_impl(state, task, exc);
+
+    PyTime_t cpu_end = thread_time(state);
+    (void)PyTime_PerfCounterRaw(&end);
+    task->task_steps++;
+    task->task_cpu_time += cpu_end - cpu_start;
+    task->task_run_time += end - start;
+    task->task_suspended_at = end;
+    return res;
+}
+
 static PyObject *
 task_step(asyncio_state *state, TaskObj *task, PyObject *exc)
 {
@@ -3130,7 +3221,7 @@ task_step(asyncio_state *state, TaskObj *task, PyObject *exc)
         return NULL;
     }
 
-    res = task_step_impl(state, task, exc);
+    res = task_step_run(state, task, exc);
 
     if (res == NULL) {
         PyObject *exc = PyErr_GetRaisedException();
@@ -3170,7 +3261,7 @@ task_eager_start(asyncio_state *state, TaskObj *task)
 
     int retval = 0;
 
-    PyObject *stepres = task_step_impl(state, task, NULL);
+    PyObject *stepres = task_step_run(state, task, NULL);
     if (stepres == NULL) {
         PyObject *exc = PyErr_GetRaisedException();
         _PyErr_ChainExceptions1(exc);
@@ -3520,6 +3611,26 @@ _asyncio__swap_current_task_impl(PyObject *module, PyObject *loop,
 }
 
 
+/*[clinic input]
+_asyncio._set_task_accounting
+
+    enabled: bool
+    /
+
+Enable or disable the accounting of the steps of the tasks created next.
+
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__set_task_accounting_impl(PyObject *module, int enabled)
+/*[clinic end generated code: output=de90d9de91b9775b input=1908bdc3b73a09c5]*/
+{
+    asyncio_state *state = get_asyncio_state(module);
+    FT_ATOMIC_STORE_UINT8_RELAXED(state->task_accounting, enabled);
+    Py_RETURN_NONE;
+}
+
+
 /*[clinic input]
 _asyncio.current_task
 
@@ -3685,6 +3796,7 @@ module_traverse(PyObject *mod, visitproc visit, void *arg)
 
     Py_VISIT(state->asyncio_mod);
     Py_VISIT(state->traceback_extract_stack);
+    Py_VISIT(state->time_thread_time_ns);
     Py_VISIT(state->asyncio_future_repr_func);
     Py_VISIT(state->asyncio_get_event_loop_policy);
     Py_VISIT(state->asyncio_iscoroutine_func);
@@ -3716,6 +3828,7 @@ module_clear(PyObject *mod)
 
     Py_CLEAR(state->asyncio_mod);
     Py_CLEAR(state->traceback_extract_stack);
+    Py_CLEAR(state->time_thread_time_ns);
     Py_CLEAR(state->asyncio_future_repr_func);
     Py_CLEAR(state->asyncio_get_event_loop_policy);
     Py_CLEAR(state->asyncio_iscoroutine_func);
@@ -3801,6 +3914,12 @@ module_init(asyncio_state *state)
     WITH_MOD("traceback")
     GET_MOD_ATTR(state->traceback_extract_stack, "extract_stack")
 
+    WITH_MOD("time")
+    if (PyObject_GetOptionalAttrString(module, "thread_time_ns",
+                                       &state->time_thread_time_ns) < 0) {
+        goto fail;
+    }
+
     PyObject *weak_set;
     WITH_MOD("weakref")
     GET_MOD_ATTR(weak_set, "WeakSet");
@@ -3841,6 +3960,7 @@ static PyMethodDef asyncio_methods[] = {
     _ASYNCIO__ENTER_TASK_METHODDEF
     _ASYNCIO__LEAVE_TASK_METHODDEF
     _ASYNCIO__SWAP_CURRENT_TASK_METHODDEF
+    _ASYNCIO__SET_TASK_ACCOUNTING_METHODDEF
     _ASYNCIO_ALL_TASKS_METHODDEF
     {NULL, NULL}
 };
@@ -336,6 +336,72 @@ _queue_SimpleQueue_put_nowait_impl(simplequeueobject *self, PyObject *item)
     return _queue_SimpleQueue_put_impl(self, item, 0, Py_None);
 }
 
+/*[clinic input]
+@critical_section
+_queue.SimpleQueue.put_many
+    items: object
+    block: bool = True
+    timeout: object = None
+
+Put the items of an iterable on the queue, in order.
+
+The optional 'block' and 'timeout' arguments are ignored, as this method
+never blocks.  They are provided for compatibility with the Queue class.
+
+[clinic start generated code]*/
+
+static PyObject *
+_queue_SimpleQueue_put_many_impl(simplequeueobject *self, PyObject *items,
+                                 int block, PyObject *timeout)
+/*[clinic end generated code: output=266209210f316aaa input=82a64d110000f187]*/
+{
+    PyObject *seq = PySequence_Fast(items, "put_many() argument must be "
+                                           "an iterable");
+    if (seq == NULL) {
+        return NULL;
+    }
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(seq);
+    PyObject **src = PySequence_Fast_ITEMS(seq);
+    Py_ssize_t i = 0;
+
+    // Hand the first items off to the waiting threads, if any.
+    while (i < n && self->has_threads_waiting) {
+        HandoffData data = {
+            .handed_off = 0,
+            .item = Py_NewRef(src[i]),
+            .queue = self,
+        };
+        _PyParkingLot_Unpark(&self->has_threads_waiting,
+                             (_Py_unpark_fn_t *)maybe_handoff_item, &data);
+        if (!data.handed_off) {
+            Py_DECREF(data.item);
+            break;
+        }
+        i++;
+    }
+
+    // Grow the buffer at most once for the remaining items.
+    RingBuf *buf = &self->buf;
+    if (n - i > buf->items_cap - buf->num_items) {
+        Py_ssize_t capacity = buf->items_cap;
+        while (capacity < buf->num_items + n - i) {
+            capacity *= 2;
+        }
+        if (resize_ringbuf(buf, capacity) < 0) {
+            Py_DECREF(seq);
+            return PyErr_NoMemory();
+        }
+    }
+    for (; i < n; i++) {
+        if (RingBuf_Put(buf, Py_NewRef(src[i])) < 0) {
+            Py_DECREF(seq);
+            return NULL;
+        }
+    }
+    Py_DECREF(seq);
+    Py_RETURN_NONE;
+}
+
 static PyObject *
 empty_error(PyTypeObject *cls)
 {
@@ -444,6 +510,55 @@ _queue_SimpleQueue_get_impl(simplequeueobject *self, PyTypeObject *cls,
     }
 }
 
+/*[clinic input]
+@critical_section
+_queue.SimpleQueue.get_many
+
+    cls: defining_class
+    /
+    max_items: Py_ssize_t
+    block: bool = True
+    timeout as timeout_obj: object = None
+
+Remove and return a list of up to 'max_items' items from the queue.
+
+Wait for an item like get(), then remove all the available items up
+to 'max_items' at once.  The 'block' and 'timeout' arguments have the
+same meaning as for get().
+[clinic start generated code]*/
+
+static PyObject *
+_queue_SimpleQueue_get_many_impl(simplequeueobject *self, PyTypeObject *cls,
+                                 Py_ssize_t max_items, int block,
+                                 PyObject *timeout_obj)
+/*[clinic end generated code: output=5db4d0fe54081e21 input=c3083b3b01e2a5dd]*/
+{
+    if (max_items <= 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "'max_items' must be a positive integer");
+        return NULL;
+    }
+    PyObject *item = _queue_SimpleQueue_get_impl(self, cls, block,
+                                                 timeout_obj);
+    if (item == NULL) {
+        return NULL;
+    }
+    Py_ssize_t n = Py_MIN(max_items, 1 + RingBuf_Len(&self->buf));
+    PyObject *result = PyList_New(n);
+    if (result == NULL) {
+        // Do not lose the item.
+        if (RingBuf_Put(&self->buf, item) < 0) {
+            Py_DECREF(item);
+        }
+        return NULL;
+    }
+    PyList_SET_ITEM(result, 0, item);
+    for (Py_ssize_t i = 1; i < n; i++) {
+        PyList_SET_ITEM(result, i, RingBuf_Get(&self->buf));
+    }
+    return result;
+}
+
 /*[clinic input]
 @critical_section
 _queue.SimpleQueue.get_nowait
@@ -523,8 +638,10 @@ queue_free(void *m)
 static PyMethodDef simplequeue_methods[] = {
     _QUEUE_SIMPLEQUEUE_EMPTY_METHODDEF
     _QUEUE_SIMPLEQUEUE_GET_METHODDEF
+    _QUEUE_SIMPLEQUEUE_GET_MANY_METHODDEF
     _QUEUE_SIMPLEQUEUE_GET_NOWAIT_METHODDEF
     _QUEUE_SIMPLEQUEUE_PUT_METHODDEF
+    _QUEUE_SIMPLEQUEUE_PUT_MANY_METHODDEF
     _QUEUE_SIMPLEQUEUE_PUT_NOWAIT_METHODDEF
     _QUEUE_SIMPLEQUEUE_QSIZE_METHODDEF
     {"__class_getitem__",    Py_GenericAlias,
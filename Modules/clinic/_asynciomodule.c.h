@@ -898,6 +898,27 @@ _asyncio_Task_get_coro(TaskObj *self, PyObject *Py_UNUSED(ignored))
     return _asyncio_Task_get_coro_impl(self);
 }
 
+PyDoc_STRVAR(_asyncio_Task_get_stats__doc__,
+"get_stats($self, /)\n"
+"--\n"
+"\n"
+"Return the accounting of the steps of the task, or None.\n"
+"\n"
+"The dict has the number of steps, the cpu_time and run_time spent\n"
+"running them, and the wait_time spent between them, in seconds.");
+
+#define _ASYNCIO_TASK_GET_STATS_METHODDEF    \
+    {"get_stats", (PyCFunction)_asyncio_Task_get_stats, METH_NOARGS, _asyncio_Task_get_stats__doc__},
+
+static PyObject *
+_asyncio_Task_get_stats_impl(TaskObj *self);
+
+static PyObject *
+_asyncio_Task_get_stats(TaskObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_Task_get_stats_impl(self);
+}
+
 PyDoc_STRVAR(_asyncio_Task_get_context__doc__,
 "get_context($self, /)\n"
 "--\n"
@@ -1428,6 +1449,34 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(_asyncio__set_task_accounting__doc__,
+"_set_task_accounting($module, enabled, /)\n"
+"--\n"
+"\n"
+"Enable or disable the accounting of the steps of the tasks created next.");
+
+#define _ASYNCIO__SET_TASK_ACCOUNTING_METHODDEF    \
+    {"_set_task_accounting", (PyCFunction)_asyncio__set_task_accounting, METH_O, _asyncio__set_task_accounting__doc__},
+
+static PyObject *
+_asyncio__set_task_accounting_impl(PyObject *module, int enabled);
+
+static PyObject *
+_asyncio__set_task_accounting(PyObject *module, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    int enabled;
+
+    enabled = PyObject_IsTrue(arg);
+    if (enabled < 0) {
+        goto exit;
+    }
+    return_value = _asyncio__set_task_accounting_impl(module, enabled);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(_asyncio_current_task__doc__,
 "current_task($module, /, loop=None)\n"
 "--\n"
@@ -1547,4 +1596,4 @@ skip_optional_pos:
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=ffe9b71bc65888b3 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=79acab0478aafafc input=a9049054013a1b77]*/
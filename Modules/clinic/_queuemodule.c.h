@@ -6,6 +6,7 @@ preserve
 #  include "pycore_gc.h"          // PyGC_Head
 #  include "pycore_runtime.h"     // _Py_ID()
 #endif
+#include "pycore_abstract.h"      // _PyNumber_Index()
 #include "pycore_critical_section.h"// Py_BEGIN_CRITICAL_SECTION()
 #include "pycore_modsupport.h"    // _PyArg_NoKeywords()
 
@@ -176,6 +177,84 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(_queue_SimpleQueue_put_many__doc__,
+"put_many($self, /, items, block=True, timeout=None)\n"
+"--\n"
+"\n"
+"Put the items of an iterable on the queue, in order.\n"
+"\n"
+"The optional \'block\' and \'timeout\' arguments are ignored, as this method\n"
+"never blocks.  They are provided for compatibility with the Queue class.");
+
+#define _QUEUE_SIMPLEQUEUE_PUT_MANY_METHODDEF    \
+    {"put_many", _PyCFunction_CAST(_queue_SimpleQueue_put_many), METH_FASTCALL|METH_KEYWORDS, _queue_SimpleQueue_put_many__doc__},
+
+static PyObject *
+_queue_SimpleQueue_put_many_impl(simplequeueobject *self, PyObject *items,
+                                 int block, PyObject *timeout);
+
+static PyObject *
+_queue_SimpleQueue_put_many(simplequeueobject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(items), &_Py_ID(block), &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"items", "block", "timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "put_many",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *items;
+    int block = 1;
+    PyObject *timeout = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 3, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    items = args[0];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[1]) {
+        block = PyObject_IsTrue(args[1]);
+        if (block < 0) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    timeout = args[2];
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _queue_SimpleQueue_put_many_impl(self, items, block, timeout);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(_queue_SimpleQueue_get__doc__,
 "get($self, /, block=True, timeout=None)\n"
 "--\n"
@@ -257,6 +336,97 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(_queue_SimpleQueue_get_many__doc__,
+"get_many($self, /, max_items, block=True, timeout=None)\n"
+"--\n"
+"\n"
+"Remove and return a list of up to \'max_items\' items from the queue.\n"
+"\n"
+"Wait for an item like get(), then remove all the available items up\n"
+"to \'max_items\' at once.  The \'block\' and \'timeout\' arguments have the\n"
+"same meaning as for get().");
+
+#define _QUEUE_SIMPLEQUEUE_GET_MANY_METHODDEF    \
+    {"get_many", _PyCFunction_CAST(_queue_SimpleQueue_get_many), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, _queue_SimpleQueue_get_many__doc__},
+
+static PyObject *
+_queue_SimpleQueue_get_many_impl(simplequeueobject *self, PyTypeObject *cls,
+                                 Py_ssize_t max_items, int block,
+                                 PyObject *timeout_obj);
+
+static PyObject *
+_queue_SimpleQueue_get_many(simplequeueobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(max_items), &_Py_ID(block), &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"max_items", "block", "timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "get_many",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    Py_ssize_t max_items;
+    int block = 1;
+    PyObject *timeout_obj = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 3, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[0]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        max_items = ival;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[1]) {
+        block = PyObject_IsTrue(args[1]);
+        if (block < 0) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    timeout_obj = args[2];
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _queue_SimpleQueue_get_many_impl(self, cls, max_items, block, timeout_obj);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(_queue_SimpleQueue_get_nowait__doc__,
 "get_nowait($self, /)\n"
 "--\n"
@@ -349,4 +519,4 @@ _queue_SimpleQueue_qsize(simplequeueobject *self, PyObject *Py_UNUSED(ignored))
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=44a718f40072018a input=a9049054013a1b77]*/
+/*[clinic end generated code: output=019c39508ae285c0 input=a9049054013a1b77]*/
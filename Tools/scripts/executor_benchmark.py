@@ -0,0 +1,135 @@
+# Measure how the throughput of concurrent.futures executors scales with the
+# number of workers when running many short calls.
+#
+# Usage: python Tools/scripts/executor_benchmark.py [--tasks N] [--max-workers N]
+#                                                   [--executor NAME ...]
+#
+# How to interpret the results:
+#
+# Each line reports the number of calls completed per second, in thousands,
+# for a given executor configuration and number of workers.  Two workloads
+# are run:
+#
+# * "flat": the main thread submits every call and then waits for them.
+# * "nested": each call submitted by the main thread submits a few more
+#   calls from inside the worker, as recursive or pipelined code does.
+#   Only thread pools run it, the executor cannot be sent to other
+#   interpreters or processes.
+#
+# With the GIL enabled, the calls of a thread pool cannot run in parallel
+# and the numbers mostly reflect the per-call overhead of each scheduler.
+# On a --disable-gil build, they show how each scheduler scales with the
+# number of workers.
+#
+# InterpreterPoolExecutor and ProcessPoolExecutor run the calls in parallel
+# on any build, but pay for sending each call and its result to another
+# interpreter or process.  Increase --work to see from which amount of work
+# per call they beat a thread pool.
+
+import argparse
+import concurrent.futures
+import os
+import time
+
+
+def work(n):
+    # A sub-microsecond to a few microseconds of pure Python work.
+    total = 0
+    for i in range(n):
+        total += i
+    return total
+
+
+def nested(executor, fanout, n):
+    # Waiting for the inner calls here could deadlock a small pool.
+    return [executor.submit(work, n) for _ in range(fanout)]
+
+
+def run_flat(executor, tasks, n):
+    fs = [executor.submit(work, n) for _ in range(tasks)]
+    for f in fs:
+        f.result()
+
+
+def run_nested(executor, tasks, n, fanout=4):
+    fs = [executor.submit(nested, executor, fanout, n)
+          for _ in range(tasks // (fanout + 1))]
+    for f in fs:
+        for inner in f.result():
+            inner.result()
+
+
+def _executor(name, **kwargs):
+    cls = getattr(concurrent.futures, name)
+    return lambda workers: cls(workers, **kwargs)
+
+
+CONFIGS = {
+    "ThreadPoolExecutor": _executor("ThreadPoolExecutor"),
+    "ThreadPoolExecutor(work_stealing=True)":
+        _executor("ThreadPoolExecutor", work_stealing=True),
+    "ProcessPoolExecutor": _executor("ProcessPoolExecutor"),
+}
+if "InterpreterPoolExecutor" in concurrent.futures.__all__:
+    # Let the worker interpreters import this module to find work().
+    CONFIGS["InterpreterPoolExecutor"] = _executor(
+        "InterpreterPoolExecutor", initializer=exec,
+        initargs=("import sys; sys.path.insert(0, %r)"
+                  % os.path.dirname(os.path.abspath(__file__)),))
+
+# The workloads which need to share the executor with the workers.
+THREAD_ONLY_WORKLOADS = {"nested"}
+
+WORKLOADS = {
+    "flat": run_flat,
+    "nested": run_nested,
+}
+
+
+def worker_counts(max_workers):
+    n = 1
+    while n < max_workers:
+        yield n
+        n *= 2
+    yield max_workers
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the scaling of concurrent.futures executors.")
+    parser.add_argument("--tasks", type=int, default=100_000,
+                        help="number of calls per measurement")
+    parser.add_argument("--max-workers", type=int, default=16,
+                        help="largest number of workers to try")
+    parser.add_argument("--work", type=int, default=10,
+                        help="loop iterations done by each call")
+    parser.add_argument("--executor", action="append", choices=CONFIGS,
+                        help="executor configuration to measure "
+                             "(default: all of them)")
+    args = parser.parse_args()
+    configs = args.executor or list(CONFIGS)
+
+    print(f"{'Executor':<42}{'Workload':<10}{'Workers':>8}"
+          f"{'Calls (kHz)':>14}")
+    for workload, run in WORKLOADS.items():
+        for name in configs:
+            if (workload in THREAD_ONLY_WORKLOADS
+                    and not name.startswith("ThreadPoolExecutor")):
+                continue
+            for workers in worker_counts(args.max_workers):
+                executor = CONFIGS[name](workers)
+                with executor:
+                    # Start the worker threads before timing.
+                    run(executor, workers * 10, args.work)
+                    start = time.perf_counter()
+                    run(executor, args.tasks, args.work)
+                    elapsed = time.perf_counter() - start
+                rate = args.tasks / elapsed / 1000
+                print(f"{name:<42}{workload:<10}{workers:>8}{rate:>14.1f}")
+
+
+if __name__ == "__main__":
+    # Run the module imported under its own name, so that work() can be
+    # pickled by reference for other interpreters and processes.
+    import executor_benchmark
+    executor_benchmark.main()
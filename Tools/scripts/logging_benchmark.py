@@ -0,0 +1,114 @@
+# Measure the cost of a logging call which is emitted, from the creation of
+# the LogRecord to the formatted line, with and without lean records.
+#
+# Usage: python Tools/scripts/logging_benchmark.py [--records N] [--repeat N]
+#
+# How to interpret the results:
+#
+# Each line reports the time spent per logging call, in nanoseconds, for a
+# handler using the given format.  The handler writes to a stream which
+# discards the data, so that only the cost of the logging module is
+# measured.
+#
+# The "uncached" column formats the time with time.strftime() for every
+# record, like Formatter.formatTime() did before it cached the formatted
+# time for the current second.  The "cached" column uses the cache, and the
+# "lean" column also sets logging.leanRecords to True, so that the caller,
+# thread, process and task information is only collected when the format
+# uses it.  Formats which use the caller information still walk the stack
+# in lean mode, so the gain is smaller for them.
+
+import argparse
+import logging
+import time
+
+
+FORMATS = {
+    "basic": logging.BASIC_FORMAT,
+    "asctime": "%(asctime)s %(levelname)s %(name)s: %(message)s",
+    "caller": "%(asctime)s %(levelname)s %(filename)s:%(lineno)d %(message)s",
+    "str.format": "{asctime} {levelname} {name}: {message}",
+    "everything": "%(asctime)s %(levelname)s %(name)s %(pathname)s:%(lineno)d "
+                  "%(funcName)s %(threadName)s %(processName)s %(process)d "
+                  "%(message)s",
+}
+
+
+class NullStream:
+    def write(self, data):
+        pass
+
+    def flush(self):
+        pass
+
+
+class UncachedFormatter(logging.Formatter):
+    # Disable the cache of formatTime().
+    @property
+    def _time_cache(self):
+        return None
+
+    @_time_cache.setter
+    def _time_cache(self, value):
+        pass
+
+
+def make_logger(name, fmt, formatter_class):
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    handler = logging.StreamHandler(NullStream())
+    style = "{" if fmt.startswith("{") else "%"
+    handler.setFormatter(formatter_class(fmt, style=style))
+    logger.addHandler(handler)
+    return logger
+
+
+def bench(logger, lean, records):
+    logging.leanRecords = lean
+    try:
+        start = time.perf_counter()
+        for i in range(records):
+            logger.info("record %d", i)
+        return time.perf_counter() - start
+    finally:
+        logging.leanRecords = False
+
+
+def measure(fmt, records, repeat):
+    variants = [
+        (make_logger("uncached", fmt, UncachedFormatter), False),
+        (make_logger("cached", fmt, logging.Formatter), False),
+        (make_logger("lean", fmt, logging.Formatter), True),
+    ]
+    best = [float("inf")] * len(variants)
+    # Interleave the variants, so that they are equally affected by the
+    # changes of the speed of the machine.
+    for _ in range(repeat):
+        for i, (logger, lean) in enumerate(variants):
+            best[i] = min(best[i], bench(logger, lean, records))
+    for logger, lean in variants:
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+    return [t / records * 1e9 for t in best]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the per-record cost of logging calls.")
+    parser.add_argument("--records", type=int, default=10_000,
+                        help="number of logging calls per measurement")
+    parser.add_argument("--repeat", type=int, default=20,
+                        help="number of measurements, the best one is kept")
+    args = parser.parse_args()
+
+    print(f"{'Format':<12}{'uncached':>10}{'cached':>10}{'lean':>10}"
+          f"{'speedup':>10}")
+    for name, fmt in FORMATS.items():
+        uncached, cached, lean = measure(fmt, args.records, args.repeat)
+        print(f"{name:<12}{uncached:>10.0f}{cached:>10.0f}{lean:>10.0f}"
+              f"{uncached / lean:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
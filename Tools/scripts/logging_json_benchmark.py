@@ -0,0 +1,87 @@
+# Measure the cost of formatting a record as JSON with logging.JSONFormatter,
+# compared with a text logging.Formatter and with the usual hand-written
+# formatter which serializes the whole attribute dictionary of the record.
+#
+# Usage: python Tools/scripts/logging_json_benchmark.py [--records N] [--repeat N]
+#
+# How to interpret the results:
+#
+# Each line reports the time spent per call to format(), in nanoseconds, for
+# records with the given number of attributes passed with the extra argument
+# of the logging methods.  The records are created before the measurement,
+# so that only the cost of the formatting is measured.
+#
+# The "text" column uses a Formatter with a format equivalent to the fields
+# of the JSON formatters, it is the baseline.  The "dumps" column uses a
+# Formatter subclass which returns json.dumps(record.__dict__), which copies
+# and serializes every attribute of the record.  The "json" column uses
+# JSONFormatter with the same fields as the text format, and the extras.
+# The "speedup" column compares "dumps" with "json".
+
+import argparse
+import json
+import logging
+import time
+
+
+FIELDS = ["asctime", "levelname", "name", "message"]
+TEXT_FORMAT = " ".join(f"%({name})s" for name in FIELDS)
+
+
+class DumpsFormatter(logging.Formatter):
+    def format(self, record):
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        return json.dumps(record.__dict__, default=str)
+
+
+def make_records(extras, records):
+    logger = logging.getLogger("bench")
+    extra = {f"extra{i}": i for i in range(extras)}
+    return [logger.makeRecord("bench", logging.INFO, __file__, 1,
+                              "record %d", (i,), None, extra=extra)
+            for i in range(records)]
+
+
+def bench(formatter, records):
+    start = time.perf_counter()
+    for record in records:
+        formatter.format(record)
+    return time.perf_counter() - start
+
+
+def measure(extras, records, repeat):
+    records = make_records(extras, records)
+    formatters = [
+        logging.Formatter(TEXT_FORMAT),
+        DumpsFormatter(),
+        logging.JSONFormatter(FIELDS),
+    ]
+    best = [float("inf")] * len(formatters)
+    # Interleave the formatters, so that they are equally affected by the
+    # changes of the speed of the machine.
+    for _ in range(repeat):
+        for i, formatter in enumerate(formatters):
+            best[i] = min(best[i], bench(formatter, records))
+    return [t / len(records) * 1e9 for t in best]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the per-record cost of formatting records "
+                    "as JSON.")
+    parser.add_argument("--records", type=int, default=10_000,
+                        help="number of records per measurement")
+    parser.add_argument("--repeat", type=int, default=20,
+                        help="number of measurements, the best one is kept")
+    args = parser.parse_args()
+
+    print(f"{'Extras':<8}{'text':>10}{'dumps':>10}{'json':>10}{'speedup':>10}")
+    for extras in (0, 2, 8):
+        text, dumps, fast = measure(extras, args.records, args.repeat)
+        print(f"{extras:<8}{text:>10.0f}{dumps:>10.0f}{fast:>10.0f}"
+              f"{dumps / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# Compare moving items through queues one at a time with the batch
+# put_many() and get_many() methods.
+#
+# Usage: python Tools/scripts/queue_benchmark.py [--items N] [--batch N]
+#
+# How to interpret the results:
+#
+# Each line reports the time spent per item, in nanoseconds, to put a
+# number of items into a queue and to get them back, for one queue type.
+# The "loop" column calls put() and get() once per item; the "many" column
+# calls put_many() and get_many() with batches of --batch items.
+#
+# The queue.Queue variants take their lock once per call, and asyncio.Queue
+# wakes up a waiting task once per call, so the gap between both columns is
+# the per-call overhead saved by batching.  The "1 thread" workload puts and
+# gets all the items from the main thread, the "2 threads" workload moves
+# them from a producer thread to the main thread, which also shows how much
+# less often the consumer has to be woken up.  The "tasks" workload moves
+# them between two tasks through a queue of --batch items at most.
+
+import argparse
+import asyncio
+import queue
+import threading
+import time
+
+
+SYNC_QUEUES = {
+    "queue.Queue": queue.Queue,
+    "queue.LifoQueue": queue.LifoQueue,
+    "queue.PriorityQueue": queue.PriorityQueue,
+    "queue.SimpleQueue": queue.SimpleQueue,
+}
+
+ASYNC_QUEUES = {
+    "asyncio.Queue": asyncio.Queue,
+    "asyncio.LifoQueue": asyncio.LifoQueue,
+    "asyncio.PriorityQueue": asyncio.PriorityQueue,
+}
+
+
+def batches(items, size):
+    return [items[i:i+size] for i in range(0, len(items), size)]
+
+
+def sync_loop(q, items, batch):
+    for item in items:
+        q.put(item)
+    for _ in items:
+        q.get()
+
+
+def sync_many(q, items, batch):
+    for chunk in batches(items, batch):
+        q.put_many(chunk)
+    n = 0
+    while n < len(items):
+        n += len(q.get_many(batch))
+
+
+def threaded(q, items, batch, produce, consume):
+    producer = threading.Thread(target=produce, args=(q, items, batch))
+    producer.start()
+    consume(q, len(items), batch)
+    producer.join()
+
+
+def produce_loop(q, items, batch):
+    for item in items:
+        q.put(item)
+
+
+def consume_loop(q, n, batch):
+    for _ in range(n):
+        q.get()
+
+
+def produce_many(q, items, batch):
+    for chunk in batches(items, batch):
+        q.put_many(chunk)
+
+
+def consume_many(q, n, batch):
+    while n > 0:
+        n -= len(q.get_many(batch))
+
+
+async def async_loop(q, items, batch):
+    async def produce():
+        for item in items:
+            await q.put(item)
+    producer = asyncio.create_task(produce())
+    for _ in items:
+        await q.get()
+    await producer
+
+
+async def async_many(q, items, batch):
+    async def produce():
+        for chunk in batches(items, batch):
+            await q.put_many(chunk)
+    producer = asyncio.create_task(produce())
+    n = 0
+    while n < len(items):
+        n += len(await q.get_many(batch))
+    await producer
+
+
+def timeit(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare per-item and batch queue operations.")
+    parser.add_argument("--items", type=int, default=100_000,
+                        help="number of items moved per measurement")
+    parser.add_argument("--batch", type=int, default=64,
+                        help="number of items per put_many()/get_many() call")
+    args = parser.parse_args()
+    items = list(range(args.items))
+    batch = args.batch
+
+    def report(name, workload, loop, many):
+        per_item = 1e9 / len(items)
+        print(f"{name:<22}{workload:<12}{loop * per_item:>10.0f}"
+              f"{many * per_item:>10.0f}{loop / many:>9.1f}x")
+
+    print(f"{'Queue':<22}{'Workload':<12}{'loop':>10}{'many':>10}"
+          f"{'speedup':>10}")
+    for name, cls in SYNC_QUEUES.items():
+        loop = timeit(lambda: sync_loop(cls(), items, batch))
+        many = timeit(lambda: sync_many(cls(), items, batch))
+        report(name, "1 thread", loop, many)
+        loop = timeit(lambda: threaded(cls(), items, batch,
+                                       produce_loop, consume_loop))
+        many = timeit(lambda: threaded(cls(), items, batch,
+                                       produce_many, consume_many))
+        report(name, "2 threads", loop, many)
+    for name, cls in ASYNC_QUEUES.items():
+        # A bounded queue, so that the producer and the consumer alternate.
+        loop = timeit(lambda: asyncio.run(async_loop(cls(batch), items,
+                                                     batch)))
+        many = timeit(lambda: asyncio.run(async_many(cls(batch), items,
+                                                     batch)))
+        report(name, "tasks", loop, many)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# Measure the throughput of asyncio streams reading messages of various
+# sizes from a socket.
+#
+# Usage: python Tools/scripts/streams_benchmark.py [--total N] [--size N ...]
+#
+# How to interpret the results:
+#
+# Each line reports the throughput, in MiB per second, of a task reading
+# messages of a given size with a StreamReader while another task writes
+# them to the other end of a socket pair.  Three readers are compared:
+#
+# * "data_received": readexactly(), with the StreamReader fed by a protocol
+#   which only implements data_received(), as the transports which do not
+#   support the buffered protocol do.  Every chunk received is allocated as
+#   a bytes object and copied to the internal buffer of the StreamReader.
+# * "readexactly": readexactly(), with the StreamReaderProtocol used by
+#   open_connection().  The transport reads into a buffer provided by the
+#   protocol, and directly into the returned data for large messages.
+# * "readinto": readinto() into a preallocated buffer, which the transport
+#   reads into directly when the StreamReader has no buffered data.
+#
+# The gap between the first two columns grows with the size of the messages,
+# as large messages save more copies and allocations.  Both ends of the
+# socket run in the same event loop, so the numbers also include the cost of
+# writing the messages.
+
+import argparse
+import asyncio
+import socket
+import time
+
+
+class DataReceivedProtocol(asyncio.Protocol):
+    def __init__(self, reader):
+        self._reader = reader
+
+    def connection_made(self, transport):
+        self._reader.set_transport(transport)
+
+    def data_received(self, data):
+        self._reader.feed_data(data)
+
+    def eof_received(self):
+        self._reader.feed_eof()
+
+    def connection_lost(self, exc):
+        if not self._reader.at_eof():
+            self._reader.feed_eof()
+
+
+async def open_reader(sock, kind):
+    loop = asyncio.get_running_loop()
+    if kind == "data_received":
+        reader = asyncio.StreamReader()
+        transport, _ = await loop.create_connection(
+            lambda: DataReceivedProtocol(reader), sock=sock)
+        return reader, transport
+    # Return the StreamWriter, which closes the transport once collected.
+    return await asyncio.open_connection(sock=sock)
+
+
+async def read_exactly(reader, size, count):
+    for _ in range(count):
+        await reader.readexactly(size)
+
+
+async def read_into(reader, size, count):
+    buf = memoryview(bytearray(size))
+    for _ in range(count):
+        pos = 0
+        while pos < size:
+            nbytes = await reader.readinto(buf[pos:])
+            if not nbytes:
+                raise EOFError
+            pos += nbytes
+
+
+async def write(writer, message, count):
+    for _ in range(count):
+        writer.write(message)
+        await writer.drain()
+
+
+async def run(kind, size, count):
+    rsock, wsock = socket.socketpair()
+    # reader_end is the transport or the StreamWriter of the reader.
+    reader, reader_end = await open_reader(rsock, kind)
+    _, writer = await asyncio.open_connection(sock=wsock)
+    read = read_into if kind == "readinto" else read_exactly
+    message = b"x" * size
+    writer_task = asyncio.create_task(write(writer, message, count))
+    start = time.perf_counter()
+    await read(reader, size, count)
+    elapsed = time.perf_counter() - start
+    await writer_task
+    writer.close()
+    reader_end.close()
+    await writer.wait_closed()
+    return elapsed
+
+
+KINDS = ["data_received", "readexactly", "readinto"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the throughput of asyncio streams.")
+    parser.add_argument("--total", type=int, default=256,
+                        help="MiB read per measurement")
+    parser.add_argument("--size", type=int, action="append",
+                        help="size of the messages in bytes "
+                             "(default: 1 KiB to 16 MiB)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of measurements, the best one is kept")
+    args = parser.parse_args()
+    sizes = args.size or [1024, 64 * 1024, 1024 * 1024, 16 * 1024 * 1024]
+
+    print(f"{'Message size':>12}" + "".join(f"{kind:>15}" for kind in KINDS))
+    for size in sizes:
+        count = max(1, args.total * 1024 * 1024 // size)
+        results = []
+        for kind in KINDS:
+            best = min(asyncio.run(run(kind, size, count))
+                       for _ in range(args.repeat))
+            results.append(count * size / best / 1024 / 1024)
+        print(f"{size:>12}" + "".join(f"{rate:>15.0f}" for rate in results))
+
+
+if __name__ == "__main__":
+    main()
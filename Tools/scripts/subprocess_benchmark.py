@@ -0,0 +1,112 @@
+# Measure the throughput of asyncio at collecting the output of child
+# processes.
+#
+# Usage: python Tools/scripts/subprocess_benchmark.py [--size N] [--procs N]
+#
+# How to interpret the results:
+#
+# Each line reports the throughput, in MiB per second, of an event loop
+# collecting the output of --procs child processes running at the same
+# time, each writing --size MiB to its standard output.  Three ways of
+# collecting the output into a file are compared:
+#
+# * "communicate": Process.communicate(), which reads the whole output in
+#   memory through the StreamReader of the process, then writes it.
+# * "read": a loop reading 64 KiB chunks from Process.stdout and writing
+#   them to the file.
+# * "splice": Process.splice_stdout(), which moves the data from the pipe
+#   to the file with os.splice() where available, without passing it
+#   through Python objects.
+#
+# The children write a preallocated buffer in a loop, so the figures
+# mostly measure the cost of the parent process.  The output files are
+# written to /dev/null by default, use --output to write real files in a
+# directory instead.
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+
+CHILD = """\
+import sys
+block = bytes(1024 * 1024)
+write = sys.stdout.buffer.write
+for _ in range({size}):
+    write(block)
+"""
+
+
+async def spawn(size):
+    return await asyncio.create_subprocess_exec(
+        sys.executable, "-c", CHILD.format(size=size),
+        stdout=asyncio.subprocess.PIPE)
+
+
+async def collect_communicate(proc, file):
+    stdout, _ = await proc.communicate()
+    file.write(stdout)
+
+
+async def collect_read(proc, file):
+    while chunk := await proc.stdout.read(64 * 1024):
+        file.write(chunk)
+    await proc.wait()
+
+
+async def collect_splice(proc, file):
+    await proc.splice_stdout(file)
+    await proc.wait()
+
+
+KINDS = {
+    "communicate": collect_communicate,
+    "read": collect_read,
+    "splice": collect_splice,
+}
+
+
+async def run(collect, size, procs, output):
+    files = []
+    for i in range(procs):
+        path = os.path.join(output, f"out{i}") if output else os.devnull
+        files.append(open(path, "wb", buffering=0))
+    try:
+        start = time.perf_counter()
+        children = await asyncio.gather(*(spawn(size) for _ in range(procs)))
+        await asyncio.gather(*(collect(proc, file)
+                               for proc, file in zip(children, files)))
+        return time.perf_counter() - start
+    finally:
+        for file in files:
+            file.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the throughput of asyncio subprocess output.")
+    parser.add_argument("--size", type=int, default=256,
+                        help="MiB written by each child process")
+    parser.add_argument("--procs", type=int, action="append",
+                        help="number of child processes (default: 1 and 8)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of measurements, the best one is kept")
+    parser.add_argument("--output", metavar="DIR",
+                        help="directory of the output files "
+                             "(default: /dev/null)")
+    args = parser.parse_args()
+
+    print(f"{'Processes':>10}" + "".join(f"{kind:>14}" for kind in KINDS))
+    for procs in args.procs or [1, 8]:
+        rates = []
+        for collect in KINDS.values():
+            best = min(asyncio.run(run(collect, args.size, procs, args.output))
+                       for _ in range(args.repeat))
+            rates.append(args.size * procs / best)
+        print(f"{procs:>10}" + "".join(f"{rate:>14.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()